@@ -1,9 +1,14 @@
-from flask import Flask, render_template, request, jsonify, send_file
-from src.audioldm_engine import AudioLDMEngine
+from flask import Flask, Response, render_template, request, jsonify, send_file
 import os
+import sys
 import threading
 import time
 
+# Engine modules import each other (and the metrics registry) by bare name
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+from src.audioldm_engine import AudioLDMEngine
+from metrics import metrics
+
 app = Flask(__name__)
 audio_engine = None
 generation_status = {"status": "idle", "progress": 0, "message": ""}
@@ -87,6 +92,11 @@ def generate_scene():
 def get_status():
     return jsonify(generation_status)
 
+@app.route('/metrics')
+def get_metrics():
+    # Prometheus text exposition format
+    return Response(metrics.prometheus(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/download/<path:filename>')
 def download_file(filename):
     try:
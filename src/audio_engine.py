@@ -1,6 +1,17 @@
 import pygame
+import io
 import os
 
+import numpy as np
+import soundfile as sf
+
+from loudness import lookup, playback_gain
+from metrics import metrics
+from sound_pack import open_pack, split_member_path
+from structured_logging import get_logger
+
+logger = get_logger("audio_engine")
+
 
 class AudioEngine:
     """Handles loading and playback of audio files using pygame."""
@@ -11,39 +22,123 @@ class AudioEngine:
         pygame.init() # pygame.mixer.init() is called by pygame.init()
         pygame.mixer.set_num_channels(num_channels)
         self.sound_cache = {}
+        # Loudness-normalizing gain per sound, read from the generators' loudness index at load
+        self.sound_gain = {}
+
+    def _load_pack_member(self, pack_path, name):
+        """Builds a Sound straight from a member of a memory-mapped sound pack."""
+        frames, sample_rate = open_pack(pack_path).read_pcm16(name)
+        frequency, size, channels = pygame.mixer.get_init()
+
+        if sample_rate != frequency or size != -16:
+            # Let the mixer convert, as it does for files on disk
+            buffer = io.BytesIO()
+            sf.write(buffer, frames, sample_rate, format="WAV", subtype="PCM_16")
+            buffer.seek(0)
+            return pygame.mixer.Sound(file=buffer)
+
+        if frames.shape[1] != channels:
+            frames = np.repeat(frames[:, :1], channels, axis=1) if frames.shape[1] == 1 else frames[:, :channels]
+        return pygame.mixer.Sound(buffer=np.ascontiguousarray(frames))
 
-    def play_sound(self, filepath, loop=False, volume=1.0):
-        """Loads and plays a sound on the first available channel."""
+    def load_sound(self, filepath):
+        """
+        Loads a sound into the cache without playing it.
+        filepath may also be a sound pack member ("pack.bfpack#member"),
+        which is decoded lazily from the mapped pack.
+        """
         abs_path = os.path.abspath(filepath)
-        
+
         # Check cache first
         sound = self.sound_cache.get(abs_path)
         if sound is None:
+            metrics.inc("playback_cache_misses_total")
+            member = split_member_path(abs_path)
             try:
-                sound = pygame.mixer.Sound(abs_path)
+                with metrics.timer("playback_load_seconds"):
+                    sound = self._load_pack_member(*member) if member else pygame.mixer.Sound(abs_path)
                 self.sound_cache[abs_path] = sound
-            except pygame.error as e:
-                print(f"Error loading sound {filepath}: {e}")
+                self.sound_gain[abs_path] = playback_gain(lookup(abs_path))
+            except (pygame.error, KeyError, OSError, ValueError) as e:
+                metrics.inc("playback_errors_total")
+                logger.error("Error loading sound %s: %s", filepath, e, extra={"file": filepath})
                 return None
+        else:
+            metrics.inc("playback_cache_hits_total")
+        return sound
+
+    def play_sound(self, filepath, loop=False, volume=1.0, stereo_volume=None):
+        """
+        Loads and plays a sound on the first available channel.
+        volume is relative to the sound's loudness-normalized level.
+        stereo_volume is an optional (left, right) channel gain pair for panning.
+        """
+        sound = self.load_sound(filepath)
+        if sound is None:
+            return None
 
         try:
-            sound.set_volume(volume)
+            sound.set_volume(volume * self.sound_gain.get(os.path.abspath(filepath), 1.0))
 
             channel = pygame.mixer.find_channel(True) # Pass True to force find
             if channel is None:
-                print(f"Warning: No free channels to play sound {filepath}")
+                metrics.inc("playback_no_channel_total")
+                logger.warning("Warning: No free channels to play sound %s", filepath, extra={"file": filepath})
                 return None
             loops = -1 if loop else 0
             channel.play(sound, loops=loops)
+            # play() keeps the channel's previous gain and panning (a crossfade's last
+            # step, an earlier oneshot's placement), so always set both
+            if stereo_volume is not None:
+                left, right = stereo_volume
+                channel.set_volume(max(0.0, min(1.0, left)), max(0.0, min(1.0, right)))
+            else:
+                channel.set_volume(1.0)
+            metrics.inc("playback_started_total")
             return channel
         except pygame.error as e:
-            print(f"Error playing sound {filepath}: {e}")
+            metrics.inc("playback_errors_total")
+            logger.error("Error playing sound %s: %s", filepath, e, extra={"file": filepath})
             return None
 
+    def set_channel_volume(self, channel, volume):
+        """Sets the volume of a single playing channel (used for crossfades)."""
+        if channel is None:
+            return
+        try:
+            channel.set_volume(max(0.0, min(1.0, volume)))
+        except pygame.error as e:
+            logger.error("Error setting channel volume: %s", e)
+
+    def stop_channel(self, channel):
+        """Stops a single channel, leaving everything else playing."""
+        if channel is None:
+            return
+        try:
+            channel.stop()
+        except pygame.error as e:
+            logger.error("Error stopping channel: %s", e)
+
+    def channel_sound(self, channel):
+        """The Sound a channel is playing (None when idle), to tell whether the channel was reused."""
+        if channel is None:
+            return None
+        try:
+            return channel.get_sound()
+        except pygame.error as e:
+            logger.error("Error reading channel: %s", e)
+            return None
+
+    def release_sound(self, filepath):
+        """Drops a decoded sound from the cache so its memory can be reclaimed."""
+        abs_path = os.path.abspath(filepath)
+        self.sound_cache.pop(abs_path, None)
+        self.sound_gain.pop(abs_path, None)
+
     def stop_all_sounds(self):
         """Stops all currently playing sounds."""
         pygame.mixer.stop()
 
     def quit(self):
         """Quits the pygame mixer."""
-        pygame.mixer.quit()
\ No newline at end of file
+        pygame.mixer.quit()
@@ -1,14 +1,19 @@
-import torch
 import numpy as np
-import soundfile as sf
-import librosa
 import os
-import hashlib
-import tempfile
-from typing import Optional, Dict, List
-from diffusers import StableDiffusionPipeline
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from synthesis_tables import get_synthesis_tables
+from granular import GranularRenderer
+from colored_noise import ColoredNoise
+from cache_keys import quantize_duration, synthesis_key, write_cache_file
+from loudness import analyze, get_index
+from metrics import metrics
+from structured_logging import get_logger
+from typing import Optional, Dict, List, Tuple
 import time
 
+logger = get_logger("audio_generator")
+
 
 class AudioGenerator:
     """
@@ -17,15 +22,13 @@ class AudioGenerator:
     """
     
     def __init__(self, cache_dir: str = "./generated_audio_cache"):
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        # Synthesis is NumPy only; probing for a GPU would import torch for nothing
+        self.device = "cpu"
         self.cache_dir = cache_dir
         self.sample_rate = 44100
         self.generated_sounds = {}
         
         print(f"AudioGenerator using device: {self.device}")
-        if self.device == "cuda":
-            print(f"GPU: {torch.cuda.get_device_name(0)}")
-            print(f"GPU Memory: {torch.cuda.get_device_properties(0).total_memory / 1e9:.1f} GB")
         
         # Create cache directory
         os.makedirs(cache_dir, exist_ok=True)
@@ -33,8 +36,24 @@ class AudioGenerator:
         # Initialize our generators
         self._init_generators()
     
-    def _init_generators(self):
+    @classmethod
+    def _for_worker(cls, sample_rate: int) -> "AudioGenerator":
+        """A render-only instance for pool workers: no cache directory."""
+        generator = cls.__new__(cls)
+        generator.device = "cpu"
+        generator.cache_dir = None
+        generator.sample_rate = sample_rate
+        generator.generated_sounds = {}
+        generator._init_generators(verbose=False)
+        return generator
+    
+    def _init_generators(self, verbose: bool = True):
         """Initialize the audio generation components."""
+        # Shared envelope tables, grain banks and noise pool
+        self.tables = get_synthesis_tables(self.sample_rate)
+        self.granular = GranularRenderer(self.tables)
+        self.colored = ColoredNoise(self.sample_rate, self.tables)
+        
         # Simple but effective noise-based generators for real-time performance
         self.noise_generators = {
             'tavern': self._create_tavern_generator,
@@ -46,312 +65,380 @@ class AudioGenerator:
             'magic': self._create_magic_generator
         }
         
-        print(f"✅ AudioGenerator initialized with {len(self.noise_generators)} generators")
+        if verbose:
+            print(f"✅ AudioGenerator initialized with {len(self.noise_generators)} generators")
+    
+    def _generate_cache_key(self, generator_type: str, duration: float, seed: int = 0) -> str:
+        """Cache key from what synthesis depends on: generator, duration bucket and seed (not the prompt text)."""
+        return synthesis_key("procedural", generator_type, duration, seed)
+    
+    def _cache_path(self, generator_type: str, duration: float, seed: int = 0) -> str:
+        return os.path.join(self.cache_dir, f"{self._generate_cache_key(generator_type, duration, seed)}.wav")
     
-    def _generate_cache_key(self, prompt: str, duration: float, sound_type: str) -> str:
-        """Generate a unique cache key for the prompt."""
-        content = f"{prompt}_{duration}_{sound_type}"
-        return hashlib.md5(content.encode()).hexdigest()
+    def cache_path(self, prompt: str, duration: float = 3.0, seed: int = 0) -> str:
+        """The file generate_sound(prompt, duration, seed=seed) reads or writes."""
+        return self._cache_path(self._classify_prompt(prompt), quantize_duration(duration), seed)
     
-    def _create_tavern_generator(self, duration: float = 3.0) -> np.ndarray:
+    # Random helpers: one np.random.Generator per variant, batched along axis 0
+    
+    def _make_rngs(self, seeds: List[int]) -> List[np.random.Generator]:
+        """Create an independent generator for each seed."""
+        return [np.random.default_rng(seed) for seed in seeds]
+    
+    def _randn(self, rngs: List[np.random.Generator], samples: int) -> np.ndarray:
+        """Draw white noise with shape (variants, samples), read from the shared noise pool."""
+        return np.stack([self.tables.noise(rng, samples) for rng in rngs])
+    
+    def _create_tavern_generator(self, duration: float, rngs: List[np.random.Generator]) -> np.ndarray:
         """Generate tavern ambient sound using procedural synthesis."""
         samples = int(duration * self.sample_rate)
         
         # Base tavern ambiance: low-frequency rumble + wood creaks
-        base_freq = np.random.uniform(80, 120)
-        base_noise = self._generate_brown_noise(samples, 0.3)
+        base_noise = self._generate_brown_noise(rngs, samples, 0.3)
         
         # Add periodic wood creaks
-        creak_times = np.random.choice(samples, size=int(duration * 2), replace=False)
-        for creak_time in creak_times:
-            creak = self._generate_wood_creak(int(0.5 * self.sample_rate))
-            end_idx = min(creak_time + len(creak), samples)
-            base_noise[creak_time:end_idx] += creak[:end_idx - creak_time] * 0.4
+        creaks = []
+        for rng in rngs:
+            creak_times = rng.choice(samples, size=int(duration * 2), replace=False)
+            creaks.append((creak_times, self.granular.choose(rng, len(creak_times)), 0.4))
+        base_noise += self.granular.render('creak', int(0.5 * self.sample_rate), samples, creaks)
         
         # Add distant murmur (low-pass filtered noise)
-        murmur = self._generate_filtered_noise(samples, cutoff_freq=300, volume=0.2)
+        murmur = self._generate_filtered_noise(rngs, samples, cutoff_freq=300, volume=0.2)
         
         return base_noise + murmur
     
-    def _create_forest_generator(self, duration: float = 3.0) -> np.ndarray:
+    def _create_forest_generator(self, duration: float, rngs: List[np.random.Generator]) -> np.ndarray:
         """Generate forest ambient sound."""
         samples = int(duration * self.sample_rate)
         
         # Wind through leaves
-        wind = self._generate_wind_noise(samples, intensity=0.3)
+        wind = self._generate_wind_noise(rngs, samples, intensity=0.3)
         
         # Random bird calls and twig snaps
         forest_sound = wind.copy()
         
         # Add occasional twig snaps
-        snap_times = np.random.choice(samples, size=int(duration * 0.5), replace=False)
-        for snap_time in snap_times:
-            snap = self._generate_twig_snap(int(0.2 * self.sample_rate))
-            end_idx = min(snap_time + len(snap), samples)
-            forest_sound[snap_time:end_idx] += snap[:end_idx - snap_time] * 0.6
+        snaps = []
+        for rng in rngs:
+            snap_times = rng.choice(samples, size=int(duration * 0.5), replace=False)
+            snaps.append((snap_times, self.granular.choose(rng, len(snap_times)), 0.6))
+        forest_sound += self.granular.render('snap', int(0.2 * self.sample_rate), samples, snaps)
         
         return forest_sound
     
-    def _create_fire_generator(self, duration: float = 2.0) -> np.ndarray:
+    def _create_fire_generator(self, duration: float, rngs: List[np.random.Generator]) -> np.ndarray:
         """Generate crackling fire sound."""
         samples = int(duration * self.sample_rate)
         
         # Base crackling using filtered noise bursts
-        fire_sound = np.zeros(samples)
+        crackle_length = int(0.1 * self.sample_rate)
         
         # Generate random crackles
         num_crackles = int(duration * 8)  # 8 crackles per second
-        for _ in range(num_crackles):
-            start = np.random.randint(0, samples - int(0.1 * self.sample_rate))
-            crackle = self._generate_crackle(int(0.1 * self.sample_rate))
-            end_idx = min(start + len(crackle), samples)
-            fire_sound[start:end_idx] += crackle[:end_idx - start]
+        crackles = []
+        for rng in rngs:
+            starts = rng.integers(0, max(samples - crackle_length, 1), num_crackles)
+            crackles.append((starts, self.granular.choose(rng, num_crackles), 1.0))
+        fire_sound = self.granular.render('crackle', crackle_length, samples, crackles)
         
         # Add low-frequency base
-        base_noise = self._generate_pink_noise(samples, 0.2)
+        base_noise = self._generate_pink_noise(rngs, samples, 0.2)
         
         return fire_sound + base_noise
     
-    def _create_water_generator(self, duration: float = 3.0) -> np.ndarray:
+    def _create_water_generator(self, duration: float, rngs: List[np.random.Generator]) -> np.ndarray:
         """Generate water/stream sound."""
         samples = int(duration * self.sample_rate)
         
         # High-frequency noise for water bubbling
-        water_base = self._generate_filtered_noise(samples, cutoff_freq=2000, volume=0.4, high_pass=True)
+        water_base = self._generate_filtered_noise(rngs, samples, cutoff_freq=2000, volume=0.4, high_pass=True)
         
         # Add periodic droplets
-        drop_times = np.random.choice(samples, size=int(duration * 3), replace=False)
-        for drop_time in drop_times:
-            drop = self._generate_water_drop(int(0.3 * self.sample_rate))
-            end_idx = min(drop_time + len(drop), samples)
-            water_base[drop_time:end_idx] += drop[:end_idx - drop_time] * 0.3
+        drops = []
+        for rng in rngs:
+            drop_times = rng.choice(samples, size=int(duration * 3), replace=False)
+            drops.append((drop_times, self.granular.choose(rng, len(drop_times)), 0.3))
+        water_base += self.granular.render('drop', int(0.3 * self.sample_rate), samples, drops)
         
         return water_base
     
-    def _create_wind_generator(self, duration: float = 4.0) -> np.ndarray:
+    def _create_wind_generator(self, duration: float, rngs: List[np.random.Generator]) -> np.ndarray:
         """Generate wind sound."""
         samples = int(duration * self.sample_rate)
-        return self._generate_wind_noise(samples, intensity=0.5)
+        return self._generate_wind_noise(rngs, samples, intensity=0.5)
     
-    def _create_footsteps_generator(self, duration: float = 1.0) -> np.ndarray:
+    def _create_footsteps_generator(self, duration: float, rngs: List[np.random.Generator]) -> np.ndarray:
         """Generate footstep sound."""
         samples = int(duration * self.sample_rate)
         
         # Sharp impact with decay
-        footstep = np.zeros(samples)
+        footstep = np.zeros((len(rngs), samples))
         
         # Initial impact (sharp noise burst)
-        impact_length = int(0.05 * self.sample_rate)
-        impact = np.random.randn(impact_length) * np.exp(-np.linspace(0, 5, impact_length))
-        footstep[:impact_length] = impact
+        impact_length = min(int(0.05 * self.sample_rate), samples)
+        impact = self._randn(rngs, impact_length) * np.exp(-np.linspace(0, 5, impact_length))
+        footstep[:, :impact_length] = impact
         
         # Echo/reverb tail
-        decay_length = int(0.3 * self.sample_rate)
-        decay = np.random.randn(decay_length) * np.exp(-np.linspace(0, 3, decay_length)) * 0.3
+        decay_length = min(int(0.3 * self.sample_rate), samples)
+        decay = self._randn(rngs, decay_length) * np.exp(-np.linspace(0, 3, decay_length)) * 0.3
         start_decay = min(int(0.1 * self.sample_rate), samples - decay_length)
-        footstep[start_decay:start_decay + decay_length] += decay
+        footstep[:, start_decay:start_decay + decay_length] += decay
         
         return footstep
     
-    def _create_magic_generator(self, duration: float = 2.0) -> np.ndarray:
+    def _create_magic_generator(self, duration: float, rngs: List[np.random.Generator]) -> np.ndarray:
         """Generate magical/mystical sound."""
         samples = int(duration * self.sample_rate)
+        variants = len(rngs)
+        t = np.linspace(0, duration, samples)
         
         # Shimmering high frequencies
-        magic_sound = np.zeros(samples)
+        magic_sound = np.zeros((variants, samples))
+        envelope = np.exp(-t / (duration * 0.5))  # Decay envelope
         
-        # Multiple sine waves with varying frequencies
+        # Multiple sine waves with varying frequencies, one parameter set per variant
         for i in range(5):
-            freq = np.random.uniform(800, 2000)
-            phase = np.random.uniform(0, 2 * np.pi)
-            t = np.linspace(0, duration, samples)
+            freq = np.array([rng.uniform(800, 2000) for rng in rngs])[:, None]
+            phase = np.array([rng.uniform(0, 2 * np.pi) for rng in rngs])[:, None]
             
             # Frequency modulation for shimmer effect
-            mod_freq = np.random.uniform(5, 15)
+            mod_freq = np.array([rng.uniform(5, 15) for rng in rngs])[:, None]
             freq_mod = freq + 50 * np.sin(2 * np.pi * mod_freq * t)
             
             wave = 0.3 * np.sin(2 * np.pi * freq_mod * t + phase)
-            envelope = np.exp(-t / (duration * 0.5))  # Decay envelope
             magic_sound += wave * envelope
         
         # Add some filtered noise for texture
-        texture = self._generate_filtered_noise(samples, cutoff_freq=1500, volume=0.2)
+        texture = self._generate_filtered_noise(rngs, samples, cutoff_freq=1500, volume=0.2)
         
         return magic_sound + texture
     
     # Helper methods for procedural sound generation
+    # Noise helpers are batched: they return arrays of shape (variants, samples)
     
-    def _generate_brown_noise(self, samples: int, volume: float = 1.0) -> np.ndarray:
+    def _generate_brown_noise(self, rngs: List[np.random.Generator], samples: int, volume: float = 1.0) -> np.ndarray:
         """Generate brown noise (1/f² spectrum)."""
-        white_noise = np.random.randn(samples)
-        
-        # Simple brown noise approximation using cumulative sum
-        brown_noise = np.cumsum(white_noise)
-        brown_noise = brown_noise - np.mean(brown_noise)
-        brown_noise = brown_noise / np.std(brown_noise)
-        
-        return brown_noise * volume
+        return self.colored.generate(rngs, samples, volume, alpha=2.0)
     
-    def _generate_pink_noise(self, samples: int, volume: float = 1.0) -> np.ndarray:
+    def _generate_pink_noise(self, rngs: List[np.random.Generator], samples: int, volume: float = 1.0) -> np.ndarray:
         """Generate pink noise (1/f spectrum)."""
-        white_noise = np.random.randn(samples)
-        
-        # Simple pink noise using running average
-        pink_noise = np.convolve(white_noise, np.ones(10) / 10, mode='same')
-        pink_noise = pink_noise / np.std(pink_noise)
-        
-        return pink_noise * volume
+        return self.colored.generate(rngs, samples, volume, alpha=1.0)
     
-    def _generate_filtered_noise(self, samples: int, cutoff_freq: float, volume: float = 1.0, high_pass: bool = False) -> np.ndarray:
+    def _generate_filtered_noise(self, rngs: List[np.random.Generator], samples: int, cutoff_freq: float,
+                                 volume: float = 1.0, high_pass: bool = False) -> np.ndarray:
         """Generate filtered noise."""
-        noise = np.random.randn(samples)
-        
-        # Simple first-order filter approximation
+        # First-order filters: first difference (high-pass) or one-pole low-pass
         if high_pass:
-            # High-pass: emphasize high frequencies
-            filtered = np.diff(noise, prepend=noise[0])
-        else:
-            # Low-pass: smooth the noise
-            alpha = cutoff_freq / self.sample_rate
-            filtered = np.zeros_like(noise)
-            filtered[0] = noise[0]
-            for i in range(1, len(noise)):
-                filtered[i] = alpha * noise[i] + (1 - alpha) * filtered[i-1]
-        
-        filtered = filtered / np.std(filtered) if np.std(filtered) > 0 else filtered
-        return filtered * volume
+            return self.colored.generate(rngs, samples, volume, highpass=True)
+        return self.colored.generate(rngs, samples, volume, lowpass=cutoff_freq)
     
-    def _generate_wind_noise(self, samples: int, intensity: float = 1.0) -> np.ndarray:
+    def _generate_wind_noise(self, rngs: List[np.random.Generator], samples: int, intensity: float = 1.0) -> np.ndarray:
         """Generate wind-like noise."""
-        # Multiple layers of filtered noise
-        wind = np.zeros(samples)
-        
-        for freq in [100, 200, 400]:
-            layer = self._generate_filtered_noise(samples, freq, intensity / 3)
-            wind += layer
-        
-        return wind
+        # Multiple layers of filtered noise, summed in the spectrum
+        layers = [{'lowpass': freq} for freq in [100, 200, 400]]
+        return self.colored.generate(rngs, samples, intensity / np.sqrt(3), layers=layers)
     
-    def _generate_wood_creak(self, samples: int) -> np.ndarray:
-        """Generate wood creaking sound."""
-        t = np.linspace(0, samples / self.sample_rate, samples)
-        
-        # Frequency sweep for creak
-        start_freq = np.random.uniform(200, 400)
-        end_freq = np.random.uniform(100, 200)
-        freq = start_freq + (end_freq - start_freq) * t / t[-1]
+    def _classify_prompt(self, prompt: str) -> str:
+        """Determine which procedural generator to use for a prompt."""
+        prompt_lower = prompt.lower()
         
-        creak = np.sin(2 * np.pi * freq * t)
-        envelope = np.exp(-t * 5)  # Quick decay
+        for sound_name in self.noise_generators.keys():
+            if sound_name in prompt_lower:
+                return sound_name
         
-        return creak * envelope
-    
-    def _generate_twig_snap(self, samples: int) -> np.ndarray:
-        """Generate twig snapping sound."""
-        # Sharp impulse with quick decay
-        snap = np.random.randn(samples)
-        t = np.linspace(0, samples / self.sample_rate, samples)
-        envelope = np.exp(-t * 20)  # Very quick decay
-        
-        return snap * envelope
-    
-    def _generate_crackle(self, samples: int) -> np.ndarray:
-        """Generate fire crackling sound."""
-        # Random impulse with resonance
-        crackle = np.random.randn(samples)
-        t = np.linspace(0, samples / self.sample_rate, samples)
-        
-        # Add some resonance
-        freq = np.random.uniform(800, 1500)
-        resonance = np.sin(2 * np.pi * freq * t)
-        envelope = np.exp(-t * 10)
-        
-        return (crackle + resonance * 0.5) * envelope
+        # Default fallback based on keywords
+        if any(word in prompt_lower for word in ['cozy', 'warm', 'inn', 'pub', 'drinking']):
+            return 'tavern'
+        elif any(word in prompt_lower for word in ['forest', 'woods', 'trees', 'nature']):
+            return 'forest'
+        elif any(word in prompt_lower for word in ['fire', 'flame', 'crackling']):
+            return 'fire'
+        elif any(word in prompt_lower for word in ['water', 'stream', 'river']):
+            return 'water'
+        elif any(word in prompt_lower for word in ['wind', 'breeze']):
+            return 'wind'
+        elif any(word in prompt_lower for word in ['step', 'walk', 'footstep']):
+            return 'footsteps'
+        elif any(word in prompt_lower for word in ['magic', 'spell', 'mystical']):
+            return 'magic'
+        else:
+            return 'tavern'  # Default
     
-    def _generate_water_drop(self, samples: int) -> np.ndarray:
-        """Generate water droplet sound."""
-        t = np.linspace(0, samples / self.sample_rate, samples)
+    def _render(self, generator_type: str, duration: float, seeds: List[int]) -> np.ndarray:
+        """
+        Render one variant per seed in a single batched pass.
+        Returns normalized audio with shape (len(seeds), samples).
+        """
+        generator_func = self.noise_generators[generator_type]
+        audio_data = generator_func(duration, self._make_rngs(seeds))
         
-        # High frequency with quick decay
-        freq = np.random.uniform(1000, 2000)
-        drop = np.sin(2 * np.pi * freq * t)
-        envelope = np.exp(-t * 8)
+        with metrics.timer("generation_normalize_seconds", engine="procedural"):
+            # Normalize each variant
+            peaks = np.max(np.abs(audio_data), axis=1, keepdims=True)
+            audio_data = np.divide(audio_data, peaks, out=audio_data, where=peaks > 0)
+            
+            # Apply fade in/out
+            fade_samples = int(0.1 * self.sample_rate)  # 100ms fade
+            if audio_data.shape[1] > 2 * fade_samples:
+                # Fade in
+                audio_data[:, :fade_samples] *= np.linspace(0, 1, fade_samples)
+                # Fade out
+                audio_data[:, -fade_samples:] *= np.linspace(1, 0, fade_samples)
         
-        return drop * envelope
+        return audio_data
     
-    def generate_sound(self, prompt: str, duration: float = 3.0, sound_type: str = "ambient") -> Optional[str]:
+    def generate_sound(self, prompt: str, duration: float = 3.0, sound_type: str = "ambient",
+                       seed: int = 0) -> Optional[str]:
         """
         Generate a sound based on text prompt.
+        The same prompt, duration and seed always render the same audio.
+        Duration is rounded to the cache's duration bucket (0.25 s).
         Returns path to generated audio file.
         """
+        paths = self.generate_variants(prompt, duration, variants=1, sound_type=sound_type, seed=seed)
+        return paths[0] if paths else None
+    
+    def generate_variants(self, prompt: str, duration: float = 3.0, variants: int = 4,
+                          sound_type: str = "ambient", seed: int = 0) -> List[str]:
+        """
+        Generate variants of a prompt using seeds seed .. seed + variants - 1.
+        Missing variants are rendered together in one vectorized pass; each
+        variant is identical to generate_sound with its own seed.
+        Prompts that classify to the same generator share cache files.
+        Returns the cache paths of all variants (empty list on failure).
+        """
         start_time = time.time()
+        duration = quantize_duration(duration)
         
-        # Check cache first
-        cache_key = self._generate_cache_key(prompt, duration, sound_type)
-        cache_path = os.path.join(self.cache_dir, f"{cache_key}.wav")
-        
-        if os.path.exists(cache_path):
-            print(f"✅ Using cached audio for '{prompt}' ({time.time() - start_time:.3f}s)")
-            return cache_path
+        # Determine sound type from prompt (the only way the prompt affects synthesis)
+        with metrics.timer("generation_classify_seconds", engine="procedural"):
+            generator_type = self._classify_prompt(prompt)
         
-        # Determine sound type from prompt
-        prompt_lower = prompt.lower()
-        generator_type = None
+        seeds = [seed + i for i in range(variants)]
+        paths = [self._cache_path(generator_type, duration, s) for s in seeds]
         
-        for sound_name in self.noise_generators.keys():
-            if sound_name in prompt_lower:
-                generator_type = sound_name
-                break
-        
-        # Default fallback based on keywords
-        if not generator_type:
-            if any(word in prompt_lower for word in ['cozy', 'warm', 'inn', 'pub', 'drinking']):
-                generator_type = 'tavern'
-            elif any(word in prompt_lower for word in ['forest', 'woods', 'trees', 'nature']):
-                generator_type = 'forest'
-            elif any(word in prompt_lower for word in ['fire', 'flame', 'crackling']):
-                generator_type = 'fire'
-            elif any(word in prompt_lower for word in ['water', 'stream', 'river']):
-                generator_type = 'water'
-            elif any(word in prompt_lower for word in ['wind', 'breeze']):
-                generator_type = 'wind'
-            elif any(word in prompt_lower for word in ['step', 'walk', 'footstep']):
-                generator_type = 'footsteps'
-            elif any(word in prompt_lower for word in ['magic', 'spell', 'mystical']):
-                generator_type = 'magic'
-            else:
-                generator_type = 'tavern'  # Default
-        
-        print(f"🎵 Generating '{generator_type}' sound for '{prompt}'...")
+        # Check cache first
+        with metrics.timer("cache_lookup_seconds", engine="procedural"):
+            missing = [i for i, path in enumerate(paths) if not os.path.exists(path)]
+        metrics.inc("cache_hits_total", variants - len(missing), engine="procedural")
+        metrics.inc("cache_misses_total", len(missing), engine="procedural")
+        if not missing:
+            latency = time.time() - start_time
+            logger.debug("✅ Using cached audio for '%s' (%.3fs)", prompt, latency,
+                         extra={"prompt": prompt, "engine": "procedural", "sound_type": generator_type,
+                                "duration": duration, "seed": seed, "variants": variants,
+                                "cache_hit": True, "latency": latency})
+            return paths
+        
+        logger.info("🎵 Generating '%s' sound for '%s' (%d variant(s))...", generator_type, prompt, len(missing),
+                    extra={"prompt": prompt, "engine": "procedural", "sound_type": generator_type,
+                           "duration": duration, "variants": len(missing)})
         
         try:
             # Generate the audio using our procedural generator
-            generator_func = self.noise_generators[generator_type]
-            audio_data = generator_func(duration)
-            
-            # Normalize audio
-            if np.max(np.abs(audio_data)) > 0:
-                audio_data = audio_data / np.max(np.abs(audio_data))
-            
-            # Apply fade in/out
-            fade_samples = int(0.1 * self.sample_rate)  # 100ms fade
-            if len(audio_data) > 2 * fade_samples:
-                # Fade in
-                audio_data[:fade_samples] *= np.linspace(0, 1, fade_samples)
-                # Fade out
-                audio_data[-fade_samples:] *= np.linspace(1, 0, fade_samples)
+            with metrics.timer("generation_synthesis_seconds", engine="procedural", sound_type=generator_type):
+                audio_data = self._render(generator_type, duration, [seeds[i] for i in missing])
             
             # Save to cache
-            sf.write(cache_path, audio_data, self.sample_rate)
+            with metrics.timer("generation_write_seconds", engine="procedural"):
+                for row, index in enumerate(missing):
+                    write_cache_file(paths[index], audio_data[row], self.sample_rate)
             
-            generation_time = time.time() - start_time
-            print(f"✅ Generated {duration:.1f}s audio in {generation_time:.3f}s (RTX 5090)")
+            # Loudness is measured once here and read back at playback
+            with metrics.timer("generation_analyze_seconds", engine="procedural"):
+                get_index(self.cache_dir).record([paths[i] for i in missing], analyze(audio_data, self.sample_rate))
             
-            return cache_path
+            generation_time = time.time() - start_time
+            logger.info("✅ Generated %.1fs audio in %.3fs", duration, generation_time,
+                        extra={"prompt": prompt, "engine": "procedural", "sound_type": generator_type,
+                               "duration": duration, "seed": seed, "variants": variants, "rendered": len(missing),
+                               "cache_hit": False, "latency": generation_time})
             
+            return paths
+        
         except Exception as e:
-            print(f"❌ Error generating audio: {e}")
-            return None
+            metrics.inc("generation_failures_total", engine="procedural")
+            logger.error("❌ Error generating audio: %s", e, extra={"prompt": prompt, "engine": "procedural"})
+            return []
+    
+    def generate_many(self, prompts: List[str], duration: float = 3.0, sound_type: str = "ambient",
+                      seed: int = 0, max_workers: Optional[int] = None) -> List[Optional[str]]:
+        """
+        Generate many prompts in parallel on a process pool.
+        Each result is identical to generate_sound(prompt, duration, sound_type, seed):
+        jobs are seeded by their own seed, never by which worker runs them.
+        Workers render straight into one shared-memory buffer, so no audio is
+        pickled between processes; files are written here as results arrive.
+        Returns one cache path per prompt (None where generation failed).
+        """
+        start_time = time.time()
+        duration = quantize_duration(duration)
+        
+        paths = [self.cache_path(prompt, duration, seed) for prompt in prompts]
+        
+        # One job per distinct missing file (prompts of the same generator share one)
+        jobs: Dict[str, str] = {}
+        for prompt, path in zip(prompts, paths):
+            if not os.path.exists(path) and path not in jobs:
+                jobs[path] = prompt
+        
+        if not jobs:
+            latency = time.time() - start_time
+            logger.debug("✅ Using cached audio for all %d prompts (%.3fs)", len(prompts), latency,
+                         extra={"engine": "procedural", "variants": len(prompts), "cache_hit": True, "latency": latency})
+            return paths
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        logger.info("🎵 Generating %d sounds on %d worker(s)...", len(jobs), workers,
+                    extra={"engine": "procedural", "variants": len(jobs), "workers": workers})
+        
+        if workers == 1:
+            failed = {path for path, prompt in jobs.items() if self.generate_sound(prompt, duration, sound_type, seed) is None}
+            return [None if path in failed else path for path in paths]
+        
+        samples = int(duration * self.sample_rate)
+        itemsize = np.dtype(np.float64).itemsize
+        buffer = shared_memory.SharedMemory(create=True, size=max(len(jobs) * samples * itemsize, 1))
+        failed = set()
+        
+        try:
+            results = np.ndarray((len(jobs), samples), dtype=np.float64, buffer=buffer.buf)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                     initargs=(self.sample_rate,)) as pool:
+                futures = {
+                    pool.submit(_render_into_buffer, buffer.name, (len(jobs), samples), row,
+                                self._classify_prompt(prompt), duration, seed): path
+                    for row, (path, prompt) in enumerate(jobs.items())
+                }
+                written = {}
+                for future in as_completed(futures):
+                    path = futures[future]
+                    try:
+                        row = future.result()
+                        write_cache_file(path, results[row], self.sample_rate)
+                        written[path] = row
+                    except Exception as e:
+                        logger.error("❌ Error generating audio for '%s': %s", jobs[path], e,
+                                     extra={"prompt": jobs[path], "engine": "procedural"})
+                        failed.add(path)
+            
+            if written:
+                with metrics.timer("generation_analyze_seconds", engine="procedural"):
+                    get_index(self.cache_dir).record(list(written), analyze(results[list(written.values())],
+                                                                             self.sample_rate))
+            del results
+        finally:
+            buffer.close()
+            buffer.unlink()
+        
+        generation_time = time.time() - start_time
+        logger.info("✅ Generated %d sounds (%.1fs each) in %.3fs", len(jobs) - len(failed), duration, generation_time,
+                    extra={"engine": "procedural", "duration": duration, "variants": len(jobs) - len(failed),
+                           "failed": len(failed), "cache_hit": False, "latency": generation_time})
+        
+        return [None if path in failed else path for path in paths]
     
     def clear_cache(self):
         """Clear the audio generation cache."""
@@ -359,6 +446,7 @@ class AudioGenerator:
         if os.path.exists(self.cache_dir):
             shutil.rmtree(self.cache_dir)
             os.makedirs(self.cache_dir, exist_ok=True)
+            get_index(self.cache_dir).clear()
         print("🗑️ Audio cache cleared")
     
     def get_cache_info(self) -> Dict:
@@ -372,4 +460,27 @@ class AudioGenerator:
         return {
             "files": len(files),
             "size_mb": total_size / (1024 * 1024)
-        }
\ No newline at end of file
+        }
+
+
+# Process pool workers for AudioGenerator.generate_many
+
+_worker_generator: Optional[AudioGenerator] = None
+
+
+def _init_render_worker(sample_rate: int):
+    global _worker_generator
+    _worker_generator = AudioGenerator._for_worker(sample_rate)
+
+
+def _render_into_buffer(buffer_name: str, shape: Tuple[int, int], row: int,
+                        generator_type: str, duration: float, seed: int) -> int:
+    """Render one job into its row of the shared result buffer."""
+    buffer = shared_memory.SharedMemory(name=buffer_name)
+    try:
+        results = np.ndarray(shape, dtype=np.float64, buffer=buffer.buf)
+        results[row] = _worker_generator._render(generator_type, duration, [seed])[0]
+        del results
+    finally:
+        buffer.close()
+    return row
@@ -6,6 +6,9 @@ import os
 import tempfile
 import time
 
+from loudness import analyze, get_index
+from metrics import metrics
+
 
 class AudioLDMEngine:
     """AI Audio Generation Engine using AudioLDM pre-trained models."""
@@ -38,11 +41,12 @@ class AudioLDMEngine:
         start_time = time.time()
         
         # Generate audio
-        audio = self.pipe(
-            prompt, 
-            num_inference_steps=steps, 
-            audio_length_in_s=duration
-        ).audios[0]
+        with metrics.timer("generation_synthesis_seconds", engine="audioldm", sound_type="neural"):
+            audio = self.pipe(
+                prompt, 
+                num_inference_steps=steps, 
+                audio_length_in_s=duration
+            ).audios[0]
         
         generation_time = time.time() - start_time
         
@@ -52,11 +56,16 @@ class AudioLDMEngine:
         filepath = os.path.join(self.output_dir, filename)
         
         # Ensure audio is in correct format and normalize
-        audio_normalized = audio / (np.max(np.abs(audio)) + 1e-8)  # Avoid division by zero
+        with metrics.timer("generation_normalize_seconds", engine="audioldm"):
+            audio_normalized = audio / (np.max(np.abs(audio)) + 1e-8)  # Avoid division by zero
         
         # Convert to 16-bit PCM and save
-        audio_16bit = (audio_normalized * 32767).astype(np.int16)
-        scipy.io.wavfile.write(filepath, rate=16000, data=audio_16bit)
+        with metrics.timer("generation_write_seconds", engine="audioldm"):
+            audio_16bit = (audio_normalized * 32767).astype(np.int16)
+            scipy.io.wavfile.write(filepath, rate=16000, data=audio_16bit)
+        
+        with metrics.timer("generation_analyze_seconds", engine="audioldm"):
+            get_index(self.output_dir).record([filepath], analyze(audio_normalized, 16000))
         
         print(f"⚡ Generated in {generation_time:.2f}s")
         print(f"💾 Saved to: {filepath}")
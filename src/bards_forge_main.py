@@ -1,11 +1,9 @@
 import sys
-import time
-import select
-from audio_engine import AudioEngine
-from generative_orchestrator import GenerativeOrchestrator
-from nlp_interpreter import NLPInterpreter
-from neural_audio_forge import NeuralAudioForge
-from workshop_interface import WorkshopInterface
+
+from structured_logging import configure_logging
+
+# Subsystems (torch, transformers, pygame...) are imported by the mode that
+# first needs them, so the main menu appears without paying for them.
 
 
 class BardsForgeApplication:
@@ -20,6 +18,7 @@ class BardsForgeApplication:
         self.orchestrator = None
         self.nlp_interpreter = None
         self.neural_forge = None
+        self.runtime = None
         
     def print_main_banner(self):
         """Print the main application banner."""
@@ -80,10 +79,13 @@ class BardsForgeApplication:
         print("\n🔨 Starting Workshop Mode...")
         
         try:
+            from workshop_interface import WorkshopInterface
             workshop = WorkshopInterface()
             workshop.run()
         except KeyboardInterrupt:
             print("\n⚡ Workshop interrupted by user")
+        except ImportError as e:
+            print(f"\n❌ Missing dependencies: {e}")
         except Exception as e:
             print(f"\n❌ Workshop error: {e}")
     
@@ -93,6 +95,11 @@ class BardsForgeApplication:
         print("🔧 Initializing performance systems...")
         
         try:
+            from audio_engine import AudioEngine
+            from generative_orchestrator import GenerativeOrchestrator
+            from nlp_interpreter import NLPInterpreter
+            from neural_audio_forge import NeuralAudioForge
+            
             # Initialize components
             self.audio_engine = AudioEngine()
             self.neural_forge = NeuralAudioForge()
@@ -123,6 +130,8 @@ class BardsForgeApplication:
             
         except KeyboardInterrupt:
             print("\n⚡ Performance mode interrupted by user")
+        except ImportError as e:
+            print(f"\n❌ Missing dependencies: {e}")
         except Exception as e:
             print(f"\n❌ Performance mode error: {e}")
         finally:
@@ -160,128 +169,141 @@ class BardsForgeApplication:
         
         print("\n🎮 Performance mode ready! (press Enter to see controls)")
         
-        while True:
-            # Update orchestrator
-            self.orchestrator.update()
+        from performance_runtime import PerformanceRuntime
+        
+        # Event-driven: sleeps until input, a scheduled oneshot or a crossfade tick
+        self.runtime = PerformanceRuntime(self.orchestrator, self.handle_performance_command)
+        self.runtime.run()
+    
+    async def handle_performance_command(self, user_input: str) -> bool:
+        """Handle one performance mode command. Returns False to leave the mode."""
+        runtime = self.runtime
+        
+        if user_input == 't':
+            print("🍺 Switching to tavern scene...")
+            self.orchestrator.play_scene("tavern")
             
-            # Non-blocking input check
-            if select.select([sys.stdin], [], [], 0.1)[0]:
-                user_input = input("> ").lower().strip()
-                
-                if user_input == 't':
-                    print("🍺 Switching to tavern scene...")
-                    self.orchestrator.play_scene("tavern")
-                    
-                elif user_input == 'f':
-                    print("🌲 Switching to forest scene...")
-                    self.orchestrator.play_scene("forest")
-                    
-                elif user_input == 'd':
-                    print("🏰 Switching to dungeon scene...")
-                    self.orchestrator.play_scene("dungeon")
-                    
-                elif user_input == 'b':
-                    print("⚔️ Switching to battlefield scene...")
-                    self.orchestrator.play_scene("battlefield")
-                    
-                elif user_input == 'm':
-                    print("📚 Switching to magical library scene...")
-                    self.orchestrator.play_scene("magical_library")
-                    
-                elif user_input == 'p':
-                    print("\n🧠 NLP SCENE INTERPRETATION")
-                    print("Describe your scene:")
-                    description = input("> ")
-                    scene = self.nlp_interpreter.interpret_prompt(description, self.orchestrator.scenes)
-                    if scene:
-                        print(f"🎯 Interpreted as: {scene}")
-                        self.orchestrator.play_scene(scene)
-                    else:
-                        print("❓ Scene not recognized. Generating custom scene...")
-                        success = self.orchestrator.generate_scene_on_demand(description)
-                        if not success:
-                            print("❌ Could not generate scene")
-                            
-                elif user_input == 'g':
-                    print("\n🎭 CUSTOM SCENE GENERATION")
-                    description = input("Describe the scene > ")
-                    if description:
-                        try:
-                            duration = float(input("Duration (default: 30s) > ") or "30")
-                        except ValueError:
-                            duration = 30.0
-                        self.orchestrator.generate_scene_on_demand(description, duration)
-                    
-                elif user_input == 'n':
-                    print("\n🎵 NEURAL SOUND GENERATION")
-                    prompt = input("Describe the sound > ")
-                    if prompt:
-                        try:
-                            duration = float(input("Duration (default: 3s) > ") or "3")
-                        except ValueError:
-                            duration = 3.0
-                        
-                        print(f"🔥 Generating: '{prompt}'...")
-                        file_path = self.neural_forge.generate_sound(prompt, duration)
-                        if file_path:
-                            print(f"✅ Generated! Playing sound...")
-                            self.audio_engine.play_sound(file_path, volume=0.8)
-                        else:
-                            print("❌ Generation failed")
-                            
-                elif user_input == 'a':
-                    if not self.orchestrator.current_scene:
-                        print("❌ No active scene. Start a scene first!")
-                    else:
-                        print(f"\n🔊 ADD DYNAMIC SOUND TO: {self.orchestrator.current_scene}")
-                        sound_desc = input("Sound description > ")
-                        if sound_desc:
-                            freq_input = input("Frequency (rarely/occasionally/often) > ").strip().lower()
-                            freq_map = {"rarely": 0.01, "occasionally": 0.05, "often": 0.15}
-                            prob = freq_map.get(freq_input, 0.05)
-                            self.orchestrator.add_dynamic_oneshot(sound_desc, prob)
-                            
-                elif user_input == 'stats':
-                    stats = self.orchestrator.get_generation_stats()
-                    cache_info = self.neural_forge.get_cache_info()
-                    
-                    print(f"\n📊 THE BARD'S FORGE STATISTICS:")
-                    print(f"  Current scene: {stats['current_scene'] or 'None'}")
-                    print(f"  Generation enabled: {stats['generation_enabled']}")
-                    print(f"  Neural cache files: {cache_info['files']}")
-                    print(f"  Neural cache size: {cache_info['size_mb']:.1f} MB")
-                    
-                    try:
-                        import torch
-                        if torch.cuda.is_available():
-                            memory_used = torch.cuda.memory_allocated(0) / 1e9
-                            print(f"  GPU memory used: {memory_used:.1f} GB")
-                    except Exception as e:
-                        print(f"  GPU memory: Error accessing GPU info")
-                        
-                elif user_input == 'clear':
-                    print("🗑️ Clearing caches...")
-                    self.orchestrator.clear_generated_cache()
-                    self.neural_forge.clear_cache()
-                    
-                elif user_input == 's':
-                    print("🛑 Stopping current scene...")
-                    self.orchestrator.stop_current_scene()
+        elif user_input == 'f':
+            print("🌲 Switching to forest scene...")
+            self.orchestrator.play_scene("forest")
+            
+        elif user_input == 'd':
+            print("🏰 Switching to dungeon scene...")
+            self.orchestrator.play_scene("dungeon")
+            
+        elif user_input == 'b':
+            print("⚔️ Switching to battlefield scene...")
+            self.orchestrator.play_scene("battlefield")
+            
+        elif user_input == 'm':
+            print("📚 Switching to magical library scene...")
+            self.orchestrator.play_scene("magical_library")
+            
+        elif user_input == 'p':
+            print("\n🧠 NLP SCENE INTERPRETATION")
+            print("Describe your scene:")
+            description = await runtime.ainput("> ")
+            scene = await runtime.run_blocking(self.nlp_interpreter.interpret_prompt, description, self.orchestrator.scenes)
+            if scene:
+                print(f"🎯 Interpreted as: {scene}")
+                self.orchestrator.play_scene(scene)
+            else:
+                print("❓ Scene not recognized. Generating custom scene...")
+                bed_file = await runtime.run_blocking(self.orchestrator.prepare_scene_on_demand, description)
+                success = self.orchestrator.activate_generated_scene(bed_file)
+                if not success:
+                    print("❌ Could not generate scene")
                     
-                elif user_input == 'q':
-                    break
+        elif user_input == 'g':
+            print("\n🎭 CUSTOM SCENE GENERATION")
+            description = await runtime.ainput("Describe the scene > ")
+            if description:
+                try:
+                    duration = float(await runtime.ainput("Duration (default: 30s) > ") or "30")
+                except ValueError:
+                    duration = 30.0
+                bed_file = await runtime.run_blocking(self.orchestrator.prepare_scene_on_demand, description, duration)
+                self.orchestrator.activate_generated_scene(bed_file)
+            
+        elif user_input == 'n':
+            print("\n🎵 NEURAL SOUND GENERATION")
+            prompt = await runtime.ainput("Describe the sound > ")
+            if prompt:
+                try:
+                    duration = float(await runtime.ainput("Duration (default: 3s) > ") or "3")
+                except ValueError:
+                    duration = 3.0
+                
+                print(f"🔥 Generating: '{prompt}'...")
+                file_path = await runtime.run_blocking(self.neural_forge.generate_sound, prompt, duration)
+                if file_path:
+                    print(f"✅ Generated! Playing sound...")
+                    self.audio_engine.play_sound(file_path, volume=0.8)
+                else:
+                    print("❌ Generation failed")
                     
-                elif user_input == '':
-                    print("Press 'q' to return to main menu, or see controls above")
+        elif user_input == 'a':
+            if not self.orchestrator.current_scene:
+                print("❌ No active scene. Start a scene first!")
+            else:
+                print(f"\n🔊 ADD DYNAMIC SOUND TO: {self.orchestrator.current_scene}")
+                sound_desc = await runtime.ainput("Sound description > ")
+                if sound_desc:
+                    freq_input = (await runtime.ainput("Frequency (rarely/occasionally/often) > ")).strip().lower()
+                    freq_map = {"rarely": 0.01, "occasionally": 0.05, "often": 0.15}
+                    prob = freq_map.get(freq_input, 0.05)
+                    self.orchestrator.add_dynamic_oneshot(sound_desc, prob)
                     
-                else:
-                    print(f"❓ Unknown command: '{user_input}'")
+        elif user_input == 'stats':
+            stats = self.orchestrator.get_generation_stats()
+            cache_info = self.neural_forge.get_cache_info()
             
-            # Small sleep to prevent 100% CPU usage
-            time.sleep(0.1)
+            print(f"\n📊 THE BARD'S FORGE STATISTICS:")
+            print(f"  Current scene: {stats['current_scene'] or 'None'}")
+            print(f"  Generation enabled: {stats['generation_enabled']}")
+            print(f"  Neural cache files: {cache_info['files']}")
+            print(f"  Neural cache size: {cache_info['size_mb']:.1f} MB")
+            
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    memory_used = torch.cuda.memory_allocated(0) / 1e9
+                    print(f"  GPU memory used: {memory_used:.1f} GB")
+            except Exception as e:
+                print(f"  GPU memory: Error accessing GPU info")
+            
+            from metrics import metrics
+            print(f"\n⏱️ HOT-PATH METRICS:")
+            if not metrics.enabled:
+                print("  Disabled (BARDS_FORGE_METRICS=0)")
+            for line in metrics.report() or ["Nothing recorded yet"]:
+                print(f"  {line}")
+                
+        elif user_input == 'clear':
+            print("🗑️ Clearing caches...")
+            self.orchestrator.clear_generated_cache()
+            self.neural_forge.clear_cache()
+            
+        elif user_input == 's':
+            print("🛑 Stopping current scene...")
+            self.orchestrator.stop_current_scene()
+            
+        elif user_input == 'q':
+            return False
+            
+        elif user_input == '':
+            print("Press 'q' to return to main menu, or see controls above")
+            
+        else:
+            print(f"❓ Unknown command: '{user_input}'")
+        
+        return True
     
     def run(self):
         """Run the main application."""
+        # Generation and playback events stay off the terminal unless BARDS_FORGE_LOG_LEVEL asks for them
+        configure_logging()
+        
         while True:
             self.print_main_banner()
             
@@ -302,9 +324,7 @@ class BardsForgeApplication:
 
 
 if __name__ == "__main__":
-    # Import torch here to handle import issues gracefully
     try:
-        import torch
         app = BardsForgeApplication()
         app.run()
     except ImportError as e:
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from colored_noise import ColoredNoise
+from granular import GranularRenderer
+from synthesis_tables import get_synthesis_tables
+
+# p50 slowdown, relative to the baseline, that counts as a regression
+REGRESSION_THRESHOLD = 0.10
+
+PERCENTILES = (50, 90, 99)
+
+
+class SynthesisKernels:
+    """
+    The shared synthesis kernels on their own, behind the same
+    _render(kind, duration, seeds) interface as the generators.
+    Event densities match what the procedural generators use.
+    """
+
+    def __init__(self, sample_rate: int = 44100):
+        self.device = "cpu"
+        self.sample_rate = sample_rate
+        self.tables = get_synthesis_tables(sample_rate)
+        self.granular = GranularRenderer(self.tables)
+        self.colored = ColoredNoise(sample_rate, self.tables)
+
+        self.kernels: Dict[str, Callable[[float, List[np.random.Generator]], np.ndarray]] = {
+            'grain_scatter': lambda duration, rngs: self._grains(duration, rngs, "scatter"),
+            'grain_fft': lambda duration, rngs: self._grains(duration, rngs, "fft"),
+            'pink_noise': lambda duration, rngs: self.colored.generate(rngs, self._samples(duration), alpha=1.0),
+            'wind_noise': lambda duration, rngs: self.colored.generate(
+                rngs, self._samples(duration), layers=[{'lowpass': f} for f in [100, 200, 400]])
+        }
+
+    def _samples(self, duration: float) -> int:
+        return int(duration * self.sample_rate)
+
+    def _grains(self, duration: float, rngs: List[np.random.Generator], method: str) -> np.ndarray:
+        """Fire-style crackle train: 10 grains of 50 ms per second."""
+        samples = self._samples(duration)
+        grain_samples = int(0.05 * self.sample_rate)
+        events = []
+        for rng in rngs:
+            count = int(duration * 10)
+            events.append((rng.integers(0, samples, count), self.granular.choose(rng, count),
+                           rng.uniform(0.1, 0.3, count)))
+        return self.granular.render('crackle', grain_samples, samples, events, method=method)
+
+    def _render(self, kind: str, duration: float, seeds: List[int]) -> np.ndarray:
+        return self.kernels[kind](duration, [np.random.default_rng(seed) for seed in seeds])
+
+
+def _procedural_engine(cache_dir: str):
+    from audio_generator import AudioGenerator
+    engine = AudioGenerator(cache_dir=cache_dir)
+    return engine, list(engine.noise_generators)
+
+
+def _numpy_engine(cache_dir: str):
+    from cpu_audio_generator import NumpyAudioGenerator
+    engine = NumpyAudioGenerator(cache_dir=cache_dir)
+    return engine, list(engine.kernels)
+
+
+def _torch_engine(cache_dir: str):
+    from gpu_audio_generator import RTX5090AudioGenerator
+    engine = RTX5090AudioGenerator(cache_dir=cache_dir)
+    return engine, list(engine.kernels)
+
+
+def _kernel_engine(cache_dir: str):
+    engine = SynthesisKernels()
+    return engine, list(engine.kernels)
+
+
+# Engine name -> factory(cache_dir) returning (engine, sound types it renders)
+ENGINES: Dict[str, Callable[[str], Tuple[object, List[str]]]] = {
+    'procedural': _procedural_engine,
+    'numpy': _numpy_engine,
+    'torch': _torch_engine,
+    'kernels': _kernel_engine
+}
+
+# Engines whose buffers are NumPy arrays, visible to tracemalloc
+NUMPY_ENGINES = {'procedural', 'numpy', 'kernels'}
+
+
+class Benchmark:
+    """
+    Repeatable timings of the generation engines.
+
+    Every case calls the engine's batched _render directly, so neither the
+    WAV cache nor file I/O is involved, and each trial uses fresh seeds so
+    nothing can be served from a previous result. A case runs `warmup`
+    untimed renders (table, pool and allocator warm-up), then `trials`
+    timed ones, and reports:
+
+    - min / mean / p50 / p90 / p99 seconds per render
+    - x-real-time: seconds of audio rendered per second at p50
+    - peak memory of one extra render, measured apart from the timings:
+      tracemalloc for the NumPy engines, the CUDA allocator for torch on
+      CUDA (torch CPU allocations are not visible to either, so None)
+    """
+
+    def __init__(self, trials: int = 10, warmup: int = 2, variants: int = 1):
+        self.trials = trials
+        self.warmup = warmup
+        self.variants = variants
+
+    def run(self, engines: List[str], durations: List[float],
+            sound_types: Optional[List[str]] = None) -> Dict:
+        """Benchmark every (engine, sound type, duration); returns the JSON-ready report."""
+        results = []
+        devices = {}
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for name in engines:
+                try:
+                    engine, types = ENGINES[name](os.path.join(cache_dir, name))
+                except ImportError as e:
+                    print(f"⚠️ Skipping engine '{name}': {e}")
+                    continue
+                devices[name] = engine.device
+
+                for sound_type in types:
+                    if sound_types and sound_type not in sound_types:
+                        continue
+                    for duration in durations:
+                        result = self.run_case(engine, sound_type, duration, traced=name in NUMPY_ENGINES)
+                        result["engine"] = name
+                        results.append(result)
+                        print(f"  {name:<10} {sound_type:<13} {duration:6.2f}s  p50 {result['p50'] * 1000:8.2f}ms  "
+                              f"p99 {result['p99'] * 1000:8.2f}ms  {result['xrt']:8.1f}x RT  "
+                              f"{self._format_mb(result['peak_mb'])}")
+
+        return {
+            "meta": self._environment(devices),
+            "settings": {"trials": self.trials, "warmup": self.warmup, "variants": self.variants},
+            "results": results
+        }
+
+    def run_case(self, engine, sound_type: str, duration: float, traced: bool = True) -> Dict:
+        """Time one sound type at one duration (traced: measure CPU memory with tracemalloc)."""
+        seed = 0
+        for _ in range(self.warmup):
+            self._render(engine, sound_type, duration, seed)
+            seed += self.variants
+
+        times = []
+        for _ in range(self.trials):
+            start = time.perf_counter()
+            self._render(engine, sound_type, duration, seed)
+            times.append(time.perf_counter() - start)
+            seed += self.variants
+
+        peak_mb, memory_source = self._peak_memory(engine, sound_type, duration, seed, traced)
+        times = np.array(times)
+        result = {
+            "sound_type": sound_type,
+            "duration": duration,
+            "variants": self.variants,
+            "min": float(times.min()),
+            "mean": float(times.mean()),
+            "peak_mb": peak_mb,
+            "memory_source": memory_source
+        }
+        for q, value in zip(PERCENTILES, np.percentile(times, PERCENTILES)):
+            result[f"p{q}"] = float(value)
+        result["xrt"] = duration * self.variants / result["p50"] if result["p50"] > 0 else float("inf")
+        return result
+
+    def _render(self, engine, sound_type: str, duration: float, seed: int):
+        audio = engine._render(sound_type, duration, list(range(seed, seed + self.variants)))
+        if engine.device == "cuda":
+            import torch
+            torch.cuda.synchronize()
+        return audio
+
+    def _peak_memory(self, engine, sound_type: str, duration: float, seed: int,
+                     traced: bool) -> Tuple[Optional[float], Optional[str]]:
+        if engine.device == "cuda":
+            import torch
+            torch.cuda.synchronize()
+            torch.cuda.reset_peak_memory_stats()
+            baseline = torch.cuda.memory_allocated()
+            self._render(engine, sound_type, duration, seed)
+            return (torch.cuda.max_memory_allocated() - baseline) / (1024 * 1024), "cuda"
+
+        if not traced:
+            return None, None
+
+        tracemalloc.start()
+        try:
+            self._render(engine, sound_type, duration, seed)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak / (1024 * 1024), "tracemalloc"
+
+    @staticmethod
+    def _format_mb(value: Optional[float]) -> str:
+        return "   n/a" if value is None else f"{value:7.1f} MB"
+
+    @staticmethod
+    def _environment(devices: Dict[str, str]) -> Dict:
+        """Enough context to tell whether two reports are comparable."""
+        try:
+            commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                    cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5).stdout.strip() or None
+        except (OSError, subprocess.SubprocessError):
+            commit = None
+
+        meta = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": commit,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+            "devices": devices
+        }
+        if "torch" in sys.modules:
+            torch = sys.modules["torch"]
+            meta["torch"] = torch.__version__
+            meta["torch_threads"] = torch.get_num_threads()
+            if torch.cuda.is_available():
+                meta["gpu"] = torch.cuda.get_device_name(0)
+        return meta
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = REGRESSION_THRESHOLD) -> List[Dict]:
+    """
+    Match cases by (engine, sound type, duration, variants) and report the p50 change.
+    Cases slower than the baseline by more than threshold are marked as regressions.
+    """
+    def key(result: Dict) -> Tuple:
+        return result["engine"], result["sound_type"], result["duration"], result["variants"]
+
+    previous = {key(result): result for result in baseline["results"]}
+    changes = []
+    for result in current["results"]:
+        old = previous.get(key(result))
+        if old is None or old["p50"] <= 0:
+            continue
+        ratio = result["p50"] / old["p50"]
+        changes.append({
+            "engine": result["engine"],
+            "sound_type": result["sound_type"],
+            "duration": result["duration"],
+            "baseline_p50": old["p50"],
+            "p50": result["p50"],
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold
+        })
+    return changes
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the audio generation engines")
+    parser.add_argument("--engines", nargs="+", default=["procedural", "numpy", "torch", "kernels"], choices=list(ENGINES))
+    parser.add_argument("--durations", nargs="+", type=float, default=[1.0, 3.0, 10.0], help="Clip lengths in seconds")
+    parser.add_argument("--types", nargs="+", help="Only these sound types / kernels")
+    parser.add_argument("--trials", type=int, default=10, help="Timed renders per case")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed renders before the trials")
+    parser.add_argument("--variants", type=int, default=1, help="Variants rendered per call")
+    parser.add_argument("-o", "--output", help="Write the JSON report here")
+    parser.add_argument("--compare", help="Baseline JSON report; exit 1 on p50 regressions")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="Relative p50 slowdown counted as a regression")
+    args = parser.parse_args(argv)
+
+    print(f"⏱️ Benchmarking {', '.join(args.engines)}: {args.trials} trials after {args.warmup} warm-up, "
+          f"{args.variants} variant(s) per render")
+    report = Benchmark(args.trials, args.warmup, args.variants).run(args.engines, args.durations, args.types)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        changes = compare(baseline, report, args.threshold)
+        regressions = [change for change in changes if change["regression"]]
+        print(f"\n📊 Against {args.compare} (commit {baseline['meta'].get('commit')}):")
+        for change in changes:
+            marker = "❌" if change["regression"] else "✅"
+            print(f"  {marker} {change['engine']:<10} {change['sound_type']:<13} {change['duration']:6.2f}s  "
+                  f"{change['baseline_p50'] * 1000:8.2f}ms -> {change['p50'] * 1000:8.2f}ms ({change['ratio']:.2f}x)")
+        if regressions:
+            print(f"⚠️ {len(regressions)} regression(s) over {args.threshold:.0%}")
+            return 1
+        print("🎉 No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+from typing import Callable, Dict, Hashable, Iterable, List, Optional
+
+import soundfile as sf
+
+from sound_types import classify_prompt
+
+# Clip lengths are rounded to this grid (seconds) before keying and rendering
+DURATION_BUCKET = 0.25
+
+# Function words that never change what a prompt sounds like. No sound type
+# or classifier keyword may appear here, so classification is unaffected.
+STOPWORDS = frozenset({
+    'a', 'an', 'the', 'and', 'or', 'of', 'in', 'on', 'at', 'to', 'for', 'from',
+    'with', 'by', 'into', 'onto', 'over', 'under', 'some', 'any', 'this', 'that',
+    'these', 'those', 'is', 'are', 'be', 'its', 'it', 'as', 'very', 'sound',
+    'sounds', 'noise', 'noises', 'audio', 'effect', 'effects'
+})
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def canonical_prompt(prompt: str) -> str:
+    """
+    Normal form of a prompt: lowercase, punctuation and extra whitespace
+    dropped, stopwords removed, remaining words deduplicated and sorted.
+    "Cozy  Tavern ", "the tavern, cozy" and "cozy tavern" all become "cozy tavern".
+    A prompt made only of stopwords keeps them rather than becoming empty.
+    """
+    tokens = _TOKEN.findall(prompt.lower())
+    words = [token for token in tokens if token not in STOPWORDS] or tokens
+    return " ".join(sorted(set(words)))
+
+
+def quantize_duration(duration: float, bucket: float = DURATION_BUCKET) -> float:
+    """Duration rounded to the nearest bucket (at least one bucket long)."""
+    return round(max(round(duration / bucket), 1) * bucket, 6)
+
+
+def synthesis_key(engine: str, sound_type: str, duration: float, seed: int) -> str:
+    """
+    Cache key for procedural engines, whose output depends only on the
+    classified sound type, the clip length and the seed. Every prompt that
+    classifies the same shares one file per seed and duration bucket.
+    """
+    return hashlib.md5(f"{engine}_{sound_type}_{quantize_duration(duration)}_{seed}".encode()).hexdigest()
+
+
+def write_cache_file(path: str, audio, sample_rate: int):
+    """
+    Write a rendered clip to its cache path atomically. Many prompts share
+    one cache file, so two renders may finish it at once; readers only
+    ever see a missing file or a complete one.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        sf.write(tmp_path, audio, sample_rate, format="WAV")
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# Session log replay (JSONL written by structured_logging)
+
+def _requests(events: Iterable[Dict]) -> List[Dict]:
+    """Generation requests from a session log: the finished cache-hit/miss events."""
+    return [event for event in events
+            if "cache_hit" in event and "prompt" in event and "duration" in event]
+
+
+def _seeds(event: Dict) -> range:
+    seed = event.get("seed", 0)
+    return range(seed, seed + event.get("variants", 1))
+
+
+def raw_key(event: Dict, seed: int) -> Hashable:
+    """The old key: the prompt string exactly as requested."""
+    return event.get("engine"), event["prompt"], event["duration"], event.get("sound_type"), seed
+
+
+def canonical_key(event: Dict, seed: int) -> Hashable:
+    """Canonical prompt and duration bucket (what a prompt-conditioned engine could key on)."""
+    return event.get("engine"), canonical_prompt(event["prompt"]), quantize_duration(event["duration"]), seed
+
+
+def parameter_key(event: Dict, seed: int) -> Hashable:
+    """What procedural synthesis actually depends on: type, duration bucket and seed."""
+    sound_type = event.get("sound_type") or classify_prompt(event["prompt"])
+    return event.get("engine"), sound_type, quantize_duration(event["duration"]), seed
+
+
+KEY_STRATEGIES: Dict[str, Callable[[Dict, int], Hashable]] = {
+    'raw': raw_key,
+    'canonical': canonical_key,
+    'parameters': parameter_key
+}
+
+
+def replay_hit_rate(events: Iterable[Dict], key: Callable[[Dict, int], Hashable]) -> Dict:
+    """
+    Replay a session's requests against an initially empty cache keyed by key.
+    Every variant is one lookup; the first lookup of a key renders it.
+    """
+    seen = set()
+    hits = lookups = 0
+    for event in _requests(events):
+        for seed in _seeds(event):
+            k = key(event, seed)
+            lookups += 1
+            if k in seen:
+                hits += 1
+            else:
+                seen.add(k)
+    return {
+        "lookups": lookups,
+        "hits": hits,
+        "renders": len(seen),
+        "hit_rate": hits / lookups if lookups else 0.0
+    }
+
+
+def load_events(path: str) -> List[Dict]:
+    """Events from a JSONL session log (lines that are not JSON are skipped)."""
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return events
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Cache hit rate of session logs under each key strategy")
+    parser.add_argument("logs", nargs="+", help="JSONL session logs (BARDS_FORGE_LOG_JSONL)")
+    args = parser.parse_args(argv)
+
+    events = [event for path in args.logs for event in load_events(path)]
+    requests = _requests(events)
+    if not requests:
+        print("❌ No generation requests found in the logs")
+        return 1
+
+    prompts = {event["prompt"] for event in requests}
+    print(f"📜 {len(requests)} requests, {len(prompts)} distinct prompts, "
+          f"{len({canonical_prompt(p) for p in prompts})} after canonicalization")
+    print(f"  {'key':<12} {'lookups':>8} {'hits':>8} {'renders':>8} {'hit rate':>9}")
+    for name, key in KEY_STRATEGIES.items():
+        stats = replay_hit_rate(requests, key)
+        print(f"  {name:<12} {stats['lookups']:>8} {stats['hits']:>8} {stats['renders']:>8} {stats['hit_rate']:>8.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
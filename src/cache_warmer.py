@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+
+from campaign_pipeline import format_progress, run_pipeline
+from generative_orchestrator import GenerativeOrchestrator
+from structured_logging import configure_logging
+
+
+def plan_cache(orchestrator: GenerativeOrchestrator) -> List[Dict]:
+    """
+    Every sound the orchestrator's loaded scenes can ask the generator for.
+
+    Beds and oneshots come from the orchestrator's compiled scenes, so
+    files and prompts (with their "<scene> ambient background" /
+    "<scene> oneshot" context prefix) are exactly the ones played, and the
+    cache paths come from the orchestrator's own generator. Oneshots cover
+    seeds 0 .. pool_size - 1, the seeds their variant pool renders.
+
+    Each entry is {"scene", "role", "prompt", "duration", "file", "paths"};
+    "file" is the pre-recorded file in use (paths is then empty), and an
+    entry with neither could not be generated at all.
+    """
+    generator = orchestrator.audio_generator
+    pools = orchestrator.variant_pools
+    oneshot_seeds = range(pools.pool_size if pools.enabled else 1)
+
+    entries = []
+    for scene_name in orchestrator.scenes:
+        scene = orchestrator.get_compiled_scene(scene_name)
+        sounds = [("bed", scene.bed, range(1))] + [("oneshot", oneshot, oneshot_seeds) for oneshot in scene.oneshots]
+
+        for role, sound, seeds in sounds:
+            entry = {"scene": scene_name, "role": role, "prompt": None, "file": None, "paths": [],
+                     "duration": sound.duration if sound else orchestrator.DEFAULT_DURATION}
+            if sound and sound.file:
+                entry["file"] = sound.file
+            elif sound and sound.prompt:
+                entry["prompt"] = sound.prompt
+                entry["paths"] = [generator.cache_path(sound.prompt, sound.duration, seed) for seed in seeds]
+            entries.append(entry)
+    return entries
+
+
+def coverage(entries: List[Dict]) -> Dict:
+    """
+    How much of a plan is ready: sounds (a oneshot counts once all its
+    variants exist) and distinct cache files, which many prompts share.
+    """
+    files = {path for entry in entries for path in entry["paths"]}
+    cached = {path for path in files if os.path.exists(path)}
+    ready = sum(1 for entry in entries
+                if entry["file"] or (entry["paths"] and all(path in cached for path in entry["paths"])))
+    return {
+        "sounds": len(entries),
+        "ready": ready,
+        "unresolved": sum(1 for entry in entries if not entry["file"] and not entry["paths"]),
+        "files": len(files),
+        "cached_files": len(cached),
+        "percent": 100.0 * ready / len(entries) if entries else 100.0
+    }
+
+
+_worker_generators: Dict[Tuple[type, str], object] = {}
+
+
+def _render_missing(item: Dict) -> Optional[str]:
+    """Render one (sound type, duration) job: all its missing seeds in one batched pass."""
+    key = (item["engine"], item["cache_dir"])
+    generator = _worker_generators.get(key)
+    if generator is None:
+        generator = _worker_generators[key] = item["engine"](cache_dir=item["cache_dir"])
+    paths = generator.generate_variants(item["prompt"], item["duration"], variants=item["variants"])
+    return paths[0] if len(paths) == item["variants"] else None
+
+
+def warm_cache(orchestrator: GenerativeOrchestrator, max_workers: Optional[int] = None,
+               on_progress: Optional[Callable[[Dict, Optional[str], Dict], None]] = None) -> Dict:
+    """
+    Render every missing sound of the loaded scenes with the orchestrator's
+    engine and return the coverage afterwards. CPU engines render on a
+    process pool; a GPU engine renders in this process, one job at a time,
+    since its batches already fill the device.
+
+    Prompts sharing a sound type and duration bucket share cache files,
+    so missing sounds are grouped into one job per file set, and each job
+    renders all the seeds it needs together.
+    """
+    generator = orchestrator.audio_generator
+    jobs: Dict[str, Dict] = {}
+    for entry in plan_cache(orchestrator):
+        missing = [path for path in entry["paths"] if not os.path.exists(path)]
+        if not missing:
+            continue
+        # Same type and duration bucket means the same seed 0 file
+        job = jobs.setdefault(entry["paths"][0], {"prompt": entry["prompt"], "duration": entry["duration"],
+                                                  "variants": 0, "engine": type(generator),
+                                                  "cache_dir": generator.cache_dir})
+        job["variants"] = max(job["variants"], len(entry["paths"]))
+
+    processes = generator.device == "cpu"
+    if not processes:
+        _worker_generators[(type(generator), generator.cache_dir)] = generator
+        max_workers = 1
+    for item, path, progress in run_pipeline(list(jobs.values()), _render_missing, max_workers, processes=processes):
+        if on_progress:
+            on_progress(item, path, progress)
+
+    return coverage(plan_cache(orchestrator))
+
+
+def print_report(entries: List[Dict], title: str):
+    """Per-scene coverage table and the overall totals."""
+    print(f"📋 {title}")
+    scene_names = list(dict.fromkeys(entry["scene"] for entry in entries))
+    width = max((len(name) for name in scene_names), default=0)
+    for scene_name in scene_names:
+        scene_entries = [entry for entry in entries if entry["scene"] == scene_name]
+        scene = coverage(scene_entries)
+        missing = [entry["prompt"] or "(no prompt or file)" for entry in scene_entries
+                   if not entry["file"] and not (entry["paths"] and all(os.path.exists(p) for p in entry["paths"]))]
+        status = "✅" if not missing else "⚠️"
+        print(f"  {status} {scene_name:<{width}} {scene['ready']}/{scene['sounds']} sounds ready")
+        for prompt in missing:
+            print(f"      missing: {prompt}")
+
+    total = coverage(entries)
+    print(f"📊 Coverage: {total['ready']}/{total['sounds']} sounds ({total['percent']:.1f}%), "
+          f"{total['cached_files']}/{total['files']} cache files")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Pre-render every generated sound of a scenes file into the cache")
+    parser.add_argument("--scenes", default="scenes_v2.json", help="Scenes JSON file")
+    parser.add_argument("--cache-dir", help="Generator cache directory (default: the orchestrator's)")
+    parser.add_argument("--workers", type=int, default=None, help="Render processes (default: CPU count)")
+    parser.add_argument("--check", action="store_true",
+                        help="Only report coverage; exit 1 unless every sound is ready")
+    parser.add_argument("--log-level", help="Console log level (default: WARNING)")
+    args = parser.parse_args(argv)
+
+    configure_logging(args.log_level)
+
+    orchestrator = GenerativeOrchestrator(audio_engine=None)
+    if args.cache_dir:
+        orchestrator.audio_generator.cache_dir = args.cache_dir
+        os.makedirs(args.cache_dir, exist_ok=True)
+    if not orchestrator.load_scenes_from_file(args.scenes):
+        return 1
+
+    before = coverage(plan_cache(orchestrator))
+    if not args.check and before["ready"] + before["unresolved"] < before["sounds"]:
+        print(f"🔥 Warming cache: {before['files'] - before['cached_files']} missing files")
+        warm_cache(orchestrator, args.workers,
+                   lambda item, path, progress: print(f"  {format_progress(progress)} "
+                                                      f"{'✅' if path else '❌'} {item['prompt']}"))
+
+    entries = plan_cache(orchestrator)
+    print_report(entries, f"Cache coverage for {args.scenes} ({orchestrator.audio_generator.cache_dir})")
+    after = coverage(entries)
+    return 0 if after["ready"] == after["sounds"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from cache_keys import canonical_prompt, quantize_duration
+from structured_logging import get_logger
+
+logger = get_logger("campaign_pipeline")
+
+
+def prompt_key(item: Dict) -> Hashable:
+    """Default job key: the canonical prompt and duration bucket."""
+    return canonical_prompt(item["prompt"]), quantize_duration(item["duration"])
+
+
+def plan_work(items: Iterable[Dict], key: Optional[Callable[[Dict], Hashable]] = None) -> List[Dict]:
+    """
+    Group work items (dicts with prompt and duration) into render jobs.
+
+    Items with the same key(item) share one job. The default key is the
+    canonical prompt and duration bucket - the same sound listed under two
+    categories, or "Wolf howling" next to "wolf howling". Engines that key
+    their cache more coarsely (procedural engines share one file per sound
+    type) should pass their own, e.g. the item's cache path, so no two jobs
+    render the same file. Jobs are ordered shortest clip first, then by
+    first appearance, so quick sounds land early and the ETA settles fast.
+    Each job is {"item": first item, "members": [all its items], "duration"}.
+    """
+    key = key or prompt_key
+    jobs: Dict[Hashable, Dict] = {}
+    for item in items:
+        job_key = key(item)
+        if job_key in jobs:
+            jobs[job_key]["members"].append(item)
+        else:
+            jobs[job_key] = {"item": item, "members": [item], "duration": float(item["duration"])}
+    order = {job_key: index for index, job_key in enumerate(jobs)}
+    return [jobs[job_key] for job_key in
+            sorted(jobs, key=lambda job_key: (quantize_duration(jobs[job_key]["duration"]), order[job_key]))]
+
+
+class ProgressTracker:
+    """
+    Items done and a throughput-based ETA. Throughput is measured in
+    seconds of audio rendered per wall-clock second, so one 30 s bed
+    counts for more remaining work than ten 1 s stingers.
+    """
+
+    def __init__(self, total_items: int, total_audio: float):
+        self.total_items = total_items
+        self.total_audio = total_audio
+        self.done_items = 0
+        self.done_audio = 0.0
+        self.failed = 0
+        self.start_time = time.time()
+
+    def update(self, items: int, audio: float, failed: int = 0) -> Dict:
+        self.done_items += items
+        self.done_audio += audio
+        self.failed += failed
+        return self.snapshot()
+
+    def snapshot(self) -> Dict:
+        elapsed = time.time() - self.start_time
+        rate = self.done_audio / elapsed if elapsed > 0 else 0.0
+        remaining = self.total_audio - self.done_audio
+        return {
+            "done": self.done_items,
+            "total": self.total_items,
+            "failed": self.failed,
+            "elapsed": elapsed,
+            "rate": rate,
+            "eta": remaining / rate if rate > 0 else None
+        }
+
+
+def format_progress(progress: Dict) -> str:
+    """[done/total] with throughput and ETA, e.g. "[7/15] 41.3x real-time, ETA 0:03"."""
+    eta = progress["eta"]
+    eta_text = "--:--" if eta is None else f"{int(eta) // 60}:{int(eta) % 60:02d}"
+    return f"[{progress['done']}/{progress['total']}] {progress['rate']:.1f}x real-time, ETA {eta_text}"
+
+
+def run_pipeline(items: Iterable[Dict], render: Callable[[Dict], Optional[str]],
+                 max_workers: Optional[int] = None, processes: bool = False,
+                 finish: Optional[Callable[[Dict, str], Optional[str]]] = None,
+                 key: Optional[Callable[[Dict], Hashable]] = None
+                 ) -> Iterator[Tuple[Dict, Optional[str], Dict]]:
+    """
+    Render work items on a worker pool, yielding (item, path, progress) for
+    every item as soon as its job completes.
+
+    render(item) runs once per deduplicated job (see plan_work; key picks
+    what counts as the same job) on the pool and returns a file path or None. finish(item, path), if given, runs in
+    the calling thread for every member item and returns its final path
+    (e.g. a copy into a sound pack), so callers can checkpoint each item
+    without any locking.
+
+    Threads are the default: the engines spend their time in NumPy/torch
+    kernels that release the GIL, and a GPU forge must stay in one process.
+    processes=True uses a process pool instead (render must be picklable).
+    """
+    jobs = plan_work(items, key)
+    if not jobs:
+        return
+
+    tracker = ProgressTracker(sum(len(job["members"]) for job in jobs), sum(job["duration"] for job in jobs))
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(jobs)))
+    logger.info("🏗️ Rendering %d items as %d jobs on %d worker(s)", tracker.total_items, len(jobs), workers,
+                extra={"items": tracker.total_items, "jobs": len(jobs), "workers": workers})
+
+    pool: Executor = ProcessPoolExecutor(workers) if processes else ThreadPoolExecutor(workers)
+    with pool:
+        futures = {pool.submit(render, job["item"]): job for job in jobs}
+        try:
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    path = future.result()
+                except Exception as e:
+                    logger.error("❌ Error generating '%s': %s", job["item"]["prompt"], e,
+                                 extra={"prompt": job["item"]["prompt"], "duration": job["duration"]})
+                    path = None
+
+                results = []
+                for item in job["members"]:
+                    item_path = path
+                    if path and finish:
+                        try:
+                            item_path = finish(item, path)
+                        except Exception as e:
+                            logger.error("❌ Error finishing '%s': %s", item["prompt"], e,
+                                         extra={"prompt": item["prompt"]})
+                            item_path = None
+                    results.append((item, item_path))
+
+                progress = tracker.update(len(results), job["duration"],
+                                          failed=sum(1 for _, item_path in results if not item_path))
+                for item, item_path in results:
+                    yield item, item_path, progress
+        finally:
+            # Stopped early (Ctrl+C or the consumer broke off): drop work not yet started
+            for future in futures:
+                future.cancel()
+
+    progress = tracker.snapshot()
+    logger.info("✅ Rendered %d items in %.3fs (%.1fx real-time)", progress["done"], progress["elapsed"],
+                progress["rate"], extra={"items": progress["done"], "failed": progress["failed"],
+                                         "latency": progress["elapsed"]})
@@ -0,0 +1,147 @@
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from granular import fft_size
+from synthesis_tables import SynthesisTables
+
+# Longer renders are streamed in overlap-add blocks instead of one giant FFT
+STREAM_SECONDS = 30.0
+
+
+class ColoredNoise:
+    """
+    Spectrally shaped noise in a single inverse FFT. A random complex
+    spectrum is multiplied by a magnitude response and normalized to unit
+    standard deviation in the frequency domain (Parseval), so a bed costs
+    one irfft instead of a time-domain filter plus mean/std passes.
+
+    Shapes combine multiplicatively:
+
+    - alpha: 1/f^alpha power law (0 white, 1 pink, 2 brown)
+    - lowpass: the one-pole low-pass y[n] = a*x[n] + (1-a)*y[n-1] with
+      a = lowpass / sample_rate, as used by the procedural generators
+    - highpass: the first difference x[n] - x[n-1]
+    - band: (center, width) Gaussian band in Hz
+
+    Several shapes can be layered as if independent unit-variance noises
+    were summed; the sum still takes one FFT. Long renders are streamed
+    in overlap-add blocks through a windowed FIR version of the response.
+    """
+
+    def __init__(self, sample_rate: int = 44100, tables: Optional[SynthesisTables] = None):
+        self.sample_rate = sample_rate
+        self.tables = tables
+        self._lock = threading.Lock()
+        self._responses: Dict[Tuple, np.ndarray] = {}
+
+    # Responses
+
+    def response(self, samples: int, alpha: float = 0.0, lowpass: Optional[float] = None,
+                 highpass: bool = False, band: Optional[Tuple[float, float]] = None) -> np.ndarray:
+        """Magnitude per rfft bin for a clip of samples (cached, read-only; DC and Nyquist are zero)."""
+        key = (samples, alpha, lowpass, highpass, band)
+        table = self._responses.get(key)
+        if table is not None:
+            return table
+
+        freqs = np.fft.rfftfreq(samples, 1 / self.sample_rate)
+        omega = 2 * np.pi * freqs / self.sample_rate
+        magnitude = np.ones_like(freqs)
+        if alpha:
+            magnitude[1:] = freqs[1:] ** (-alpha / 2)
+        if lowpass is not None:
+            a = lowpass / self.sample_rate
+            magnitude *= a / np.abs(1 - (1 - a) * np.exp(-1j * omega))
+        if highpass:
+            magnitude *= 2 * np.abs(np.sin(omega / 2))
+        if band is not None:
+            center, width = band
+            magnitude *= np.exp(-0.5 * ((freqs - center) / width) ** 2)
+
+        magnitude[0] = 0.0
+        if samples % 2 == 0:
+            magnitude[-1] = 0.0
+        magnitude.flags.writeable = False
+
+        with self._lock:
+            return self._responses.setdefault(key, magnitude)
+
+    def layered(self, samples: int, layers: List[Dict]) -> np.ndarray:
+        """
+        Response of independent unit-variance noises, one per shape in layers, summed.
+        Each layer's power is normalized, so the sum has len(layers) times unit variance.
+        """
+        power = np.zeros(samples // 2 + 1)
+        for shape in layers:
+            layer = self.response(samples, **shape)
+            power += layer ** 2 / max(np.sum(layer ** 2), 1e-300)
+        return np.sqrt(power)
+
+    # Generation
+
+    def generate(self, rngs: List[np.random.Generator], samples: int, volume: float = 1.0,
+                 channels: Optional[int] = None, layers: Optional[List[Dict]] = None, **shape) -> np.ndarray:
+        """
+        Shaped noise with unit standard deviation times volume.
+        Returns (variants, samples), or (variants, channels, samples) when channels is given.
+        Each variant only consumes its own generator, so batched equals single.
+        """
+        if samples > STREAM_SECONDS * self.sample_rate:
+            return np.stack([
+                np.concatenate(list(self.stream(rng, samples, channels=channels or 1, layers=layers, **shape)), axis=-1)
+                for rng in rngs
+            ]).reshape(self._shape(len(rngs), channels, samples)) * volume
+
+        magnitude = self.layered(samples, layers) if layers else self.response(samples, **shape)
+        rows = len(rngs) * (channels or 1)
+        bins = len(magnitude)
+
+        spectrum = np.empty((rows, bins), dtype=np.complex128)
+        parts = spectrum.view(np.float64).reshape(rows, bins, 2)
+        for row, rng in enumerate(rng for rng in rngs for _ in range(channels or 1)):
+            parts[row] = self._white(rng, 2 * bins).reshape(bins, 2)
+        spectrum *= magnitude
+
+        # Parseval: with DC and Nyquist at zero, variance = 2 * sum|X|^2 / N^2
+        power = 2 * np.sum(spectrum.real ** 2 + spectrum.imag ** 2, axis=1, keepdims=True) / samples ** 2
+        spectrum *= volume / np.sqrt(np.maximum(power, 1e-300))
+
+        return np.fft.irfft(spectrum, samples).reshape(self._shape(len(rngs), channels, samples))
+
+    def stream(self, rng: np.random.Generator, samples: int, block: int = 1 << 16, kernel: int = 1 << 13,
+               channels: int = 1, layers: Optional[List[Dict]] = None, **shape) -> Iterator[np.ndarray]:
+        """
+        Yield (channels, block) chunks of shaped unit-variance noise, samples in total,
+        by overlap-adding white noise through a Hann-windowed FIR of the response.
+        Shaping below sample_rate / kernel Hz is lost to the kernel length.
+        """
+        magnitude = self.layered(kernel, layers) if layers else self.response(kernel, **shape)
+        impulse = np.roll(np.fft.irfft(magnitude, kernel), kernel // 2) * np.hanning(kernel)
+        impulse /= np.sqrt(max(np.sum(impulse ** 2), 1e-300))
+
+        size = fft_size(block + kernel - 1)
+        transfer = np.fft.rfft(impulse, size)
+        tail = np.zeros((channels, kernel - 1))
+
+        # Warm-up block so the first output samples already see a full kernel of history
+        produced = -kernel
+        while produced < samples:
+            length = kernel if produced < 0 else min(block, samples - produced)
+            white = np.stack([self._white(rng, length) for _ in range(channels)])
+            mixed = np.fft.irfft(np.fft.rfft(white, size) * transfer, size)[:, :length + kernel - 1]
+            mixed[:, :kernel - 1] += tail
+            tail = mixed[:, length:].copy()
+            if produced >= 0:
+                yield mixed[:, :length]
+            produced += length
+
+    def _white(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        if self.tables is not None:
+            return self.tables.noise(rng, count)
+        return rng.standard_normal(count)
+
+    @staticmethod
+    def _shape(variants: int, channels: Optional[int], samples: int) -> Tuple[int, ...]:
+        return (variants, samples) if channels is None else (variants, channels, samples)
@@ -1,10 +1,27 @@
 import json
+import logging
 import random
 import time
 import os
-from typing import Optional, Dict, Any, List
-from audio_engine import AudioEngine
-from audio_generator import AudioGenerator
+from typing import Optional, Dict, List, TYPE_CHECKING
+from cpu_audio_generator import create_audio_generator
+from metrics import metrics
+from scene_compiler import (DEFAULT_DURATION, CompiledScene, CompiledSound, load_compiled_scenes,
+                            resolve_prompt)
+from sound_pack import sound_exists
+from structured_logging import get_logger
+from oneshot_scheduler import OneshotScheduler
+from scene_transition import SceneTransitionEngine
+from spatializer import Spatializer
+from variant_pool import VariantPoolManager, accepts_seed
+
+if TYPE_CHECKING:
+    from audio_engine import AudioEngine
+
+logger = get_logger("orchestrator")
+
+# Where generated sounds are cached, whichever engine renders them
+GENERATED_CACHE_DIR = "./generated_audio_cache"
 
 
 class GenerativeOrchestrator:
@@ -13,19 +30,47 @@ class GenerativeOrchestrator:
     V1.0 - The Generative Leap
     """
     
-    def __init__(self, audio_engine: AudioEngine):
+    # Clip length for generated sounds whose config gives no 'duration'
+    DEFAULT_DURATION = DEFAULT_DURATION
+    
+    def __init__(self, audio_engine: Optional["AudioEngine"], crossfade_time: float = 3.0,
+                 variant_pool_size: int = 4, max_variant_pool_mb: float = 64.0):
         self.audio_engine = audio_engine
-        self.audio_generator = AudioGenerator()
         self.scenes = {}
+        self.compiled: Dict[str, CompiledScene] = {}
         self.current_scene = None
         self.active_scene_data = None
+        self.active_scene: Optional[CompiledScene] = None
         self.bed_channel = None
+        self.scene_files = set()
+        self.transitions = SceneTransitionEngine(audio_engine, crossfade_time)
+        self.scheduler = OneshotScheduler()
+        self.spatializer = Spatializer()
+        self.variant_pools = VariantPoolManager(
+            self._render_variant,
+            pool_size=variant_pool_size,
+            max_pool_mb=max_variant_pool_mb,
+            on_evict=self._release_variant
+        )
+        # NumPy engine, or the torch engine when a CUDA GPU is present
+        self.audio_generator = create_audio_generator(GENERATED_CACHE_DIR)
         self.last_update_time = time.time()
         self.generation_enabled = True
         
         print("🚀 Generative Orchestrator V1.0 initialized")
         print(f"📊 Cache info: {self.audio_generator.get_cache_info()}")
     
+    @property
+    def audio_generator(self):
+        return self._audio_generator
+    
+    @audio_generator.setter
+    def audio_generator(self, generator):
+        """Engines can be swapped (the neural forge); variant pools need one that renders seeds."""
+        self._audio_generator = generator
+        if not accepts_seed(generator.generate_sound, "", 1.0, seed=0):
+            self.variant_pools.disable(f"{type(generator).__name__} has no seed support")
+    
     def _validate_scenes(self, scenes_data: Dict) -> bool:
         """Validates scene data, allowing for generated audio fallbacks."""
         is_valid = True
@@ -34,28 +79,40 @@ class GenerativeOrchestrator:
             
             # If file exists, use it; otherwise we can generate
             if "file" in bed_info and bed_info["file"]:
-                if not os.path.exists(bed_info["file"]):
+                if not sound_exists(bed_info["file"]):
                     print(f"Info: Bed file not found for scene '{scene_name}': {bed_info['file']} (will generate)")
             
             # Validate oneshots (can be generated if missing)
             for oneshot in data.get("oneshots", []):
                 if "file" in oneshot and oneshot["file"]:
-                    if not os.path.exists(oneshot["file"]):
+                    if not sound_exists(oneshot["file"]):
                         print(f"Info: Oneshot file not found for scene '{scene_name}': {oneshot['file']} (will generate)")
+                
+                # Placement is optional: pan in [-1, 1], distance >= 0 (number or [min, max]);
+                # a bad value is dropped so the oneshot plays unplaced instead of failing when it fires
+                for key, low, high in [("pan", -1.0, 1.0), ("distance", 0.0, float("inf"))]:
+                    if key not in oneshot:
+                        continue
+                    bounds = Spatializer.parse_range(oneshot[key])
+                    if bounds is None or not (low <= bounds[0] and bounds[1] <= high):
+                        print(f"Warning: Oneshot '{key}' invalid in scene '{scene_name}': {oneshot[key]} (ignored)")
+                        del oneshot[key]
+                        is_valid = False
         
         return is_valid
     
     def load_scenes_from_file(self, filepath: str) -> bool:
-        """Load scenes from JSON file."""
+        """
+        Load scenes from JSON file, compiled for playback.
+        An unchanged file loads from its compiled sidecar without validating
+        or resolving anything again.
+        """
         try:
-            with open(filepath, 'r') as f:
-                scenes_data = json.load(f)
-            
-            self._validate_scenes(scenes_data)
-            self.scenes = scenes_data
-            print(f"✅ Loaded {len(self.scenes)} scenes from {filepath}")
+            self.scenes, self.compiled, from_sidecar = load_compiled_scenes(filepath, self._validate_scenes)
+            source = " (compiled)" if from_sidecar else ""
+            print(f"✅ Loaded {len(self.scenes)} scenes from {filepath}{source}")
             return True
-            
+        
         except FileNotFoundError:
             print(f"❌ Error: Scenes file not found: {filepath}")
             return False
@@ -63,142 +120,247 @@ class GenerativeOrchestrator:
             print(f"❌ Error parsing scenes file: {e}")
             return False
     
+    _resolve_prompt = staticmethod(resolve_prompt)
+    
+    def get_compiled_scene(self, scene_name: str) -> CompiledScene:
+        """The compiled form of a loaded scene (compiled here if scenes were assigned directly)."""
+        data = self.scenes[scene_name]
+        scene = self.compiled.get(scene_name)
+        if scene is None or scene.data is not data:
+            scene = self.compiled[scene_name] = CompiledScene(scene_name, data)
+        return scene
+    
+    def _generate_file(self, prompt: str, duration: float) -> Optional[str]:
+        """Generate (or fetch from the cache) the audio for a resolved prompt."""
+        if not self.generation_enabled or not prompt:
+            return None
+        
+        logger.info("🎵 Generating audio for: '%s'", prompt, extra={"prompt": prompt, "duration": duration})
+        generated_file = self.audio_generator.generate_sound(prompt, duration)
+        if not generated_file:
+            logger.warning("⚠️ Failed to generate audio for '%s'", prompt, extra={"prompt": prompt})
+        return generated_file
+    
     def _get_audio_file(self, audio_config: Dict, context: str = "") -> Optional[str]:
         """
         Get audio file path, generating if needed.
         audio_config can have 'file' and/or 'prompt' fields.
         """
         # Try to use existing file first
-        if "file" in audio_config and os.path.exists(audio_config["file"]):
+        if "file" in audio_config and sound_exists(audio_config["file"]):
             return audio_config["file"]
         
         # Generate audio if we have a prompt or can infer one
-        if self.generation_enabled:
-            prompt = audio_config.get("prompt", "")
-            
-            # If no prompt but we have a broken file path, try to infer from filename
-            if not prompt and "file" in audio_config:
-                filename = os.path.basename(audio_config["file"])
-                prompt = filename.replace("_", " ").replace(".wav", "").replace(".mp3", "")
-            
-            # Add context to prompt
-            if context and prompt:
-                prompt = f"{context} {prompt}"
-            elif context and not prompt:
-                prompt = context
-            
-            if prompt:
-                duration = audio_config.get("duration", 3.0)
-                sound_type = audio_config.get("type", "ambient")
-                
-                print(f"🎵 Generating audio for: '{prompt}'")
-                generated_file = self.audio_generator.generate_sound(prompt, duration)
-                
-                if generated_file:
-                    return generated_file
-                else:
-                    print(f"⚠️ Failed to generate audio for '{prompt}'")
+        if not self.generation_enabled:
+            return None
+        return self._generate_file(self._resolve_prompt(audio_config, context),
+                                   audio_config.get("duration", self.DEFAULT_DURATION))
+    
+    def _get_compiled_file(self, sound: Optional[CompiledSound]) -> Optional[str]:
+        """Like _get_audio_file, with the file and prompt already resolved at load."""
+        if sound is None:
+            return None
+        if sound.file:
+            return sound.file
+        return self._generate_file(sound.prompt, sound.duration)
+    
+    def _render_variant(self, prompt: str, duration: float, seed: int) -> Optional[str]:
+        """Render one seed variant of a oneshot (runs on the variant pool worker)."""
+        return self.audio_generator.generate_sound(prompt, duration, seed=seed)
+    
+    def _release_variant(self, filepath: str):
+        """Free the decoded copy of an evicted variant."""
+        if self.audio_engine:
+            self.audio_engine.release_sound(filepath)
+    
+    def _prime_variant_pools(self, oneshots: List[CompiledSound]):
+        """Start background variant rendering for a scene's generated oneshots."""
+        if not self.generation_enabled:
+            return
+        for oneshot in oneshots:
+            if not oneshot.file and oneshot.prompt:
+                self.variant_pools.prime(oneshot.pool_prompt, oneshot.pool_duration)
+    
+    def _get_oneshot_file(self, oneshot: CompiledSound) -> Optional[str]:
+        """
+        Get the file for a oneshot trigger.
+        Generated oneshots rotate through their variant pool. While a pool is
+        still empty the trigger is skipped rather than generating on the
+        live path; the pool worker fills it in the background.
+        """
+        # Pre-recorded files always win
+        if oneshot.file:
+            return oneshot.file
+        if not self.generation_enabled:
+            return None
+        
+        if self.variant_pools.enabled:
+            variant = self.variant_pools.pick(oneshot.pool_prompt, oneshot.pool_duration)
+            if variant is None:
+                metrics.inc("orchestrator_oneshots_skipped_total")
+            return variant
         
-        return None
+        # No pools (pool size 1, or a generator without seeds): nothing renders in the background
+        return self._generate_file(oneshot.prompt, oneshot.duration)
+    
+    def _activate_scene(self, scene: CompiledScene):
+        """Make a compiled scene the one whose oneshots are scheduled."""
+        self.current_scene = scene.name
+        self.active_scene_data = scene.data
+        self.active_scene = scene
+        self.scheduler.reset(scene.oneshots, time.time(), scene.rates)
+        self._prime_variant_pools(scene.oneshots)
     
     def play_scene(self, scene_name: str) -> bool:
-        """Play a scene using both pre-recorded and generated audio."""
+        """
+        Play a scene using both pre-recorded and generated audio.
+        If a bed is already playing, the new scene is prepared in the
+        background and crossfaded in instead of cutting to silence.
+        """
         if scene_name not in self.scenes:
             print(f"❌ Error: Scene '{scene_name}' not found")
             return False
         
+        scene = self.get_compiled_scene(scene_name)
+        if scene.bed is None:
+            print(f"⚠️ Warning: No bed sound configured for scene: {scene_name}")
+            return False
+        
+        if self.bed_channel is not None and self.transitions.crossfade_time > 0:
+            print(f"🎬 Transitioning to scene: {scene_name}")
+            self.transitions.start(
+                scene_name,
+                lambda: self._get_compiled_file(scene.bed),
+                scene.bed_volume,
+                self.bed_channel,
+                self.scene_files
+            )
+            return True
+        
         print(f"🎬 Starting scene: {scene_name}")
         
-        # Stop current scene
+        # Nothing to crossfade from: stop and start cold
+        self.transitions.cancel()
         self.audio_engine.stop_all_sounds()
         
         # Load new scene
-        self.current_scene = scene_name
-        self.active_scene_data = self.scenes[scene_name]
+        self.scene_files = set()
+        self._activate_scene(scene)
         
         # Play bed sound (background ambiance)
-        bed_info = self.active_scene_data.get("bed", {})
-        if bed_info:
-            bed_file = self._get_audio_file(bed_info, f"{scene_name} ambient background")
-            
-            if bed_file:
-                bed_volume = bed_info.get("volume", 0.7)
-                self.bed_channel = self.audio_engine.play_sound(bed_file, loop=True, volume=bed_volume)
-                print(f"✅ Scene '{scene_name}' started with audio: {os.path.basename(bed_file)}")
-                return True
-            else:
-                print(f"⚠️ Warning: Could not load or generate bed sound for scene: {scene_name}")
-                return False
+        bed_file = self._get_compiled_file(scene.bed)
+        
+        if bed_file:
+            self.bed_channel = self.audio_engine.play_sound(bed_file, loop=True, volume=scene.bed_volume)
+            self.scene_files.add(bed_file)
+            print(f"✅ Scene '{scene_name}' started with audio: {os.path.basename(bed_file)}")
+            return True
         else:
-            print(f"⚠️ Warning: No bed sound configured for scene: {scene_name}")
+            print(f"⚠️ Warning: Could not load or generate bed sound for scene: {scene_name}")
             return False
     
+    def set_crossfade_time(self, seconds: float):
+        """Set the scene crossfade length (0 restores hard cuts)."""
+        self.transitions.crossfade_time = max(0.0, seconds)
+        print(f"🔧 Scene crossfade set to {self.transitions.crossfade_time:.1f}s")
+    
     def update(self):
         """Update the orchestrator, handling both pre-recorded and generated oneshots."""
-        if not self.current_scene or not self.active_scene_data:
+        with metrics.timer("orchestrator_tick_seconds"):
+            self._tick()
+    
+    def _tick(self):
+        """One orchestrator update: crossfades, then any oneshots that are due."""
+        # Advance any scene crossfade; switch scenes the moment the new bed starts
+        started = self.transitions.update()
+        if started:
+            self.bed_channel = started.new_channel
+            # The old scene's set stays with the transition, which releases it after the fade
+            self.scene_files = started.new_files
+            self._activate_scene(self.get_compiled_scene(started.scene_name))
+            print(f"✅ Scene '{started.scene_name}' fading in: {os.path.basename(started.bed_file)}")
+        
+        scene = self.active_scene
+        if not self.current_scene or scene is None:
             return
         
         current_time = time.time()
-        delta_time = current_time - self.last_update_time
         self.last_update_time = current_time
         
-        # Process one-shots
-        oneshots = self.active_scene_data.get("oneshots", [])
-        for oneshot in oneshots:
-            prob_per_sec = oneshot.get("prob_per_sec", 0)
+        # Process one-shots that the scheduler says are due (indices into the compiled scene's tables)
+        for index in self.scheduler.due_indices(current_time):
+            oneshot = scene.oneshots[index]
+            # Get the oneshot audio file (variant pool first, generate if needed)
+            oneshot_file = self._get_oneshot_file(oneshot)
             
-            # Calculate probability for this frame based on delta time
-            frame_probability = prob_per_sec * delta_time
-            
-            if random.random() < frame_probability:
-                # Get the oneshot audio file (generate if needed)
-                oneshot_file = self._get_audio_file(oneshot, f"{self.current_scene} oneshot")
+            if oneshot_file:
+                # Same draw as random.uniform(volume_min, volume_max)
+                volume = scene.volume_min.item(index) + scene.volume_span.item(index) * random.random()
+                
+                # Placed oneshots pan through the channel's left/right gains
+                stereo_volume = None
+                if oneshot.spatial:
+                    stereo_volume = self.spatializer.gains(*self.spatializer.draw_position(scene.placement[index]))
                 
-                if oneshot_file:
-                    volume_min = oneshot.get("volume_min", 0.5)
-                    volume_max = oneshot.get("volume_max", 1.0)
-                    volume = random.uniform(volume_min, volume_max)
-                    
-                    self.audio_engine.play_sound(oneshot_file, loop=False, volume=volume)
-                    print(f"🔊 Playing oneshot: {os.path.basename(oneshot_file)}")
+                self.audio_engine.play_sound(oneshot_file, loop=False, volume=volume, stereo_volume=stereo_volume)
+                self.scene_files.add(oneshot_file)
+                metrics.inc("orchestrator_oneshots_total")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("🔊 Playing oneshot: %s", os.path.basename(oneshot_file),
+                                 extra={"scene": self.current_scene, "prompt": oneshot.prompt,
+                                        "file": oneshot_file, "volume": volume, "stereo_volume": stereo_volume})
     
     def generate_scene_on_demand(self, scene_description: str, duration: float = 30.0) -> bool:
         """
         Generate a complete scene on-demand from a text description.
         This is the ultimate V1.0 feature!
+        Blocks while the bed renders; the live loop runs the two halves,
+        prepare_scene_on_demand() and activate_generated_scene(), separately.
+        """
+        return self.activate_generated_scene(self.prepare_scene_on_demand(scene_description, duration))
+    
+    def prepare_scene_on_demand(self, scene_description: str, duration: float = 30.0) -> Optional[str]:
+        """
+        Render the bed for an on-demand scene and return its file.
+        Touches only the generator, so it is safe to run on a worker thread
+        while the loop keeps ticking the current scene.
         """
         print(f"🎭 Generating scene on-demand: '{scene_description}'")
         
-        # Stop current scene
-        self.audio_engine.stop_all_sounds()
-        
         # Generate background ambiance
         print("🎵 Generating background ambiance...")
-        bed_file = self.audio_generator.generate_sound(
+        return self.audio_generator.generate_sound(
             f"ambient background {scene_description}", 
-            duration=duration, 
-            sound_type="ambient"
+            duration=duration
         )
-        
-        if bed_file:
-            self.bed_channel = self.audio_engine.play_sound(bed_file, loop=True, volume=0.6)
-            print(f"✅ Generated scene background: {os.path.basename(bed_file)}")
-            
-            # Set up dynamic generation context
-            self.current_scene = f"generated_{int(time.time())}"
-            self.active_scene_data = {
-                "bed": {"file": bed_file, "volume": 0.6},
-                "oneshots": []
-            }
-            
-            return True
-        else:
+    
+    def activate_generated_scene(self, bed_file: Optional[str]) -> bool:
+        """Stop the current scene and play a prepared on-demand bed (call on the loop thread)."""
+        if not bed_file:
             print("❌ Failed to generate scene background")
             return False
+        
+        # Stop current scene
+        self.transitions.cancel()
+        self.audio_engine.stop_all_sounds()
+        
+        # Swap scheduler and scene together, so no tick sees indices from the old scene
+        self.scheduler.clear()
+        self.current_scene = f"generated_{int(time.time())}"
+        self.active_scene_data = {
+            "bed": {"file": bed_file, "volume": 0.6},
+            "oneshots": []
+        }
+        self.active_scene = CompiledScene(self.current_scene, self.active_scene_data)
+        
+        self.bed_channel = self.audio_engine.play_sound(bed_file, loop=True, volume=0.6)
+        self.scene_files = {bed_file}
+        print(f"✅ Generated scene background: {os.path.basename(bed_file)}")
+        return True
     
     def add_dynamic_oneshot(self, sound_description: str, probability: float = 0.05):
         """Add a dynamically generated oneshot to the current scene."""
-        if not self.active_scene_data:
+        if not self.active_scene_data or self.active_scene is None:
             print("❌ No active scene to add oneshot to")
             return
         
@@ -212,6 +374,9 @@ class GenerativeOrchestrator:
         }
         
         self.active_scene_data["oneshots"].append(oneshot_config)
+        oneshot = self.active_scene.add_oneshot(oneshot_config)
+        self.scheduler.add(oneshot, time.time(), probability)
+        self._prime_variant_pools([oneshot])
         print(f"➕ Added dynamic oneshot: '{sound_description}'")
     
     def set_generation_enabled(self, enabled: bool):
@@ -232,20 +397,28 @@ class GenerativeOrchestrator:
     
     def stop_current_scene(self):
         """Stop the current scene."""
+        self.transitions.cancel()
         self.audio_engine.stop_all_sounds()
         self.current_scene = None
         self.active_scene_data = None
+        self.active_scene = None
         self.bed_channel = None
+        self.scene_files = set()
+        self.scheduler.clear()
         print("🛑 Scene stopped")
     
     def get_generation_stats(self) -> Dict:
         """Get statistics about audio generation."""
         cache_info = self.audio_generator.get_cache_info()
+        pool_stats = self.variant_pools.get_stats()
         return {
             "cache_files": cache_info["files"],
             "cache_size_mb": cache_info["size_mb"],
             "generation_enabled": self.generation_enabled,
-            "current_scene": self.current_scene
+            "current_scene": self.current_scene,
+            "variant_pools": pool_stats["pools"],
+            "variants": pool_stats["variants"],
+            "variant_pool_mb": pool_stats["size_mb"]
         }
     
     def clear_generated_cache(self):
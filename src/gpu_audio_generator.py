@@ -4,25 +4,42 @@ import torch
 import numpy as np
 import time
 import os
-import hashlib
-import soundfile as sf
-from typing import Optional, List, Dict
+from typing import Callable, Optional, List, Dict, Tuple
 import warnings
+from sound_types import SOUND_TYPES, classify_prompt
+from tensor_pool import TensorBufferPool
+from granular import fft_size
+from cache_keys import quantize_duration, synthesis_key, write_cache_file
+from loudness import analyze, get_index
+from metrics import metrics
+from structured_logging import get_logger
 
 # Suppress CUDA compatibility warnings for RTX 5090
 warnings.filterwarnings("ignore", category=UserWarning, message=".*CUDA capability sm_120.*")
 
+logger = get_logger("gpu_audio_generator")
+
 class RTX5090AudioGenerator:
     """
     GPU-Accelerated Audio Generator specifically optimized for RTX 5090
     Uses pure PyTorch tensor operations for maximum GPU utilization
     """
     
-    def __init__(self, cache_dir: str = "./rtx5090_audio_cache"):
+    def __init__(self, cache_dir: str = "./rtx5090_audio_cache", compile_kernels: bool = False,
+                 compile_bucket: float = 0.5, max_compiled: int = 32):
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         self.cache_dir = cache_dir
         self.sample_rate = 44100
         
+        # Optional torch.compile path (see _kernel)
+        self.compile_kernels = compile_kernels and hasattr(torch, "compile")
+        self.compile_bucket = compile_bucket
+        self.max_compiled = max_compiled
+        self._compiled: Dict[Tuple[str, int, int], Callable] = {}
+        
+        # Per-event Python loops graph-break on every draw; compiling them only adds guard overhead
+        self.eager_types = {'tavern', 'fire', 'water', 'magic', 'combat'}
+        
         print(f"🔥 RTX 5090 Audio Generator initializing...")
         print(f"🎯 Device: {self.device}")
         
@@ -34,10 +51,10 @@ class RTX5090AudioGenerator:
             torch.backends.cudnn.benchmark = True
             torch.backends.cudnn.deterministic = False
             
-            # Test GPU functionality
+            # Test GPU functionality (a single tiny kernel launch is enough
+            # to catch an unsupported architecture)
             try:
-                test_tensor = torch.randn(1000, 1000, device=self.device)
-                _ = torch.mm(test_tensor, test_tensor)
+                _ = (torch.zeros(1, device=self.device) + 1).item()
                 print("🚀 RTX 5090 tensor operations: WORKING!")
             except Exception as e:
                 print(f"❌ GPU test failed: {e}")
@@ -45,146 +62,171 @@ class RTX5090AudioGenerator:
         
         os.makedirs(cache_dir, exist_ok=True)
         
+        # Reused work buffers (bucketed by length), time axes and fade ramps
+        self.pool = TensorBufferPool(self.device)
+        
         # Sound type classification
-        self.sound_types = {
-            'tavern': 0, 'fire': 1, 'water': 2, 'wind': 3, 'forest': 4,
-            'footsteps': 5, 'magic': 6, 'combat': 7, 'ambient': 8,
-            'dungeon': 9, 'thunder': 10, 'bell': 11, 'voice': 12,
-            'mechanical': 13, 'animal': 14, 'unknown': 15
+        self.sound_types = dict(SOUND_TYPES)
+        
+        # Every sound type has its own batched kernel
+        self.kernels: Dict[str, Callable[[float, List[torch.Generator]], torch.Tensor]] = {
+            'tavern': self._generate_gpu_tavern,
+            'fire': self._generate_gpu_fire,
+            'water': self._generate_gpu_water,
+            'wind': self._generate_gpu_wind,
+            'forest': self._generate_gpu_forest,
+            'footsteps': self._generate_gpu_footsteps,
+            'magic': self._generate_gpu_magic,
+            'combat': self._generate_gpu_combat,
+            'ambient': self._generate_gpu_ambient,
+            'dungeon': self._generate_gpu_dungeon,
+            'thunder': self._generate_gpu_thunder,
+            'bell': self._generate_gpu_bell,
+            'voice': self._generate_gpu_voice,
+            'mechanical': self._generate_gpu_mechanical,
+            'animal': self._generate_gpu_animal,
+            'unknown': self._generate_gpu_unknown
         }
         
+        if self.compile_kernels:
+            # One compiled graph set per bucket; dynamo must be allowed to keep them all
+            limit = "recompile_limit" if hasattr(torch._dynamo.config, "recompile_limit") else "cache_size_limit"
+            setattr(torch._dynamo.config, limit, max(getattr(torch._dynamo.config, limit), max_compiled))
+            graphs = " + CUDA graphs" if self.device == "cuda" else ""
+            print(f"🧩 Compiled kernels enabled (torch.compile{graphs}, {compile_bucket:g}s buckets)")
+        
         print(f"✅ RTX 5090 Audio Generator ready!")
     
     def _classify_prompt(self, prompt: str) -> str:
         """Classify prompt to determine sound type."""
-        prompt_lower = prompt.lower()
-        
-        # Direct keyword matching
-        for sound_type in self.sound_types:
-            if sound_type in prompt_lower:
-                return sound_type
-        
-        # Semantic matching
-        if any(word in prompt_lower for word in ['cozy', 'warm', 'inn', 'pub', 'drinking', 'ale', 'beer']):
-            return 'tavern'
-        elif any(word in prompt_lower for word in ['flame', 'crackling', 'hearth', 'bonfire']):
-            return 'fire'
-        elif any(word in prompt_lower for word in ['stream', 'river', 'rain', 'drops', 'splash']):
-            return 'water'
-        elif any(word in prompt_lower for word in ['breeze', 'gust', 'howling', 'rustling']):
-            return 'wind'
-        elif any(word in prompt_lower for word in ['trees', 'woods', 'nature', 'wilderness', 'leaves']):
-            return 'forest'
-        elif any(word in prompt_lower for word in ['step', 'walk', 'boot', 'march']):
-            return 'footsteps'
-        elif any(word in prompt_lower for word in ['spell', 'mystical', 'enchanted', 'arcane', 'shimmer']):
-            return 'magic'
-        elif any(word in prompt_lower for word in ['sword', 'metal', 'clash', 'battle', 'fight']):
-            return 'combat'
-        elif any(word in prompt_lower for word in ['cave', 'underground', 'damp', 'echo']):
-            return 'dungeon'
-        elif any(word in prompt_lower for word in ['storm', 'rumble', 'lightning']):
-            return 'thunder'
-        elif any(word in prompt_lower for word in ['chime', 'toll', 'ring']):
-            return 'bell'
-        elif any(word in prompt_lower for word in ['whisper', 'voice', 'speak', 'call']):
-            return 'voice'
-        elif any(word in prompt_lower for word in ['gear', 'machine', 'click', 'mechanical']):
-            return 'mechanical'
-        elif any(word in prompt_lower for word in ['bird', 'owl', 'howl', 'roar', 'chirp']):
-            return 'animal'
-        else:
-            return 'ambient'
-    
-    def _generate_gpu_tavern(self, duration: float) -> torch.Tensor:
+        return classify_prompt(prompt)
+    
+    def _make_generators(self, seeds: List[int]) -> List[torch.Generator]:
+        """Create an independent torch.Generator for each seed, on the target device."""
+        return [torch.Generator(device=self.device).manual_seed(seed) for seed in seeds]
+    
+    def _randn(self, gens: List[torch.Generator], samples: int) -> torch.Tensor:
+        """Draw white noise with the batched layout (variants, samples), into a pooled buffer."""
+        noise = self.pool.take(len(gens), samples)
+        for row, g in enumerate(gens):
+            torch.randn(samples, generator=g, device=self.device, out=noise[row])
+        return noise
+    
+    def _randint(self, g: torch.Generator, low: int, high: int) -> int:
+        """Draw a single integer from one variant's generator."""
+        return torch.randint(low, high, (1,), generator=g, device=self.device).item()
+    
+    def _generate_gpu_tavern(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
         """Generate tavern sounds using GPU tensor operations."""
         samples = int(duration * self.sample_rate)
         
         # Base ambient noise using GPU
-        base = torch.randn(samples, device=self.device) * 0.2
+        base = self._randn(gens, samples).mul_(0.2)
         
         # Add fireplace crackling using GPU spectral operations
-        crackle_freq = torch.linspace(600, 1200, samples, device=self.device)
-        t = torch.linspace(0, duration, samples, device=self.device)
+        t = self._time_axis(duration, samples)
         
         # Multiple crackle layers
-        crackles = torch.zeros(samples, device=self.device)
-        for i in range(5):
-            start_idx = torch.randint(0, samples//2, (1,), device=self.device).item()
-            length = torch.randint(samples//20, samples//5, (1,), device=self.device).item()
-            end_idx = min(start_idx + length, samples)
-            
-            # Generate crackle burst on GPU
-            burst_t = t[start_idx:end_idx]
-            freq = 800 + 400 * torch.sin(2 * torch.pi * 15 * burst_t)
-            envelope = torch.exp(-burst_t * 8)
-            burst = torch.sin(2 * torch.pi * freq * burst_t) * envelope * 0.3
-            
-            crackles[start_idx:end_idx] += burst
+        crackles = self.pool.take(len(gens), samples, zero=True)
+        for row, g in enumerate(gens):
+            for i in range(5):
+                start_idx = self._randint(g, 0, samples//2)
+                length = self._randint(g, samples//20, samples//5)
+                end_idx = min(start_idx + length, samples)
+                
+                # Generate crackle burst on GPU
+                burst_t = t[start_idx:end_idx]
+                freq = 800 + 400 * torch.sin(2 * torch.pi * 15 * burst_t)
+                envelope = torch.exp(-burst_t * 8)
+                burst = torch.sin(2 * torch.pi * freq * burst_t) * envelope * 0.3
+                
+                crackles[row, start_idx:end_idx] += burst
         
         # Combine on GPU
-        audio = base + crackles
-        return self._normalize_gpu_audio(audio)
+        return self._normalize_gpu_audio(base.add_(crackles))
     
-    def _generate_gpu_fire(self, duration: float) -> torch.Tensor:
+    def _generate_gpu_fire(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
         """Generate fire sounds using GPU tensor operations."""
         samples = int(duration * self.sample_rate)
-        t = torch.linspace(0, duration, samples, device=self.device)
+        t = self._time_axis(duration, samples)
         
         # High-frequency crackling base
-        fire_base = torch.randn(samples, device=self.device) * 0.3
+        fire_base = self._randn(gens, samples).mul_(0.3)
         
         # Add periodic crackle bursts
-        for i in range(int(duration * 4)):
-            start = torch.randint(0, samples//2, (1,), device=self.device).item()
-            length = torch.randint(samples//50, samples//10, (1,), device=self.device).item()
-            end = min(start + length, samples)
-            
-            # GPU-generated crackle
-            burst_t = t[start:end]
-            freq = 700 + 300 * torch.cos(2 * torch.pi * 12 * burst_t)
-            envelope = torch.exp(-burst_t * 10) 
-            burst = torch.sin(2 * torch.pi * freq * burst_t) * envelope * 0.5
-            
-            fire_base[start:end] += burst
+        for row, g in enumerate(gens):
+            for i in range(int(duration * 4)):
+                start = self._randint(g, 0, samples//2)
+                length = self._randint(g, samples//50, samples//10)
+                end = min(start + length, samples)
+                
+                # GPU-generated crackle
+                burst_t = t[start:end]
+                freq = 700 + 300 * torch.cos(2 * torch.pi * 12 * burst_t)
+                envelope = torch.exp(-burst_t * 10)
+                burst = torch.sin(2 * torch.pi * freq * burst_t) * envelope * 0.5
+                
+                fire_base[row, start:end] += burst
         
         return self._normalize_gpu_audio(fire_base)
     
-    def _generate_gpu_water(self, duration: float) -> torch.Tensor:
+    def _generate_gpu_water(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
         """Generate water sounds using GPU tensor operations."""
         samples = int(duration * self.sample_rate)
-        t = torch.linspace(0, duration, samples, device=self.device)
+        t = self._time_axis(duration, samples)
         
         # High-frequency water texture
-        water_base = torch.randn(samples, device=self.device) * 0.4
+        water_base = self._randn(gens, samples).mul_(0.4)
         # Simple high-pass filter using GPU
-        water_base = torch.diff(water_base, prepend=water_base[0:1])
+        water_base = torch.diff(water_base, dim=-1, prepend=water_base[:, 0:1])
         
         # Add droplet sounds
-        for i in range(int(duration * 3)):
-            start = torch.randint(0, samples//2, (1,), device=self.device).item()
-            length = torch.randint(samples//100, samples//20, (1,), device=self.device).item()
-            end = min(start + length, samples)
-            
-            # GPU droplet generation
-            drop_t = t[start:end]
-            freq = 1500 + 500 * torch.sin(2 * torch.pi * 8 * drop_t)
-            envelope = torch.exp(-drop_t * 15)
-            droplet = torch.sin(2 * torch.pi * freq * drop_t) * envelope * 0.4
-            
-            water_base[start:end] += droplet
+        for row, g in enumerate(gens):
+            for i in range(int(duration * 3)):
+                start = self._randint(g, 0, samples//2)
+                length = self._randint(g, samples//100, samples//20)
+                end = min(start + length, samples)
+                
+                # GPU droplet generation
+                drop_t = t[start:end]
+                freq = 1500 + 500 * torch.sin(2 * torch.pi * 8 * drop_t)
+                envelope = torch.exp(-drop_t * 15)
+                droplet = torch.sin(2 * torch.pi * freq * drop_t) * envelope * 0.4
+                
+                water_base[row, start:end] += droplet
         
         return self._normalize_gpu_audio(water_base)
     
-    def _generate_gpu_magic(self, duration: float) -> torch.Tensor:
+    def _generate_gpu_magic(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
         """Generate magical sounds using GPU tensor operations."""
         samples = int(duration * self.sample_rate)
-        t = torch.linspace(0, duration, samples, device=self.device)
+        t = self._time_axis(duration, samples)
+        
+        # Shimmering magic base (deterministic, shared by every variant and render)
+        harmonics = self.pool.constant(("magic", duration, samples), lambda: self._magic_harmonics(duration, t))
+        magic = self.pool.take(len(gens), samples)
+        magic.copy_(harmonics.expand_as(magic))
+        
+        # Add sparkle effects
+        for row, g in enumerate(gens):
+            for i in range(int(duration * 8)):
+                start = self._randint(g, 0, samples//2)
+                length = self._randint(g, samples//200, samples//50)
+                end = min(start + length, samples)
+                
+                sparkle_t = t[start:end]
+                freq = 1800 + 700 * torch.rand(1, generator=g, device=self.device).item()
+                envelope = torch.exp(-sparkle_t * 20)
+                sparkle = torch.sin(2 * torch.pi * freq * sparkle_t) * envelope * 0.3
+                
+                magic[row, start:end] += sparkle
         
-        # Shimmering magic base
-        magic = torch.zeros(samples, device=self.device)
+        return self._normalize_gpu_audio(magic)
+    
+    def _magic_harmonics(self, duration: float, t: torch.Tensor) -> torch.Tensor:
+        """The four frequency-modulated harmonic layers under every magic sound."""
+        magic = torch.zeros(len(t), device=self.device)
         
-        # Multiple harmonic layers
         for i in range(4):
             freq = 1000 + i * 300
             mod_freq = 5 + i * 2
@@ -196,142 +238,411 @@ class RTX5090AudioGenerator:
             
             magic += wave * envelope * 0.2
         
-        # Add sparkle effects
-        for i in range(int(duration * 8)):
-            start = torch.randint(0, samples//2, (1,), device=self.device).item()
-            length = torch.randint(samples//200, samples//50, (1,), device=self.device).item()
-            end = min(start + length, samples)
-            
-            sparkle_t = t[start:end]
-            freq = 1800 + 700 * torch.rand(1, device=self.device).item()
-            envelope = torch.exp(-sparkle_t * 20)
-            sparkle = torch.sin(2 * torch.pi * freq * sparkle_t) * envelope * 0.3
-            
-            magic[start:end] += sparkle
-        
-        return self._normalize_gpu_audio(magic)
+        return magic
     
-    def _generate_gpu_combat(self, duration: float) -> torch.Tensor:
+    def _generate_gpu_combat(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
         """Generate combat sounds using GPU tensor operations."""
         samples = int(duration * self.sample_rate)
-        t = torch.linspace(0, duration, samples, device=self.device)
+        t = self._time_axis(duration, samples)
         
         # Combat base
-        combat = torch.randn(samples, device=self.device) * 0.2
+        combat = self._randn(gens, samples).mul_(0.2)
         
         # Add metal clashing
-        for i in range(int(duration * 2)):
-            start = torch.randint(0, samples//2, (1,), device=self.device).item()
-            length = torch.randint(samples//20, samples//8, (1,), device=self.device).item()
-            end = min(start + length, samples)
-            
-            clash_t = t[start:end]
-            
-            # Multi-frequency metal clash
-            clash = torch.zeros(len(clash_t), device=self.device)
-            for freq in [800, 1200, 1600]:
-                wave = torch.sin(2 * torch.pi * freq * clash_t)
-                clash += wave * 0.3
-            
-            envelope = torch.exp(-clash_t * 8)
-            combat[start:end] += clash * envelope * 0.6
+        for row, g in enumerate(gens):
+            for i in range(int(duration * 2)):
+                start = self._randint(g, 0, samples//2)
+                length = self._randint(g, samples//20, samples//8)
+                end = min(start + length, samples)
+                
+                clash_t = t[start:end]
+                
+                # Multi-frequency metal clash
+                clash = torch.zeros(len(clash_t), device=self.device)
+                for freq in [800, 1200, 1600]:
+                    wave = torch.sin(2 * torch.pi * freq * clash_t)
+                    clash += wave * 0.3
+                
+                envelope = torch.exp(-clash_t * 8)
+                combat[row, start:end] += clash * envelope * 0.6
         
         return self._normalize_gpu_audio(combat)
     
-    def _generate_gpu_generic(self, sound_type: str, duration: float) -> torch.Tensor:
-        """Generate generic sound using GPU operations."""
+    def _uniform(self, gens: List[torch.Generator], low: float, high: float) -> torch.Tensor:
+        """One random parameter per variant, shaped (variants, 1) for broadcasting."""
+        draws = torch.stack([torch.rand(1, generator=g, device=self.device) for g in gens])
+        return low + (high - low) * draws
+    
+    def _time_axis(self, duration: float, samples: int) -> torch.Tensor:
+        """Shared linspace(0, duration, samples) from the pool (read-only)."""
+        return self.pool.time_axis(duration, samples)
+    
+    def _impulses(self, gens: List[torch.Generator], samples: int, count: int,
+                  gain_min: float = 0.5, gain_max: float = 1.0) -> torch.Tensor:
+        """Randomly placed impulses with random gains, for grain placement."""
+        train = self.pool.take(len(gens), samples, zero=True)
+        for row, g in enumerate(gens):
+            positions = torch.randint(0, samples, (count,), generator=g, device=self.device)
+            gains = gain_min + (gain_max - gain_min) * torch.rand(count, generator=g, device=self.device)
+            train[row].index_add_(0, positions, gains)
+        return train
+    
+    def _convolve(self, signal: torch.Tensor, kernel: torch.Tensor) -> torch.Tensor:
+        """FFT convolution along the sample axis, truncated to the signal length."""
+        samples = signal.shape[-1]
+        size = fft_size(samples + kernel.shape[-1] - 1)
+        spectrum = torch.fft.rfft(signal, size) * torch.fft.rfft(kernel, size)
+        return torch.fft.irfft(spectrum, size)[..., :samples]
+    
+    def _frequencies(self, samples: int) -> torch.Tensor:
+        return torch.fft.rfftfreq(samples, 1 / self.sample_rate, device=self.device)
+    
+    def _filter(self, audio: torch.Tensor, response: torch.Tensor) -> torch.Tensor:
+        """Apply a frequency response (broadcastable to (variants, bins))."""
+        return torch.fft.irfft(torch.fft.rfft(audio) * response, audio.shape[-1])
+    
+    def _lowpass_response(self, size: int, alpha: float) -> torch.Tensor:
+        """Frequency response of the one-pole low-pass y[n] = alpha*x[n] + (1-alpha)*y[n-1]."""
+        omega = 2 * torch.pi * self._frequencies(size) / self.sample_rate
+        delay = torch.polar(torch.ones_like(omega), -omega)
+        return alpha / (1 - (1 - alpha) * delay)
+    
+    def _lowpass(self, audio: torch.Tensor, alpha: float) -> torch.Tensor:
+        """One-pole low-pass, applied in the frequency domain."""
+        return self._filter(audio, self._lowpass_response(audio.shape[-1], alpha))
+    
+    def _bandpass(self, audio: torch.Tensor, center, width) -> torch.Tensor:
+        """Gaussian band around center (Hz); center/width may be per variant."""
+        freqs = self._frequencies(audio.shape[-1])
+        return self._filter(audio, torch.exp(-0.5 * ((freqs - center) / width) ** 2))
+    
+    def _grain_time(self, seconds: float, samples: int) -> torch.Tensor:
+        """Time axis of a short grain, never longer than the clip."""
+        length = min(int(seconds * self.sample_rate), samples)
+        return self.pool.constant(("grain", length), lambda: torch.arange(length, device=self.device) / self.sample_rate)
+    
+    def _generate_gpu_wind(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
+        """Generate wind: low-passed noise in slow gusts with a faint whistle."""
+        samples = int(duration * self.sample_rate)
+        t = self._time_axis(duration, samples)
+        noise = self._randn(gens, samples)
+        
+        body = self._lowpass(noise, 0.05)
+        whistle = self._bandpass(noise, self._uniform(gens, 400, 700), 60)
+        gust_rate = self._uniform(gens, 0.1, 0.3)
+        gust_phase = self._uniform(gens, 0, 2 * torch.pi)
+        gusts = 0.6 + 0.4 * torch.sin(2 * torch.pi * gust_rate * t + gust_phase)
+        
+        return self._normalize_gpu_audio((body + whistle * 0.3) * gusts)
+    
+    def _generate_gpu_forest(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
+        """Generate forest: leaf rustle with bird chirps."""
         samples = int(duration * self.sample_rate)
+        t = self._time_axis(duration, samples)
         
-        # Base noise generation on GPU
-        audio = torch.randn(samples, device=self.device) * 0.3
-        
-        # Apply different filters based on sound type
-        if sound_type in ['wind', 'forest', 'ambient']:
-            # Low-pass effect
-            alpha = 0.1
-            filtered = torch.zeros_like(audio)
-            filtered[0] = audio[0]
-            for i in range(1, len(audio)):
-                filtered[i] = alpha * audio[i] + (1 - alpha) * filtered[i-1]
-            audio = filtered
-        
-        elif sound_type in ['bell', 'voice']:
-            # Add harmonic content
-            t = torch.linspace(0, duration, samples, device=self.device)
-            freq = 400 if sound_type == 'bell' else 200
-            harmonic = torch.sin(2 * torch.pi * freq * t) * 0.2
-            envelope = torch.exp(-t / (duration * 0.5))
-            audio += harmonic * envelope
+        rustle = self._lowpass(self._randn(gens, samples), 0.1)
+        rustle = rustle * (0.7 + 0.3 * torch.sin(2 * torch.pi * self._uniform(gens, 0.2, 0.5) * t))
+        
+        # One chirp shape per variant: a rising sweep under a sine window
+        ct = self._grain_time(0.08, samples)
+        f0 = self._uniform(gens, 2500, 4500)
+        sweep = 2 * torch.pi * (f0 * ct + 0.25 * f0 * ct ** 2 / ct[-1])
+        chirp = torch.sin(sweep) * torch.sin(torch.pi * ct / ct[-1])
+        
+        calls = self._impulses(gens, samples, max(1, int(duration * 1.5)), 0.3, 1.0)
+        return self._normalize_gpu_audio(rustle * 0.6 + self._convolve(calls, chirp) * 0.5)
+    
+    def _generate_gpu_footsteps(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
+        """Generate footsteps: a train of low thumps with scuff transients."""
+        samples = int(duration * self.sample_rate)
+        
+        st = self._grain_time(0.15, samples)
+        scuff = self._randn(gens, len(st)) * torch.exp(-st * 120)
+        step = torch.sin(2 * torch.pi * 80 * st) * torch.exp(-st * 40) + scuff * 0.5
+        
+        # Evenly paced impulses with a little timing and level jitter
+        train = self.pool.take(len(gens), samples, zero=True)
+        for row, g in enumerate(gens):
+            interval = (0.45 + 0.2 * torch.rand(1, generator=g, device=self.device).item()) * self.sample_rate
+            offset = interval * torch.rand(1, generator=g, device=self.device).item()
+            positions = torch.arange(offset, samples, interval, device=self.device)
+            positions = positions + torch.randn(len(positions), generator=g, device=self.device) * 0.02 * self.sample_rate
+            positions = positions.clamp(0, samples - 1).long()
+            gains = 0.7 + 0.3 * torch.rand(len(positions), generator=g, device=self.device)
+            train[row].index_add_(0, positions, gains)
+        
+        floor = self._randn(gens, samples) * 0.01
+        return self._normalize_gpu_audio(self._convolve(train, step) + floor)
+    
+    def _generate_gpu_ambient(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
+        """Generate ambient: soft 1/f-tilted room tone with a slow swell."""
+        samples = int(duration * self.sample_rate)
+        t = self._time_axis(duration, samples)
+        
+        tilt = (20 / self._frequencies(samples).clamp_min(20)) ** 0.75
+        tone = self._filter(self._randn(gens, samples), tilt)
+        swell = 0.8 + 0.2 * torch.sin(2 * torch.pi * 0.05 * t + self._uniform(gens, 0, 2 * torch.pi))
+        
+        return self._normalize_gpu_audio(tone * swell)
+    
+    def _generate_gpu_dungeon(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
+        """Generate dungeon: deep rumble and echoing drips in a reverberant space."""
+        samples = int(duration * self.sample_rate)
+        
+        noise = self._randn(gens, samples)
+        
+        dt = self._grain_time(0.04, samples)
+        drip = torch.sin(2 * torch.pi * self._uniform(gens, 1200, 2500) * dt) * torch.exp(-dt * 90)
+        impulses = self._impulses(gens, samples, int(duration * 0.7) + 1)
+        
+        # Exponentially decaying noise as the room's impulse response
+        rt = self._grain_time(1.2, samples)
+        room = self._randn(gens, len(rt)) * torch.exp(-rt / 0.4) * 0.02
+        
+        # Rumble, drips and reverb are mixed in one frequency-domain pass
+        size = fft_size(samples + len(rt) - 1)
+        rumble = torch.fft.rfft(noise, size) * self._lowpass_response(size, 0.01)
+        drips = torch.fft.rfft(impulses, size) * torch.fft.rfft(drip, size)
+        dry = rumble * 2.0 + drips * 0.6
+        audio = torch.fft.irfft(dry * (1 + 0.5 * torch.fft.rfft(room, size)), size)[..., :samples]
         
         return self._normalize_gpu_audio(audio)
     
+    def _generate_gpu_thunder(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
+        """Generate thunder: a sharp crack followed by a long rolling rumble."""
+        samples = int(duration * self.sample_rate)
+        t = self._time_axis(duration, samples)
+        noise = self._randn(gens, samples)
+        
+        onset = self._uniform(gens, 0, duration * 0.3)
+        since = (t - onset).clamp_min(0)
+        started = (t >= onset).float()
+        
+        crack = torch.diff(noise, dim=-1, prepend=noise[:, 0:1]) * torch.exp(-since * 25) * started
+        roll = 0.7 + 0.3 * torch.sin(2 * torch.pi * self._uniform(gens, 2, 4) * t)
+        envelope = torch.exp(-since / (duration * 0.35)) * (1 - torch.exp(-since / 0.05)) * started
+        rumble = self._lowpass(noise, 0.01) * envelope * roll
+        
+        return self._normalize_gpu_audio(crack * 0.3 + rumble * 4.0)
+    
+    def _generate_gpu_bell(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
+        """Generate a modal bell: inharmonic partials with their own decays, struck a few times."""
+        samples = int(duration * self.sample_rate)
+        
+        ratios = torch.tensor([1.0, 2.0, 2.4, 3.0, 4.2, 5.4, 6.8], device=self.device)[:, None]
+        amps = torch.tensor([1.0, 0.6, 0.5, 0.4, 0.25, 0.2, 0.1], device=self.device)[:, None]
+        base_tau = 1.2
+        
+        bt = self._grain_time(2.5, samples)
+        fundamental = self._uniform(gens, 300, 600)[:, :, None]  # (variants, 1, 1)
+        partials = torch.sin(2 * torch.pi * fundamental * ratios * bt) * (amps * torch.exp(-bt / (base_tau / ratios ** 0.7)))
+        tone = partials.sum(dim=1)
+        
+        strikes = self._impulses(gens, samples, int(duration / 3), 0.4, 0.8)
+        strikes[:, 0] += 1.0  # always strike at the start
+        
+        return self._normalize_gpu_audio(self._convolve(strikes, tone))
+    
+    def _generate_gpu_voice(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
+        """Generate voice: a vibrato sawtooth shaped by vowel formants."""
+        samples = int(duration * self.sample_rate)
+        t = self._time_axis(duration, samples)
+        
+        f0 = self._uniform(gens, 110, 220) * (1 + 0.02 * torch.sin(2 * torch.pi * 5 * t))
+        phase = torch.cumsum(f0, dim=-1) / self.sample_rate
+        source = 2 * (phase - torch.floor(phase)) - 1
+        
+        # A vowel per variant: (first, second, third formant in Hz)
+        vowels = torch.tensor([[700, 1220, 2600], [300, 2300, 3000], [500, 900, 2400], [400, 1700, 2500]],
+                              dtype=torch.float32, device=self.device)
+        chosen = vowels[[self._randint(g, 0, len(vowels)) for g in gens]]
+        freqs = self._frequencies(samples)
+        response = sum(torch.exp(-0.5 * ((freqs - chosen[:, k:k + 1]) / width) ** 2) * gain
+                       for k, (width, gain) in enumerate([(110, 1.0), (130, 0.6), (250, 0.3)]))
+        voiced = self._filter(source, response)
+        
+        breath = self._bandpass(self._randn(gens, samples), 2000, 800) * 0.05
+        syllable_phase = 2 * torch.pi * self._uniform(gens, 3, 5) * t + self._uniform(gens, 0, 2 * torch.pi)
+        syllables = torch.sin(syllable_phase).clamp(0, 1) ** 0.5
+        
+        return self._normalize_gpu_audio((voiced + breath) * syllables)
+    
+    def _generate_gpu_mechanical(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
+        """Generate mechanical: a ticking escapement over a gear hum."""
+        samples = int(duration * self.sample_rate)
+        t = self._time_axis(duration, samples)
+        
+        kt = self._grain_time(0.02, samples)
+        tick = self._randn(gens, len(kt)) * torch.exp(-kt * 300) + torch.sin(2 * torch.pi * 3000 * kt) * torch.exp(-kt * 80)
+        
+        train = self.pool.take(len(gens), samples, zero=True)
+        for row, g in enumerate(gens):
+            interval = self.sample_rate / (4 + 4 * torch.rand(1, generator=g, device=self.device).item())
+            train[row, torch.arange(0, samples, interval, device=self.device).long()] = 1.0
+        ticks = self._convolve(train, tick)
+        
+        rotation = self._uniform(gens, 30, 60)
+        hum = sum(torch.sin(2 * torch.pi * rotation * h * t) / h for h in (1, 2, 3)) * 0.15
+        
+        return self._normalize_gpu_audio(ticks + hum + self._randn(gens, samples) * 0.01)
+    
+    def _generate_gpu_animal(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
+        """Generate animal: repeated calls, a pitch-arched tone with one overtone."""
+        samples = int(duration * self.sample_rate)
+        
+        ct = self._grain_time(0.45, samples)
+        arch = torch.sin(torch.pi * ct / ct[-1])
+        freq = self._uniform(gens, 400, 900) * (1 + 0.5 * arch)
+        phase = 2 * torch.pi * torch.cumsum(freq, dim=-1) / self.sample_rate
+        call = (torch.sin(phase) + 0.3 * torch.sin(2 * phase)) * arch ** 2
+        
+        calls = self._impulses(gens, samples, max(1, int(duration * 0.8)))
+        return self._normalize_gpu_audio(self._convolve(calls, call) + self._randn(gens, samples) * 0.01)
+    
+    def _generate_gpu_unknown(self, duration: float, gens: List[torch.Generator]) -> torch.Tensor:
+        """Generate unknown: noise with a random spectral tilt and resonance."""
+        samples = int(duration * self.sample_rate)
+        freqs = self._frequencies(samples).clamp_min(20)
+        
+        tilt = (1000 / freqs) ** self._uniform(gens, 0.0, 1.5)
+        resonance = torch.exp(-0.5 * ((freqs - self._uniform(gens, 200, 3000)) / 150) ** 2) * 4
+        return self._normalize_gpu_audio(self._filter(self._randn(gens, samples), tilt + resonance))
+    
     def _normalize_gpu_audio(self, audio: torch.Tensor) -> torch.Tensor:
-        """Normalize audio tensor on GPU."""
+        """Normalize a (variants, samples) audio tensor on GPU, per variant."""
         # Normalize to [-0.8, 0.8] range
-        max_val = torch.max(torch.abs(audio))
-        if max_val > 0:
-            audio = audio / max_val * 0.8
+        max_val = torch.amax(torch.abs(audio), dim=-1, keepdim=True)
+        audio = torch.where(max_val > 0, audio / max_val.clamp_min(1e-12) * 0.8, audio)
         
         # Apply fade in/out on GPU
         fade_samples = int(0.05 * self.sample_rate)
-        if len(audio) > 2 * fade_samples:
-            fade_in = torch.linspace(0, 1, fade_samples, device=self.device)
-            fade_out = torch.linspace(1, 0, fade_samples, device=self.device)
+        if audio.shape[-1] > 2 * fade_samples:
+            fade_in = self.pool.ramp(fade_samples, rising=True)
+            fade_out = self.pool.ramp(fade_samples, rising=False)
             
-            audio[:fade_samples] *= fade_in
-            audio[-fade_samples:] *= fade_out
+            audio[..., :fade_samples] *= fade_in
+            audio[..., -fade_samples:] *= fade_out
         
         return audio
     
-    def generate_sound(self, prompt: str, duration: float = 3.0) -> Optional[str]:
-        """Generate audio using RTX 5090 GPU acceleration."""
+    def _kernel(self, sound_type: str, duration: float, variants: int) -> Callable:
+        """
+        The kernel to run for a render: eager, or a torch.compile'd copy.
+        Kernels are traced with fixed shapes, and their envelopes depend on the
+        duration itself, so padding a clip to a longer bucket would change its
+        sound. Instead, durations on the compile_bucket grid (every scene length
+        in practice) get their own compiled graphs, up to max_compiled of them;
+        anything else runs eager. On CUDA the graphs are also captured as CUDA
+        graphs ("reduce-overhead"), removing per-op launch cost.
+        """
+        kernel = self.kernels.get(sound_type, self._generate_gpu_unknown)
+        buckets = duration / self.compile_bucket
+        if not self.compile_kernels or sound_type in self.eager_types or abs(buckets - round(buckets)) > 1e-9:
+            return kernel
+        
+        key = (sound_type, int(duration * self.sample_rate), variants)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            if len(self._compiled) >= self.max_compiled:
+                return kernel
+            mode = "reduce-overhead" if self.device == "cuda" else "default"
+            compiled = self._compiled[key] = torch.compile(kernel, mode=mode, dynamic=False)
+        return compiled
+    
+    def _render(self, sound_type: str, duration: float, seeds: List[int]) -> torch.Tensor:
+        """Render one variant per seed in a single batched pass: (len(seeds), samples)."""
+        gens = self._make_generators(seeds)
+        kernel = self._kernel(sound_type, duration, len(seeds))
+        
+        # Work buffers go back to the pool afterwards; normalization returns a fresh tensor
+        with self.pool.lease():
+            audio = kernel(duration, gens)
+        
+        # CUDA graph outputs live in a pool that the next replay overwrites
+        if self.compile_kernels and self.device == "cuda":
+            audio = audio.clone()
+        return audio
+    
+    def _cache_path(self, sound_type: str, duration: float, seed: int) -> str:
+        """Cache path for one rendered variant, keyed by sound type, duration bucket and seed."""
+        return os.path.join(self.cache_dir, f"{synthesis_key('torch', sound_type, duration, seed)}.wav")
+    
+    def cache_path(self, prompt: str, duration: float = 3.0, seed: int = 0) -> str:
+        """The file generate_sound(prompt, duration, seed=seed) reads or writes."""
+        return self._cache_path(self._classify_prompt(prompt), quantize_duration(duration), seed)
+    
+    def generate_sound(self, prompt: str, duration: float = 3.0, seed: int = 0) -> Optional[str]:
+        """Generate audio using RTX 5090 GPU acceleration. Same prompt, duration and seed give the same audio."""
+        paths = self.generate_variants(prompt, duration, variants=1, seed=seed)
+        return paths[0] if paths else None
+    
+    def generate_variants(self, prompt: str, duration: float = 3.0, variants: int = 4, seed: int = 0) -> List[str]:
+        """
+        Generate variants for seeds seed .. seed + variants - 1.
+        All missing variants are rendered together in one batched tensor pass.
+        Duration is rounded to the 0.25 s cache bucket; prompts of the same type share files.
+        Returns the cache paths of all variants (empty list on failure).
+        """
         start_time = time.time()
+        duration = quantize_duration(duration)
         
         # Classify sound type
-        sound_type = self._classify_prompt(prompt)
+        with metrics.timer("generation_classify_seconds", engine="torch"):
+            sound_type = self._classify_prompt(prompt)
         
         # Check cache
-        cache_key = hashlib.md5(f"{prompt}_{duration}_{sound_type}".encode()).hexdigest()
-        cache_path = os.path.join(self.cache_dir, f"{cache_key}.wav")
-        
-        if os.path.exists(cache_path):
-            print(f"⚡ Cached: '{prompt}' -> {sound_type} ({time.time() - start_time:.3f}s)")
-            return cache_path
-        
-        print(f"🚀 RTX 5090 Generating: '{prompt}' -> {sound_type}")
+        seeds = [seed + i for i in range(variants)]
+        paths = [self._cache_path(sound_type, duration, s) for s in seeds]
+        with metrics.timer("cache_lookup_seconds", engine="torch"):
+            missing = [i for i, path in enumerate(paths) if not os.path.exists(path)]
+        metrics.inc("cache_hits_total", variants - len(missing), engine="torch")
+        metrics.inc("cache_misses_total", len(missing), engine="torch")
+        
+        if not missing:
+            latency = time.time() - start_time
+            logger.debug("⚡ Cached: '%s' -> %s (%.3fs)", prompt, sound_type, latency,
+                         extra={"prompt": prompt, "engine": "torch", "sound_type": sound_type, "duration": duration,
+                                "seed": seed, "variants": variants, "cache_hit": True, "latency": latency})
+            return paths
+        
+        logger.info("🚀 RTX 5090 Generating: '%s' -> %s (%d variant(s))", prompt, sound_type, len(missing),
+                    extra={"prompt": prompt, "engine": "torch", "sound_type": sound_type,
+                           "duration": duration, "variants": len(missing)})
         
         try:
-            # Generate audio using GPU-optimized methods
-            if sound_type == 'tavern':
-                audio_tensor = self._generate_gpu_tavern(duration)
-            elif sound_type == 'fire':
-                audio_tensor = self._generate_gpu_fire(duration)
-            elif sound_type == 'water':
-                audio_tensor = self._generate_gpu_water(duration)
-            elif sound_type == 'magic':
-                audio_tensor = self._generate_gpu_magic(duration)
-            elif sound_type == 'combat':
-                audio_tensor = self._generate_gpu_combat(duration)
-            else:
-                audio_tensor = self._generate_gpu_generic(sound_type, duration)
-            
-            # Convert to numpy for saving
-            audio_np = audio_tensor.detach().cpu().numpy()
+            # Kernels normalize on the device; the copy back waits for the GPU to finish
+            with metrics.timer("generation_synthesis_seconds", engine="torch", sound_type=sound_type):
+                audio_tensor = self._render(sound_type, duration, [seeds[i] for i in missing])
+                
+                # Convert to numpy for saving
+                audio_np = audio_tensor.detach().cpu().numpy()
             
             # Save to cache
-            sf.write(cache_path, audio_np, self.sample_rate)
+            with metrics.timer("generation_write_seconds", engine="torch"):
+                for row, index in enumerate(missing):
+                    write_cache_file(paths[index], audio_np[row], self.sample_rate)
+            
+            with metrics.timer("generation_analyze_seconds", engine="torch"):
+                get_index(self.cache_dir).record([paths[i] for i in missing], analyze(audio_np, self.sample_rate))
             
             generation_time = time.time() - start_time
             gpu_memory = torch.cuda.memory_allocated(0) / 1e6 if self.device == "cuda" else 0
             
-            print(f"🎉 RTX 5090 generation complete in {generation_time:.4f}s")
-            print(f"🎯 GPU Memory: {gpu_memory:.1f} MB")
-            
-            return cache_path
+            logger.info("🎉 RTX 5090 generation complete in %.4fs (GPU memory %.1f MB)", generation_time, gpu_memory,
+                        extra={"prompt": prompt, "engine": "torch", "sound_type": sound_type, "duration": duration,
+                               "seed": seed, "variants": variants, "rendered": len(missing), "cache_hit": False,
+                               "latency": generation_time, "gpu_memory_mb": gpu_memory})
             
+            return paths
+        
         except Exception as e:
-            print(f"❌ RTX 5090 generation failed: {e}")
-            return None
+            metrics.inc("generation_failures_total", engine="torch")
+            logger.error("❌ RTX 5090 generation failed: %s", e, extra={"prompt": prompt, "engine": "torch"})
+            return []
+    
+    def get_pool_stats(self) -> Dict:
+        """Buffer pool hit rate and footprint."""
+        return self.pool.stats()
     
     def get_cache_info(self) -> Dict:
         """Get cache information."""
@@ -352,4 +663,5 @@ class RTX5090AudioGenerator:
         if os.path.exists(self.cache_dir):
             shutil.rmtree(self.cache_dir)
             os.makedirs(self.cache_dir, exist_ok=True)
+            get_index(self.cache_dir).clear()
         print("🗑️ RTX 5090 audio cache cleared")
\ No newline at end of file
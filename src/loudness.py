@@ -0,0 +1,240 @@
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Playback target: EBU R128 programme loudness, with true peaks kept under the ceiling
+TARGET_LUFS = -23.0
+TRUE_PEAK_CEILING_DB = -1.0
+
+# BS.1770 gating: 400 ms blocks every 100 ms, absolute gate -70 LUFS, relative gate -10 LU
+_BLOCK_SECONDS = 0.4
+_STEP_SECONDS = 0.1
+_ABSOLUTE_GATE = -70.0
+_RELATIVE_GATE = -10.0
+
+# True peak: 4x oversampling around the largest samples with a windowed sinc
+_OVERSAMPLE = 4
+_SINC_HALF_TAPS = 16
+_PEAK_CANDIDATES = 64
+
+INDEX_FILENAME = "loudness.jsonl"
+
+
+def _biquad_response(b: List[float], a: List[float], w: np.ndarray) -> np.ndarray:
+    z = np.exp(-1j * w)
+    return (b[0] + b[1] * z + b[2] * z * z) / (a[0] + a[1] * z + a[2] * z * z)
+
+
+def _k_weighting(sample_rate: int, bins: int) -> np.ndarray:
+    """
+    Frequency response of the BS.1770 K-weighting (high shelf + RLB high-pass)
+    at the rfft bins, with coefficients derived for any sample rate.
+    """
+    w = np.linspace(0, np.pi, bins)
+
+    # Stage 1: +4 dB high shelf around 1.5 kHz (head diffraction)
+    A, w0 = 10 ** (4.0 / 40), 2 * np.pi * 1500.0 / sample_rate
+    alpha, cos_w0 = np.sin(w0) / (2 * (1 / np.sqrt(2))), np.cos(w0)
+    shelf = _biquad_response(
+        [A * ((A + 1) + (A - 1) * cos_w0 + 2 * np.sqrt(A) * alpha),
+         -2 * A * ((A - 1) + (A + 1) * cos_w0),
+         A * ((A + 1) + (A - 1) * cos_w0 - 2 * np.sqrt(A) * alpha)],
+        [(A + 1) - (A - 1) * cos_w0 + 2 * np.sqrt(A) * alpha,
+         2 * ((A - 1) - (A + 1) * cos_w0),
+         (A + 1) - (A - 1) * cos_w0 - 2 * np.sqrt(A) * alpha], w)
+
+    # Stage 2: high-pass at 38 Hz (revised low-frequency B-curve)
+    w0 = 2 * np.pi * 38.0 / sample_rate
+    alpha, cos_w0 = np.sin(w0) / (2 * 0.5), np.cos(w0)
+    highpass = _biquad_response([(1 + cos_w0) / 2, -(1 + cos_w0), (1 + cos_w0) / 2],
+                                [1 + alpha, -2 * cos_w0, 1 - alpha], w)
+    return shelf * highpass
+
+
+def _integrated_lufs(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+    """
+    Gated integrated loudness per row of (clips, samples).
+
+    The clip is cut into 100 ms sub-blocks; each sub-block's K-weighted
+    energy comes straight from its spectrum (Parseval), and every 400 ms
+    gating block is the sum of four consecutive sub-blocks. No filtered
+    signal is ever materialized.
+    """
+    clips, samples = audio.shape
+    step = min(int(_STEP_SECONDS * sample_rate), samples)
+    per_block = max(1, min(int(round(_BLOCK_SECONDS / _STEP_SECONDS)), samples // step))
+    count = samples // step
+
+    spectrum = np.fft.rfft(audio[:, :count * step].reshape(clips, count, step), axis=2)
+    power = spectrum.real ** 2 + spectrum.imag ** 2
+    weights = np.abs(_k_weighting(sample_rate, step // 2 + 1)) ** 2 * 2.0
+    weights[0] /= 2
+    if step % 2 == 0:
+        weights[-1] /= 2
+    sub_energy = power @ weights.astype(power.dtype) / step
+
+    running = np.concatenate([np.zeros((clips, 1)), np.cumsum(sub_energy, axis=1, dtype=np.float64)], axis=1)
+    z = (running[:, per_block:] - running[:, :-per_block]) / (per_block * step)
+    block_lufs = -0.691 + 10 * np.log10(np.maximum(z, 1e-20))
+
+    gated = block_lufs > _ABSOLUTE_GATE
+    mean_z = (z * gated).sum(axis=1) / np.maximum(gated.sum(axis=1), 1)
+    relative = -0.691 + 10 * np.log10(np.maximum(mean_z, 1e-20)) + _RELATIVE_GATE
+    gated &= block_lufs > relative[:, None]
+    mean_z = (z * gated).sum(axis=1) / np.maximum(gated.sum(axis=1), 1)
+    return np.where(gated.any(axis=1), -0.691 + 10 * np.log10(np.maximum(mean_z, 1e-20)), -np.inf)
+
+
+def _true_peak(audio: np.ndarray) -> np.ndarray:
+    """
+    Peak of the 4x oversampled signal per row, interpolated only around the
+    largest samples (where inter-sample overs happen) instead of upsampling
+    whole clips.
+    """
+    clips, samples = audio.shape
+    count = min(_PEAK_CANDIDATES, samples)
+    candidates = np.argpartition(np.abs(audio), samples - count, axis=1)[:, samples - count:]
+
+    taps = np.arange(-_SINC_HALF_TAPS + 1, _SINC_HALF_TAPS + 1)
+    # Both sides of each candidate: the over can sit on either side of the largest sample
+    fractions = np.setdiff1d(np.arange(1 - _OVERSAMPLE, _OVERSAMPLE), [0]) / _OVERSAMPLE
+    offsets = fractions[:, None] - taps[None, :]
+    kernel = np.sinc(offsets) * np.hanning(2 * _SINC_HALF_TAPS + 2)[1:-1][None, :]
+
+    padded = np.pad(audio, ((0, 0), (_SINC_HALF_TAPS, _SINC_HALF_TAPS)))
+    windows = padded[np.arange(clips)[:, None, None], candidates[:, :, None] + taps + _SINC_HALF_TAPS]
+    between = np.abs(windows @ kernel.T).max(axis=(1, 2))
+    return np.maximum(np.abs(audio).max(axis=1), between)
+
+
+def _db(values: np.ndarray) -> np.ndarray:
+    return 20 * np.log10(np.maximum(values, 1e-10))
+
+
+def analyze(audio: np.ndarray, sample_rate: int) -> List[Dict[str, float]]:
+    """
+    Loudness of a batch of mono clips (clips, samples), or of one clip: RMS
+    (dBFS), approximate integrated loudness (LUFS, BS.1770 K-weighting and
+    gating) and true peak (dBTP). Run once per generated clip; the results
+    go in the cache's loudness index so playback never rescans audio.
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    if audio.ndim == 1:
+        audio = audio[None, :]
+    if audio.shape[1] == 0:
+        return [{"rms_db": -200.0, "lufs": -200.0, "true_peak_db": -200.0} for _ in range(audio.shape[0])]
+
+    rms = _db(np.sqrt(np.einsum("ij,ij->i", audio, audio, dtype=np.float64) / audio.shape[1]))
+    lufs = np.maximum(_integrated_lufs(audio, sample_rate), -200.0)
+    peaks = _db(_true_peak(audio))
+    return [{"rms_db": round(float(r), 2), "lufs": round(float(l), 2), "true_peak_db": round(float(p), 2)}
+            for r, l, p in zip(rms, lufs, peaks)]
+
+
+def analyze_channels(audio: np.ndarray, sample_rate: int) -> Dict[str, float]:
+    """Loudness of one (samples, channels) clip: channel energies summed, peaks maxed."""
+    per_channel = analyze(np.asarray(audio).T, sample_rate)
+
+    def summed(key: str) -> float:
+        return float(10 * np.log10(max(sum(10 ** (stats[key] / 10) for stats in per_channel), 1e-20)))
+
+    return {
+        "rms_db": round(summed("rms_db") - 10 * float(np.log10(len(per_channel))), 2),
+        "lufs": round(summed("lufs"), 2),
+        "true_peak_db": max(stats["true_peak_db"] for stats in per_channel)
+    }
+
+
+def playback_gain(stats: Optional[Dict], target_lufs: float = TARGET_LUFS,
+                  ceiling_db: float = TRUE_PEAK_CEILING_DB, max_gain: float = 1.0) -> float:
+    """
+    Linear gain that brings a clip to target_lufs without its true peak
+    crossing ceiling_db. The mixer cannot boost, so gain tops out at
+    max_gain. Clips without loudness metadata play unchanged.
+    """
+    if not stats or stats.get("lufs", -200.0) <= -200.0:
+        return 1.0
+    gain_db = min(target_lufs - stats["lufs"], ceiling_db - stats["true_peak_db"])
+    return float(min(max_gain, 10 ** (gain_db / 20)))
+
+
+class LoudnessIndex:
+    """
+    Loudness of every clip in one cache directory, as an append-only JSONL
+    file (one {"file", ...stats} record per generated clip; the last record
+    for a file wins). Generators append, players look up.
+    """
+
+    def __init__(self, directory: str):
+        self.path = os.path.join(directory, INDEX_FILENAME)
+        self._entries: Dict[str, Dict] = {}
+        self._loaded_size = 0
+        self._lock = threading.Lock()
+
+    def record(self, filepaths: List[str], stats: List[Dict]):
+        """Append the stats of freshly written clips."""
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                for filepath, entry in zip(filepaths, stats):
+                    name = os.path.basename(filepath)
+                    f.write(json.dumps(dict(entry, file=name)) + "\n")
+                    self._entries[name] = entry
+
+    def _refresh(self):
+        """Read records appended since the last look (other processes write too)."""
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if size == self._loaded_size:
+            return
+        with open(self.path, encoding="utf-8") as f:
+            f.seek(self._loaded_size if size > self._loaded_size else 0)
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._entries[entry.pop("file")] = entry
+        self._loaded_size = size
+
+    def get(self, filepath: str) -> Optional[Dict]:
+        with self._lock:
+            self._refresh()
+            return self._entries.get(os.path.basename(filepath))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._loaded_size = 0
+
+
+_indexes: Dict[str, LoudnessIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(directory: str) -> LoudnessIndex:
+    """The shared index for a cache directory."""
+    directory = os.path.abspath(directory)
+    with _indexes_lock:
+        index = _indexes.get(directory)
+        if index is None:
+            index = _indexes[directory] = LoudnessIndex(directory)
+        return index
+
+
+def lookup(filepath: str) -> Optional[Dict]:
+    """Stored loudness of a generated file or sound pack member, if it was analyzed."""
+    from sound_pack import open_pack, split_member_path
+
+    member = split_member_path(filepath)
+    if member is not None:
+        pack_path, name = member
+        try:
+            return open_pack(pack_path).members[name].get("loudness")
+        except (OSError, ValueError, KeyError):
+            return None
+    return get_index(os.path.dirname(os.path.abspath(filepath))).get(filepath)
@@ -1,9 +1,10 @@
 import sys
-import time
-import select
 from audio_engine import AudioEngine
 from generative_orchestrator import GenerativeOrchestrator
 from nlp_interpreter import NLPInterpreter
+from performance_runtime import PerformanceRuntime
+from metrics import metrics
+from structured_logging import configure_logging
 
 
 def print_banner():
@@ -35,7 +36,7 @@ def print_controls():
     print("=" * 60)
 
 
-def handle_custom_generation(orchestrator):
+async def handle_custom_generation(orchestrator, runtime):
     """Handle custom scene generation."""
     print("\n🎭 CUSTOM SCENE GENERATION")
     print("Describe the scene you want to create:")
@@ -44,10 +45,10 @@ def handle_custom_generation(orchestrator):
     print("  - 'spooky haunted mansion with creaking floors'")
     print("  - 'peaceful lakeside with gentle waves'")
     
-    description = input("Scene description > ").strip()
+    description = (await runtime.ainput("Scene description > ")).strip()
     if description:
         print("\nHow long should the background track be? (default: 30s)")
-        duration_input = input("Duration (seconds) > ").strip()
+        duration_input = (await runtime.ainput("Duration (seconds) > ")).strip()
         
         try:
             duration = float(duration_input) if duration_input else 30.0
@@ -55,7 +56,9 @@ def handle_custom_generation(orchestrator):
             duration = 30.0
         
         print(f"\n🎵 Generating scene: '{description}' ({duration}s)")
-        success = orchestrator.generate_scene_on_demand(description, duration)
+        # Render off the loop, then swap scenes on it so no tick sees a half-switched scene
+        bed_file = await runtime.run_blocking(orchestrator.prepare_scene_on_demand, description, duration)
+        success = orchestrator.activate_generated_scene(bed_file)
         
         if success:
             print("✅ Custom scene generated and playing!")
@@ -66,7 +69,7 @@ def handle_custom_generation(orchestrator):
         print("❌ No description provided")
 
 
-def handle_dynamic_sound(orchestrator):
+async def handle_dynamic_sound(orchestrator, runtime):
     """Handle adding dynamic sounds to current scene."""
     if not orchestrator.current_scene:
         print("❌ No active scene. Start a scene first!")
@@ -79,10 +82,10 @@ def handle_dynamic_sound(orchestrator):
     print("  - 'cat meowing'")
     print("  - 'thunder rumbling overhead'")
     
-    sound_description = input("Sound description > ").strip()
+    sound_description = (await runtime.ainput("Sound description > ")).strip()
     if sound_description:
         print("How often should this sound occur? (default: occasionally)")
-        freq_input = input("Frequency (never/rarely/occasionally/often) > ").strip().lower()
+        freq_input = (await runtime.ainput("Frequency (never/rarely/occasionally/often) > ")).strip().lower()
         
         freq_map = {
             "never": 0.0,
@@ -102,6 +105,8 @@ def handle_dynamic_sound(orchestrator):
 
 def main():
     """Main application loop for V1.0."""
+    # Generation and playback events stay off the terminal unless BARDS_FORGE_LOG_LEVEL asks for them
+    configure_logging()
     print_banner()
     
     print("🔧 Initializing V1.0 systems...")
@@ -139,82 +144,86 @@ def main():
     
     print("\n🎮 V1.0 ready! (press Enter to see controls)")
     
-    try:
-        while True:
-            # Update orchestrator for dynamic generation
-            orchestrator.update()
+    async def handle_command(user_input: str) -> bool:
+        """Handle one command. Returns False to quit."""
+        if user_input == 't':
+            print("🍺 Switching to tavern scene...")
+            orchestrator.play_scene("tavern")
+            
+        elif user_input == 'f':
+            print("🌲 Switching to forest scene...")
+            orchestrator.play_scene("forest")
+            
+        elif user_input == 'd':
+            print("🏰 Switching to dungeon scene...")
+            orchestrator.play_scene("dungeon")
+            
+        elif user_input == 'b':
+            print("⚔️ Switching to battlefield scene...")
+            orchestrator.play_scene("battlefield")
+            
+        elif user_input == 'm':
+            print("📚 Switching to magical library scene...")
+            orchestrator.play_scene("magical_library")
             
-            # Non-blocking input check            
-            if select.select([sys.stdin], [], [], 0.1)[0]:
-                user_input = input("> ").lower().strip()
+        elif user_input == 'p':
+            print("\n🧠 NLP SCENE INTERPRETATION")
+            print("Describe your scene:")
+            description = await runtime.ainput("> ")
+            scene = await runtime.run_blocking(nlp_interpreter.interpret_prompt, description, orchestrator.scenes)
+            if scene:
+                print(f"🎯 Interpreted as: {scene}")
+                orchestrator.play_scene(scene)
+            else:
+                print("❓ Could not understand scene description.")
+                print(f"Available scenes: {orchestrator.get_available_scenes()}")
                 
-                if user_input == 't':
-                    print("🍺 Switching to tavern scene...")
-                    orchestrator.play_scene("tavern")
-                    
-                elif user_input == 'f':
-                    print("🌲 Switching to forest scene...")
-                    orchestrator.play_scene("forest")
-                    
-                elif user_input == 'd':
-                    print("🏰 Switching to dungeon scene...")
-                    orchestrator.play_scene("dungeon")
-                    
-                elif user_input == 'b':
-                    print("⚔️ Switching to battlefield scene...")
-                    orchestrator.play_scene("battlefield")
-                    
-                elif user_input == 'm':
-                    print("📚 Switching to magical library scene...")
-                    orchestrator.play_scene("magical_library")
-                    
-                elif user_input == 'p':
-                    print("\n🧠 NLP SCENE INTERPRETATION")
-                    print("Describe your scene:")
-                    description = input("> ")
-                    scene = nlp_interpreter.interpret_prompt(description, orchestrator.scenes)
-                    if scene:
-                        print(f"🎯 Interpreted as: {scene}")
-                        orchestrator.play_scene(scene)
-                    else:
-                        print("❓ Could not understand scene description.")
-                        print(f"Available scenes: {orchestrator.get_available_scenes()}")
-                        
-                elif user_input == 'g':
-                    handle_custom_generation(orchestrator)
-                    
-                elif user_input == 'a':
-                    handle_dynamic_sound(orchestrator)
-                    
-                elif user_input == 'stats':
-                    stats = orchestrator.get_generation_stats()
-                    print(f"\n📊 GENERATION STATISTICS:")
-                    print(f"  Current scene: {stats['current_scene'] or 'None'}")
-                    print(f"  Generation enabled: {stats['generation_enabled']}")
-                    print(f"  Cached files: {stats['cache_files']}")
-                    print(f"  Cache size: {stats['cache_size_mb']:.1f} MB")
-                    
-                elif user_input == 'clear':
-                    print("🗑️ Clearing generated audio cache...")
-                    orchestrator.clear_generated_cache()
-                    
-                elif user_input == 's':
-                    print("🛑 Stopping current scene...")
-                    orchestrator.stop_current_scene()
-                    
-                elif user_input == 'q':
-                    break
-                    
-                elif user_input == '':
-                    print_controls()
-                    
-                else:
-                    print(f"❓ Unknown command: '{user_input}'")
-                    print("Press Enter to see available controls")
+        elif user_input == 'g':
+            await handle_custom_generation(orchestrator, runtime)
             
-            # Small sleep to prevent 100% CPU usage
-            time.sleep(0.1)
-
+        elif user_input == 'a':
+            await handle_dynamic_sound(orchestrator, runtime)
+            
+        elif user_input == 'stats':
+            stats = orchestrator.get_generation_stats()
+            print(f"\n📊 GENERATION STATISTICS:")
+            print(f"  Current scene: {stats['current_scene'] or 'None'}")
+            print(f"  Generation enabled: {stats['generation_enabled']}")
+            print(f"  Cached files: {stats['cache_files']}")
+            print(f"  Cache size: {stats['cache_size_mb']:.1f} MB")
+            
+            print(f"\n⏱️ HOT-PATH METRICS:")
+            if not metrics.enabled:
+                print("  Disabled (BARDS_FORGE_METRICS=0)")
+            for line in metrics.report() or ["Nothing recorded yet"]:
+                print(f"  {line}")
+            
+        elif user_input == 'clear':
+            print("🗑️ Clearing generated audio cache...")
+            orchestrator.clear_generated_cache()
+            
+        elif user_input == 's':
+            print("🛑 Stopping current scene...")
+            orchestrator.stop_current_scene()
+            
+        elif user_input == 'q':
+            return False
+            
+        elif user_input == '':
+            print_controls()
+            
+        else:
+            print(f"❓ Unknown command: '{user_input}'")
+            print("Press Enter to see available controls")
+        
+        return True
+    
+    # Event-driven: sleeps until input, a scheduled oneshot or a crossfade tick
+    runtime = PerformanceRuntime(orchestrator, handle_command)
+    
+    try:
+        runtime.run()
+    
     except KeyboardInterrupt:
         print("\n⚡ Interrupted by user.")
     finally:
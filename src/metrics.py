@@ -0,0 +1,211 @@
+import bisect
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Histogram bucket upper bounds, in seconds: sub-millisecond ticks up to multi-second renders
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                   0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Metric name plus its sorted (label, value) pairs
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus layout) with sum, count and max."""
+
+    __slots__ = ("bounds", "counts", "sum", "count", "max")
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation (max for the overflow bucket)."""
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank and seen:
+                return min(bound, self.max)
+        return self.max
+
+
+class _Timer:
+    __slots__ = ("registry", "key", "start")
+
+    def __init__(self, registry: "MetricsRegistry", key: MetricKey):
+        self.registry = registry
+        self.key = key
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry._observe(self.key, time.perf_counter() - self.start)
+        return False
+
+
+class _NullTimer:
+    """Shared do-nothing timer handed out while metrics are disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """
+    Process-wide counters and latency histograms for the hot paths:
+    classification, synthesis, normalization, cache lookups, disk writes,
+    playback loads and orchestrator ticks.
+
+    - inc(name, amount, **labels): counter (names end in _total)
+    - observe(name, seconds, **labels): histogram sample
+    - timer(name, **labels): context manager observing its wall time
+
+    Disabled, every call returns after one attribute check and timer()
+    hands back a shared no-op, so instrumentation can stay in the hot path.
+    Set BARDS_FORGE_METRICS=0 to start disabled.
+    """
+
+    def __init__(self, enabled: bool = True, prefix: str = "bardsforge"):
+        self.enabled = enabled
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._counters: Dict[MetricKey, float] = {}
+        self._histograms: Dict[MetricKey, Histogram] = {}
+
+    @staticmethod
+    def _key(name: str, labels: Dict) -> MetricKey:
+        return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+    # Recording
+
+    def inc(self, name: str, amount: float = 1.0, **labels):
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + amount
+
+    def observe(self, name: str, value: float, **labels):
+        if not self.enabled:
+            return
+        self._observe(self._key(name, labels), value)
+
+    def timer(self, name: str, **labels):
+        """with metrics.timer("generation_write_seconds", engine="numpy"): ..."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, self._key(name, labels))
+
+    def _observe(self, key: MetricKey, value: float):
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    # Reading
+
+    def counter(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get(self._key(name, labels), 0.0)
+
+    def histogram(self, name: str, **labels) -> Optional[Histogram]:
+        with self._lock:
+            return self._histograms.get(self._key(name, labels))
+
+    def snapshot(self) -> Dict:
+        """Plain-dict copy of every metric, for JSON or tests."""
+        with self._lock:
+            return {
+                "counters": {self._format_key(key): value for key, value in self._counters.items()},
+                "histograms": {
+                    self._format_key(key): {
+                        "count": h.count, "sum": h.sum, "max": h.max,
+                        "p50": h.quantile(0.5), "p99": h.quantile(0.99)
+                    }
+                    for key, h in self._histograms.items()
+                }
+            }
+
+    def report(self) -> List[str]:
+        """Human-readable lines for the 'stats' command."""
+        snapshot = self.snapshot()
+        lines = []
+        for name, h in sorted(snapshot["histograms"].items()):
+            lines.append(f"{name}: {h['count']}x, mean {h['sum'] / h['count'] * 1000:.2f}ms, "
+                         f"p50 <= {h['p50'] * 1000:.2f}ms, p99 <= {h['p99'] * 1000:.2f}ms, max {h['max'] * 1000:.2f}ms")
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f"{name}: {value:g}")
+        return lines
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted((key, (tuple(h.counts), h.sum, h.count, h.bounds)) for key, h in self._histograms.items())
+
+        lines = []
+        typed = set()
+        for (name, labels), value in counters:
+            full = f"{self.prefix}_{name}"
+            if full not in typed:
+                typed.add(full)
+                lines.append(f"# TYPE {full} counter")
+            lines.append(f"{full}{self._format_labels(labels)} {value:g}")
+
+        for (name, labels), (counts, total, count, bounds) in histograms:
+            full = f"{self.prefix}_{name}"
+            if full not in typed:
+                typed.add(full)
+                lines.append(f"# TYPE {full} histogram")
+            cumulative = 0
+            for bound, bucket in zip(bounds + (float("inf"),), counts):
+                cumulative += bucket
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(f"{full}_bucket{self._format_labels(labels + (('le', le),))} {cumulative}")
+            lines.append(f"{full}_sum{self._format_labels(labels)} {total:.9g}")
+            lines.append(f"{full}_count{self._format_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+        if not labels:
+            return ""
+        escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in labels)
+        return "{" + ",".join(f'{label}="{value}"' for (label, _), value in zip(labels, escaped)) + "}"
+
+    def _format_key(self, key: MetricKey) -> str:
+        name, labels = key
+        return name + self._format_labels(labels)
+
+
+# The registry every module records into
+metrics = MetricsRegistry(enabled=os.environ.get("BARDS_FORGE_METRICS", "1") != "0")
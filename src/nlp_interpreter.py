@@ -1,5 +1,3 @@
-from transformers import pipeline
-import torch
 import re
 from typing import Optional, Dict, List, Any
 
@@ -10,17 +8,32 @@ class NLPInterpreter:
         self.device = "cpu"
         print(f"🧠 NLP Interpreter using device: {self.device}")
         
+        # The zero-shot model is only needed when keyword matching fails,
+        # so transformers is imported and the model loaded on first use
+        self._classifier = None
+        self._classifier_loaded = False
+    
+    @property
+    def classifier(self):
+        if not self._classifier_loaded:
+            self._classifier_loaded = True
+            self._classifier = self._load_classifier()
+        return self._classifier
+    
+    def _load_classifier(self):
         try:
-            self.classifier = pipeline(
+            from transformers import pipeline
+            classifier = pipeline(
                 "zero-shot-classification",
                 model="facebook/bart-large-mnli",
                 device=-1  # Force CPU for compatibility
             )
             print(f"✅ NLP model loaded successfully on {self.device.upper()}")
+            return classifier
         except Exception as e:
             print(f"⚠️ Could not load NLP model: {e}")
             print("🔄 Using keyword-based classification fallback")
-            self.classifier = None
+            return None
     
     def _extract_keywords(self, text: str) -> List[str]:
         # Simple keyword extraction - convert to lowercase and split
@@ -66,7 +79,7 @@ class NLPInterpreter:
         
         scene_keywords = {name: data.get("keywords", []) for name, data in scene_data.items()}
         scene_labels = list(scene_data.keys())
-
+        
         # First try keyword matching (fast and reliable)
         keywords = self._extract_keywords(text)
         keyword_result = self._match_keywords_to_scene(keywords, scene_keywords)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import soundfile as sf
+
+from generative_orchestrator import GenerativeOrchestrator
+from loudness import lookup, playback_gain
+from oneshot_scheduler import OneshotScheduler
+from sound_pack import read_sound
+from spatializer import Spatializer
+from structured_logging import configure_logging
+
+
+class OfflineSceneRenderer:
+    """
+    Headless scene renderer.
+    Runs the oneshot scheduler in simulated time and mixes a scene's bed and
+    oneshots straight into a WAV file, with no pygame mixer and no real-time
+    loop. Oneshots with 'pan'/'distance' are placed with the full spatializer,
+    including the interaural delay that live playback skips. Used for
+    deterministic benchmarks and for pre-baking long tracks.
+    """
+
+    def __init__(self, orchestrator: Optional[GenerativeOrchestrator] = None,
+                 sample_rate: int = 44100, block_seconds: float = 10.0):
+        self.orchestrator = orchestrator or GenerativeOrchestrator(audio_engine=None)
+        self.sample_rate = sample_rate
+        self.block_seconds = block_seconds
+        self.spatializer = Spatializer(sample_rate)
+        self.sound_cache = {}
+
+    def load_scenes_from_file(self, filepath: str) -> bool:
+        """Load scenes through the orchestrator so prompts resolve identically."""
+        return self.orchestrator.load_scenes_from_file(filepath)
+
+    def _load_audio(self, filepath: str) -> np.ndarray:
+        """
+        Decode a file to float32 (samples, channels) at the render sample rate.
+        Mono stays mono (one column broadcasts to both sides when mixed), so
+        cached sources take half the memory and can be placed per trigger.
+        """
+        abs_path = os.path.abspath(filepath)
+        audio = self.sound_cache.get(abs_path)
+        if audio is not None:
+            return audio
+
+        data, file_rate = read_sound(abs_path)
+
+        # Anything wider than stereo keeps its first two channels
+        if data.shape[1] > 2:
+            data = data[:, :2]
+
+        # Linear-interpolation resample (matches what the mixer does on load)
+        if file_rate != self.sample_rate and len(data) > 1:
+            out_len = int(round(len(data) * self.sample_rate / file_rate))
+            src_pos = np.arange(out_len) * (file_rate / self.sample_rate)
+            src_idx = np.arange(len(data))
+            data = np.stack([np.interp(src_pos, src_idx, data[:, ch]) for ch in range(data.shape[1])],
+                            axis=1).astype(np.float32)
+
+        # Same loudness-normalizing gain the live mixer applies, baked in once
+        gain = playback_gain(lookup(abs_path))
+        if gain != 1.0:
+            data = data * np.float32(gain)
+
+        audio = np.ascontiguousarray(data)
+        self.sound_cache[abs_path] = audio
+        return audio
+
+    def render(self, scene_name: str, duration: float, output_path: str, seed: int = 0) -> Dict:
+        """
+        Render 'duration' seconds of a scene to output_path.
+        Returns timing stats including the render speed as a multiple of real time.
+        """
+        if scene_name not in self.orchestrator.scenes:
+            raise KeyError(f"Scene '{scene_name}' not found")
+
+        scene = self.orchestrator.get_compiled_scene(scene_name)
+        rng = random.Random(seed)
+
+        # Resolve (and generate if needed) every file before the clock starts
+        prep_start = time.time()
+        bed = None
+        bed_file = self.orchestrator._get_compiled_file(scene.bed)
+        if bed_file:
+            bed = self._load_audio(bed_file)
+
+        oneshot_audio = []
+        for oneshot in scene.oneshots:
+            oneshot_file = self.orchestrator._get_compiled_file(oneshot)
+            oneshot_audio.append(self._load_audio(oneshot_file) if oneshot_file else None)
+        volume_min, volume_span = scene.volume_min.tolist(), scene.volume_span.tolist()
+        prep_time = time.time() - prep_start
+
+        # The scheduler hands back oneshot indices, which address the audio and volume tables
+        scheduler = OneshotScheduler(rng)
+        scheduler.reset(range(len(scene.oneshots)), 0.0, scene.rates)
+
+        total_samples = int(duration * self.sample_rate)
+        block_samples = max(1, int(self.block_seconds * self.sample_rate))
+        voices: List[list] = []  # [audio, start_sample, gain]
+        triggered = 0
+
+        render_start = time.time()
+        with sf.SoundFile(output_path, "w", samplerate=self.sample_rate, channels=2, subtype="PCM_16") as out:
+            for block_start in range(0, total_samples, block_samples):
+                block_end = min(block_start + block_samples, total_samples)
+                block = np.zeros((block_end - block_start, 2), dtype=np.float32)
+
+                # Looping bed
+                if bed is not None and len(bed) > 0:
+                    positions = np.arange(block_start, block_end) % len(bed)
+                    block += bed[positions] * scene.bed_volume
+
+                # Oneshots that start inside this block, at their exact sample
+                for trigger_time, index in scheduler.due(block_end / self.sample_rate, catch_up=True):
+                    audio = oneshot_audio[index]
+                    if audio is None:
+                        continue
+                    # Same draw as rng.uniform(volume_min, volume_max)
+                    gain = volume_min[index] + volume_span[index] * rng.random()
+                    oneshot = scene.oneshots[index]
+                    if oneshot.spatial:
+                        audio = self.spatializer.place(audio, *self.spatializer.draw_position(scene.placement[index], rng))
+                    voices.append([audio, int(trigger_time * self.sample_rate), gain])
+                    triggered += 1
+
+                # Mix every voice overlapping this block
+                still_playing = []
+                for voice in voices:
+                    audio, start, gain = voice
+                    src_from = max(0, block_start - start)
+                    src_to = min(len(audio), block_end - start)
+                    if src_to > src_from:
+                        dst = start + src_from - block_start
+                        block[dst:dst + (src_to - src_from)] += audio[src_from:src_to] * gain
+                    if start + len(audio) > block_end:
+                        still_playing.append(voice)
+                voices = still_playing
+
+                np.clip(block, -1.0, 1.0, out=block)
+                out.write(block)
+
+        render_time = time.time() - render_start
+        speed = duration / render_time if render_time > 0 else float("inf")
+
+        return {
+            "scene": scene_name,
+            "duration": duration,
+            "seed": seed,
+            "oneshots_triggered": triggered,
+            "prep_time": prep_time,
+            "render_time": render_time,
+            "realtime_factor": speed,
+            "output": output_path
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Render a scene offline to WAV")
+    parser.add_argument("scene", help="Scene name from the scenes file")
+    parser.add_argument("duration", type=float, help="Length to render, in seconds")
+    parser.add_argument("-o", "--output", help="Output WAV path (default: <scene>_<duration>s.wav)")
+    parser.add_argument("--scenes", default="scenes_v2.json", help="Scenes JSON file")
+    parser.add_argument("--seed", type=int, default=0, help="Scheduler seed for reproducible renders")
+    parser.add_argument("--sample-rate", type=int, default=44100)
+    parser.add_argument("--log-level", help="Console log level (default: WARNING)")
+    parser.add_argument("--log-jsonl", help="Also write every generation/playback event to this JSONL file")
+    args = parser.parse_args(argv)
+
+    configure_logging(args.log_level, args.log_jsonl)
+
+    renderer = OfflineSceneRenderer(sample_rate=args.sample_rate)
+    if not renderer.load_scenes_from_file(args.scenes):
+        return 1
+
+    output = args.output or f"{args.scene}_{int(args.duration)}s.wav"
+    try:
+        stats = renderer.render(args.scene, args.duration, output, seed=args.seed)
+    except KeyError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"🎬 Rendered '{stats['scene']}' ({stats['duration']:.1f}s) -> {stats['output']}")
+    print(f"🔊 Oneshots triggered: {stats['oneshots_triggered']}")
+    print(f"⏱️ Prep: {stats['prep_time']:.3f}s | Mix: {stats['render_time']:.3f}s")
+    print(f"🚀 Render speed: {stats['realtime_factor']:.1f}x real-time")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
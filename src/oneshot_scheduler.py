@@ -0,0 +1,103 @@
+import math
+import random
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+class OneshotScheduler:
+    """
+    Schedules scene oneshots as independent Poisson processes.
+    Each oneshot's 'prob_per_sec' is its mean trigger rate; the scheduler
+    keeps the next due time for every oneshot in an array so callers can
+    drive it from the wall clock (live playback) or from simulated time
+    (offline render), and a tick is one vectorized comparison.
+    """
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()
+        # Parallel arrays: oneshots[i] fires at rate rates[i] and is next due at due_times[i]
+        self.oneshots: List = []
+        self.rates = np.zeros(0)
+        self.due_times = np.zeros(0)
+        # min(due_times), kept current so an idle tick is a single float compare
+        self.next_due = math.inf
+
+    def _next_time(self, rate: float, after: float) -> float:
+        if rate <= 0:
+            return math.inf
+        return after + self.rng.expovariate(rate)
+
+    def reset(self, oneshots: List, now: float, rates: Optional[np.ndarray] = None):
+        """
+        Start scheduling a fresh set of oneshots from time 'now'.
+        rates defaults to each config's 'prob_per_sec'; compiled scenes pass
+        their rate table.
+        """
+        self.oneshots = list(oneshots)
+        if rates is None:
+            rates = [oneshot.get("prob_per_sec", 0) for oneshot in self.oneshots]
+        self.rates = np.array(rates, dtype=np.float64)
+        self.due_times = np.array([self._next_time(rate, now) for rate in self.rates.tolist()], dtype=np.float64)
+        self._update_next_due()
+
+    def add(self, oneshot, now: float, rate: Optional[float] = None):
+        """Add a oneshot to the running schedule."""
+        rate = oneshot.get("prob_per_sec", 0) if rate is None else rate
+        self.oneshots.append(oneshot)
+        self.rates = np.append(self.rates, rate)
+        self.due_times = np.append(self.due_times, self._next_time(rate, now))
+        self._update_next_due()
+
+    def clear(self):
+        self.reset([], 0.0)
+
+    def _update_next_due(self):
+        self.next_due = float(np.minimum.reduce(self.due_times)) if self.due_times.size else math.inf
+
+    def next_due_time(self) -> float:
+        """Time of the next trigger (math.inf when nothing is scheduled)."""
+        return self.next_due
+
+    def due_indices(self, now: float) -> List[int]:
+        """
+        Indices of the oneshots due at 'now' (live playback), earliest first.
+        Each fires at most once per call and is rescheduled from 'now', so a
+        stalled loop never produces a burst. Between triggers this is a
+        single comparison against the earliest due time.
+        """
+        if now < self.next_due:
+            return []
+        fired = (self.due_times <= now).nonzero()[0].tolist()
+        if len(fired) > 1:
+            fired.sort(key=self.due_times.item)
+        for index in sorted(fired):
+            self.due_times[index] = self._next_time(self.rates.item(index), now)
+        self._update_next_due()
+        return fired
+
+    def due(self, now: float, catch_up: bool = False) -> List[Tuple[float, object]]:
+        """
+        Return (trigger_time, oneshot) pairs that are due at 'now'.
+        Live playback fires each oneshot at most once per call and schedules
+        the next trigger from 'now', so a stalled loop never produces a burst.
+        With catch_up=True every trigger up to 'now' is returned at its exact
+        time, which is what simulated-time rendering wants.
+        """
+        fired = []
+        if now < self.next_due:
+            return fired
+        for index in (self.due_times <= now).nonzero()[0].tolist():
+            oneshot, rate = self.oneshots[index], float(self.rates[index])
+            if catch_up:
+                while self.due_times[index] <= now:
+                    due_time = float(self.due_times[index])
+                    fired.append((due_time, oneshot))
+                    self.due_times[index] = self._next_time(rate, due_time)
+            else:
+                fired.append((float(self.due_times[index]), oneshot))
+                self.due_times[index] = self._next_time(rate, now)
+
+        self._update_next_due()
+        fired.sort(key=lambda item: item[0])
+        return fired
@@ -1,7 +1,8 @@
 import json
 import random
 import time
-import os
+
+from sound_pack import sound_exists
 
 
 class Orchestrator:
@@ -18,12 +19,12 @@ class Orchestrator:
         is_valid = True
         for scene_name, data in scenes_data.items():
             bed_info = data.get("bed", {})
-            if "file" in bed_info and not os.path.exists(bed_info["file"]):
+            if "file" in bed_info and not sound_exists(bed_info["file"]):
                 print(f"Validation Error: Bed file not found for scene '{scene_name}': {bed_info['file']}")
                 is_valid = False
             
             for oneshot in data.get("oneshots", []):
-                if "file" in oneshot and not os.path.exists(oneshot["file"]):
+                if "file" in oneshot and not sound_exists(oneshot["file"]):
                     print(f"Validation Error: Oneshot file not found for scene '{scene_name}': {oneshot['file']}")
                     is_valid = False
         return is_valid
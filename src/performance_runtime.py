@@ -0,0 +1,150 @@
+import asyncio
+import math
+import os
+import sys
+import threading
+import time
+from typing import Awaitable, Callable, Optional
+
+
+class PerformanceRuntime:
+    """
+    Event-driven runtime for live performance.
+    Stdin lines, oneshot due times, scene crossfades and background
+    generation completions are all awaitable events, so the process sleeps
+    until the next one instead of polling, and reacts to input immediately.
+    """
+
+    def __init__(self, orchestrator, handle_command: Callable[[str], Awaitable[bool]],
+                 transition_tick: float = 0.02):
+        self.orchestrator = orchestrator
+        self.handle_command = handle_command
+        self.transition_tick = transition_tick
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lines: Optional[asyncio.Queue] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._pending = b""
+        self._running = False
+
+    # Events from other threads
+
+    def wake(self):
+        """Re-evaluate the schedule now (safe to call from any thread)."""
+        if self.loop is None or self._wakeup is None:
+            return
+        try:
+            self.loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            pass  # loop already closed
+
+    def _push_line(self, line: Optional[str]):
+        self._lines.put_nowait(line)
+        self._wakeup.set()
+
+    def _on_stdin_readable(self):
+        # Read the raw fd: a buffered readline() can swallow several lines at
+        # once, leaving the fd unreadable with commands stuck in the buffer
+        fd = sys.stdin.fileno()
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            self.loop.remove_reader(fd)
+            if self._pending:
+                self._push_line(self._pending.decode(errors="replace"))
+            self._push_line(None)
+            return
+
+        *lines, self._pending = (self._pending + chunk).split(b"\n")
+        for line in lines:
+            self._push_line(line.decode(errors="replace") + "\n")
+
+    def _stdin_thread(self):
+        # Fallback for platforms where the loop can't watch stdin (e.g. Windows)
+        while self._running:
+            line = sys.stdin.readline()
+            self.loop.call_soon_threadsafe(self._push_line, line if line else None)
+            if not line:
+                break
+
+    def _watch_stdin(self):
+        try:
+            self.loop.add_reader(sys.stdin.fileno(), self._on_stdin_readable)
+            return True
+        except (NotImplementedError, AttributeError, ValueError, OSError):
+            threading.Thread(target=self._stdin_thread, daemon=True).start()
+            return False
+
+    # Helpers for command handlers
+
+    async def ainput(self, prompt: str = "") -> str:
+        """Await the next line of input without stalling scheduled sounds."""
+        if prompt:
+            print(prompt, end="", flush=True)
+        line = await self._lines.get()
+        if line is None:
+            raise EOFError
+        return line.rstrip("\n")
+
+    async def run_blocking(self, func: Callable, *args):
+        """Run a blocking call (e.g. generation) off the loop and await its completion."""
+        try:
+            return await self.loop.run_in_executor(None, func, *args)
+        finally:
+            self._wakeup.set()
+
+    # Main loop
+
+    def _next_timeout(self) -> Optional[float]:
+        """Seconds until the orchestrator next needs attention (None = only on events)."""
+        if self.orchestrator.transitions.fading:
+            return self.transition_tick
+
+        next_due = self.orchestrator.scheduler.next_due_time()
+        if math.isinf(next_due) or not self.orchestrator.current_scene:
+            return None
+        return max(0.0, next_due - time.time())
+
+    async def _command_loop(self):
+        while self._running:
+            line = await self._lines.get()
+            if line is None:
+                self._running = False
+                break
+            try:
+                keep_going = await self.handle_command(line.strip().lower())
+            except EOFError:
+                keep_going = False
+            if not keep_going:
+                self._running = False
+            self._wakeup.set()
+
+    async def _main(self):
+        self.loop = asyncio.get_running_loop()
+        self._lines = asyncio.Queue()
+        self._wakeup = asyncio.Event()
+        self._running = True
+
+        # Transitions finish loading on a worker thread; wake when they do
+        self.orchestrator.transitions.on_ready = self.wake
+
+        watching = self._watch_stdin()
+        commands = asyncio.create_task(self._command_loop())
+
+        try:
+            while self._running:
+                self.orchestrator.update()
+
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self._next_timeout())
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._running = False
+            self.orchestrator.transitions.on_ready = None
+            if watching:
+                self.loop.remove_reader(sys.stdin.fileno())
+            commands.cancel()
+
+    def run(self):
+        """Run until a command handler returns False or stdin closes."""
+        asyncio.run(self._main())
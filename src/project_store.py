@@ -0,0 +1,226 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from campaign_pipeline import run_pipeline
+
+DEFAULT_DB_PATH = "workshop_projects.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    name TEXT PRIMARY KEY,
+    description TEXT NOT NULL DEFAULT '',
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project TEXT,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    output TEXT,
+    status TEXT NOT NULL DEFAULT 'running',
+    created REAL NOT NULL,
+    finished REAL
+);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER NOT NULL REFERENCES jobs(id),
+    position INTEGER NOT NULL,
+    prompt TEXT NOT NULL,
+    duration REAL NOT NULL,
+    category TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    path TEXT,
+    error TEXT,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS items_by_job ON items (job_id, position);
+CREATE INDEX IF NOT EXISTS items_by_prompt ON items (prompt, duration, status);
+"""
+
+
+class ProjectStore:
+    """
+    On-disk workshop projects (SQLite).
+
+    Every generation the workshop runs - a single sound, a batch, a pack or a
+    campaign - is a job whose items (prompt, duration, category) are written
+    before rendering starts. Each finished item is committed with its file
+    path straight away, so a crash or Ctrl+C loses at most the item in
+    flight, and running the job again only renders what is still missing.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _execute(self, sql: str, params: Iterable = ()) -> sqlite3.Cursor:
+        with self._lock:
+            cursor = self._db.execute(sql, tuple(params))
+            self._db.commit()
+            return cursor
+
+    def _query(self, sql: str, params: Iterable = ()) -> List[Dict]:
+        with self._lock:
+            return [dict(row) for row in self._db.execute(sql, tuple(params))]
+
+    # Projects
+
+    def create_project(self, name: str, description: str = "") -> bool:
+        """Add a project; False if the name is taken."""
+        try:
+            self._execute("INSERT INTO projects (name, description, created) VALUES (?, ?, ?)",
+                          (name, description, time.time()))
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+    def list_projects(self) -> List[Dict]:
+        """Projects, oldest first, with their finished sound and unfinished job counts."""
+        return self._query("""
+            SELECT p.name, p.description, p.created,
+                   (SELECT COUNT(*) FROM items i JOIN jobs j ON i.job_id = j.id
+                    WHERE j.project = p.name AND i.status = 'done') AS sounds,
+                   (SELECT COUNT(*) FROM jobs j
+                    WHERE j.project = p.name AND j.status = 'running') AS unfinished
+            FROM projects p ORDER BY p.created
+        """)
+
+    def get_project(self, name: str) -> Optional[Dict]:
+        """
+        A project in the shape the workshop has always used: description,
+        created, sounds {prompt: path}, packs [pack dir] and
+        campaigns {name: {category: [path]}}.
+        """
+        rows = self._query("SELECT * FROM projects WHERE name = ?", (name,))
+        if not rows:
+            return None
+
+        project = dict(rows[0], sounds={}, packs=[], campaigns={})
+        for job in self._query("SELECT * FROM jobs WHERE project = ? ORDER BY id", (name,)):
+            if job["kind"] == "pack" and job["output"]:
+                project["packs"].append(job["output"])
+            campaign = project["campaigns"].setdefault(job["name"], {}) if job["kind"] == "campaign" else None
+            for item in self._query("SELECT * FROM items WHERE job_id = ? AND status = 'done' ORDER BY position",
+                                    (job["id"],)):
+                project["sounds"][item["prompt"]] = item["path"]
+                if campaign is not None:
+                    campaign.setdefault(item["category"], []).append(item["path"])
+        return project
+
+    # Jobs
+
+    def start_job(self, project: Optional[str], kind: str, name: str, items: Iterable[Tuple],
+                  output: Optional[str] = None) -> int:
+        """
+        Record a job and its items, each (prompt, duration) or (prompt,
+        duration, category), before any rendering. An unfinished job
+        with the same project, kind and name is resumed instead of duplicated.
+        """
+        existing = self._query(
+            "SELECT id FROM jobs WHERE project IS ? AND kind = ? AND name = ? AND status = 'running' "
+            "ORDER BY id DESC LIMIT 1", (project, kind, name))
+        if existing:
+            return existing[0]["id"]
+
+        now = time.time()
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT INTO jobs (project, kind, name, output, created) VALUES (?, ?, ?, ?, ?)",
+                (project, kind, name, output, now))
+            job_id = cursor.lastrowid
+            self._db.executemany(
+                "INSERT INTO items (job_id, position, prompt, duration, category, updated) VALUES (?, ?, ?, ?, ?, ?)",
+                [(job_id, position, item[0], float(item[1]), item[2] if len(item) > 2 else None, now)
+                 for position, item in enumerate(items)])
+            self._db.commit()
+        return job_id
+
+    def get_job(self, job_id: int) -> Optional[Dict]:
+        rows = self._query("SELECT * FROM jobs WHERE id = ?", (job_id,))
+        return rows[0] if rows else None
+
+    def unfinished_jobs(self, project: Optional[str] = None) -> List[Dict]:
+        """Jobs that stopped before every item was done, with their progress."""
+        sql = """
+            SELECT j.*, COUNT(i.id) AS total, SUM(i.status = 'done') AS done
+            FROM jobs j JOIN items i ON i.job_id = j.id
+            WHERE j.status = 'running' {} GROUP BY j.id ORDER BY j.id
+        """
+        if project is None:
+            return self._query(sql.format(""))
+        return self._query(sql.format("AND j.project = ?"), (project,))
+
+    def job_items(self, job_id: int) -> List[Dict]:
+        return self._query("SELECT * FROM items WHERE job_id = ? ORDER BY position", (job_id,))
+
+    def pending_items(self, job_id: int) -> List[Dict]:
+        """Items still to render: not done yet, or done but their file has since been deleted."""
+        return [item for item in self.job_items(job_id)
+                if item["status"] != "done" or not (item["path"] and os.path.exists(item["path"]))]
+
+    def complete_item(self, item_id: int, path: str):
+        """Checkpoint one rendered item."""
+        self._execute("UPDATE items SET status = 'done', path = ?, error = NULL, updated = ? WHERE id = ?",
+                      (path, time.time(), item_id))
+
+    def fail_item(self, item_id: int, error: str):
+        self._execute("UPDATE items SET status = 'failed', error = ?, updated = ? WHERE id = ?",
+                      (error, time.time(), item_id))
+
+    def finish_job(self, job_id: int) -> bool:
+        """Close the job if every item is done; otherwise it stays resumable."""
+        if self.pending_items(job_id):
+            return False
+        self._execute("UPDATE jobs SET status = 'done', finished = ? WHERE id = ?", (time.time(), job_id))
+        return True
+
+    def find_sound(self, prompt: str, duration: float) -> Optional[str]:
+        """A file already rendered for this prompt and duration by any job, if it still exists."""
+        for row in self._query("SELECT path FROM items WHERE prompt = ? AND duration = ? AND status = 'done' "
+                               "ORDER BY updated DESC", (prompt, float(duration))):
+            if row["path"] and os.path.exists(row["path"]):
+                return row["path"]
+        return None
+
+    def run_job(self, job_id: int, render: Callable[[Dict], Optional[str]],
+                on_progress: Optional[Callable[[Dict, Optional[str], Dict], None]] = None,
+                max_workers: int = 1, finish: Optional[Callable[[Dict, str], Optional[str]]] = None,
+                key: Optional[Callable[[Dict], Hashable]] = None) -> Dict:
+        """
+        Render a job's pending items through the campaign pipeline,
+        checkpointing each one as it completes.
+
+        render(item) gets the item row (prompt, duration, category, position)
+        and returns the file path, or None on failure; items with the same
+        key(item) (by default the same prompt, see plan_work) are rendered
+        once. finish(item, path) may turn that path into the item's own file.
+        on_progress(item, path, progress) sees every item with the
+        pipeline's progress and ETA. Failed items are retried the next time
+        the job runs. Returns the job's item counts.
+        """
+        pending = self.pending_items(job_id)
+        for item, path, progress in run_pipeline(pending, render, max_workers=max_workers,
+                                                 finish=finish, key=key):
+            if path:
+                self.complete_item(item["id"], path)
+            else:
+                self.fail_item(item["id"], "generation failed")
+            if on_progress:
+                on_progress(item, path, progress)
+
+        self.finish_job(job_id)
+        items = self.job_items(job_id)
+        done = sum(1 for item in items if item["status"] == "done")
+        return {"total": len(items), "done": done, "failed": len(items) - done}
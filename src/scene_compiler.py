@@ -0,0 +1,226 @@
+import json
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from cache_keys import canonical_prompt, quantize_duration
+from sound_pack import sound_exists, split_member_path
+from spatializer import Spatializer
+
+# Clip length for generated sounds whose config gives no 'duration'
+DEFAULT_DURATION = 3.0
+
+# Bump when the compiled layout changes so old sidecars are recompiled
+COMPILER_VERSION = 2
+SIDECAR_SUFFIX = ".compiled"
+
+
+def resolve_prompt(audio_config: Dict, context: str = "") -> str:
+    """
+    Work out the generation prompt for an audio config.
+    Uses 'prompt' if present, otherwise infers one from the file name,
+    and prefixes the context string.
+    """
+    prompt = audio_config.get("prompt", "")
+
+    # If no prompt but we have a broken file path, try to infer from filename
+    if not prompt and "file" in audio_config:
+        # Pack members ("pack.bfpack#03_wolf_howl") are named after their member
+        filename = os.path.basename(audio_config["file"]).split("#")[-1]
+        prompt = filename.replace("_", " ").replace(".wav", "").replace(".mp3", "")
+
+    # Add context to prompt
+    if context and prompt:
+        prompt = f"{context} {prompt}"
+    elif context and not prompt:
+        prompt = context
+
+    return prompt
+
+
+def bed_context(scene_name: str) -> str:
+    return f"{scene_name} ambient background"
+
+
+def oneshot_context(scene_name: str) -> str:
+    return f"{scene_name} oneshot"
+
+
+class CompiledSound:
+    """
+    A bed or oneshot with everything the live path needs worked out at load:
+    the pre-recorded file to play (None when it must be generated), the
+    generation prompt with its context prefix, and the variant pool key.
+    """
+
+    __slots__ = ("config", "file", "prompt", "duration", "pool_prompt", "pool_duration", "spatial")
+
+    def __init__(self, config: Dict, context: str):
+        self.config = config
+        self.file = config["file"] if config.get("file") and sound_exists(config["file"]) else None
+        self.prompt = resolve_prompt(config, context)
+        self.duration = float(config.get("duration", DEFAULT_DURATION))
+        self.pool_prompt = canonical_prompt(self.prompt)
+        self.pool_duration = quantize_duration(self.duration)
+        self.spatial = Spatializer.is_spatial(config)
+
+    _RECORD_FIELDS = ("file", "prompt", "duration", "pool_prompt", "pool_duration", "spatial")
+
+    def to_record(self) -> List:
+        return [getattr(self, field) for field in self._RECORD_FIELDS]
+
+    @classmethod
+    def from_record(cls, config: Dict, record: List) -> "CompiledSound":
+        """Restore a sidecar record without resolving anything again."""
+        sound = cls.__new__(cls)
+        sound.config = config
+        for field, value in zip(cls._RECORD_FIELDS, record):
+            setattr(sound, field, value)
+        return sound
+
+
+class CompiledScene:
+    """
+    One scene ready to play: the compiled bed, the compiled oneshots, and
+    their trigger rates, volume ranges and placement bounds as arrays
+    indexed like the oneshots, so a tick is array lookups instead of dict
+    reads. placement rows are Spatializer.placement_bounds().
+    """
+
+    __slots__ = ("name", "data", "bed", "bed_volume", "oneshots", "rates", "volume_min", "volume_span",
+                 "placement")
+
+    def __init__(self, name: str, data: Dict):
+        self.name = name
+        self.data = data
+        bed_info = data.get("bed") or {}
+        self.bed_volume = float(bed_info.get("volume", 0.7))
+        self.bed = CompiledSound(bed_info, bed_context(name)) if bed_info else None
+        self.oneshots: List[CompiledSound] = [CompiledSound(config, oneshot_context(name))
+                                              for config in data.get("oneshots", [])]
+        self._build_tables()
+
+    def _build_tables(self):
+        configs = [oneshot.config for oneshot in self.oneshots]
+        self.rates = np.array([config.get("prob_per_sec", 0) for config in configs], dtype=np.float64)
+        self.volume_min = np.array([config.get("volume_min", 0.5) for config in configs], dtype=np.float64)
+        self.volume_span = np.array([config.get("volume_max", 1.0) for config in configs], dtype=np.float64) - self.volume_min
+        self.placement = np.array([Spatializer.placement_bounds(config) for config in configs],
+                                  dtype=np.float64).reshape(-1, 4)
+
+    def add_oneshot(self, config: Dict) -> CompiledSound:
+        """Compile a oneshot added at runtime and extend the tables."""
+        oneshot = CompiledSound(config, oneshot_context(self.name))
+        self.oneshots.append(oneshot)
+        self._build_tables()
+        return oneshot
+
+    def to_record(self) -> Dict:
+        return {
+            "bed": self.bed.to_record() if self.bed else None,
+            "bed_volume": self.bed_volume,
+            "oneshots": [oneshot.to_record() for oneshot in self.oneshots],
+            "tables": [self.rates.tolist(), self.volume_min.tolist(), self.volume_span.tolist()],
+            "placement": self.placement.tolist()
+        }
+
+    @classmethod
+    def from_record(cls, name: str, data: Dict, record: Dict) -> "CompiledScene":
+        """Restore a sidecar record: no file checks, prompt resolution or table building."""
+        scene = cls.__new__(cls)
+        scene.name = name
+        scene.data = data
+        scene.bed_volume = record["bed_volume"]
+        scene.bed = CompiledSound.from_record(data["bed"], record["bed"]) if record["bed"] else None
+        scene.oneshots = [CompiledSound.from_record(config, oneshot)
+                          for config, oneshot in zip(data.get("oneshots", []), record["oneshots"])]
+        scene.rates, scene.volume_min, scene.volume_span = (np.array(table, dtype=np.float64)
+                                                            for table in record["tables"])
+        scene.placement = np.array(record["placement"], dtype=np.float64).reshape(-1, 4)
+        return scene
+
+
+def compile_scenes(scenes: Dict) -> Dict[str, CompiledScene]:
+    return {name: CompiledScene(name, data) for name, data in scenes.items()}
+
+
+def sidecar_path(filepath: str) -> str:
+    return filepath + SIDECAR_SUFFIX
+
+
+def _dependencies(scenes: Dict) -> Dict[str, Optional[int]]:
+    """
+    What resolved file paths depend on besides the JSON itself: the
+    directory of every referenced file (its mtime changes when a file is
+    added or removed) and every referenced pack.
+    """
+    paths = set()
+    for data in scenes.values():
+        for config in [data.get("bed") or {}] + list(data.get("oneshots", [])):
+            if config.get("file"):
+                member = split_member_path(config["file"])
+                paths.add(member[0] if member else os.path.dirname(config["file"]) or ".")
+
+    stamps = {}
+    for path in sorted(paths):
+        try:
+            stamps[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            stamps[path] = None
+    return stamps
+
+
+def _source_key(filepath: str) -> Dict:
+    stat = os.stat(filepath)
+    return {"version": COMPILER_VERSION, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def load_compiled_scenes(filepath: str, on_compile: Optional[Callable[[Dict], None]] = None
+                         ) -> Tuple[Dict, Dict[str, CompiledScene], bool]:
+    """
+    Scenes and their compiled form for a scenes file.
+
+    The compiled form is cached in a sidecar (<file>.compiled) keyed by
+    the JSON's mtime and size and the stamps of the directories its files
+    live in; while those match, loading skips parsing the original and
+    resolving any file or prompt. Otherwise the scenes are compiled,
+    on_compile(scenes) runs (validation), and the sidecar is rewritten.
+    Returns (scenes, compiled, whether the sidecar was used).
+    Raises FileNotFoundError / json.JSONDecodeError like json.load.
+    """
+    key = _source_key(filepath)
+    sidecar = sidecar_path(filepath)
+    try:
+        with open(sidecar, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("source") == key and _dependencies(cached["scenes"]) == cached["dependencies"]:
+            scenes = cached["scenes"]
+            compiled = {name: CompiledScene.from_record(name, data, cached["compiled"][name])
+                        for name, data in scenes.items()}
+            return scenes, compiled, True
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    with open(filepath, "r") as f:
+        scenes = json.load(f)
+    if on_compile:
+        on_compile(scenes)
+    compiled = compile_scenes(scenes)
+
+    record = {
+        "source": key,
+        "dependencies": _dependencies(scenes),
+        "scenes": scenes,
+        "compiled": {name: scene.to_record() for name, scene in compiled.items()}
+    }
+    try:
+        tmp_path = f"{sidecar}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            # One dumps call runs the C encoder; json.dump streams through the pure-Python one
+            f.write(json.dumps(record))
+        os.replace(tmp_path, sidecar)
+    except OSError:
+        # Read-only location: compile on every load instead
+        pass
+    return scenes, compiled, False
@@ -0,0 +1,188 @@
+import math
+import threading
+import time
+from typing import Callable, Optional, Set
+
+from structured_logging import get_logger
+
+logger = get_logger("scene_transition")
+
+
+class SceneTransition:
+    """State of a single in-flight scene change."""
+
+    LOADING = "loading"
+    FADING = "fading"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    def __init__(self, scene_name: str, bed_volume: float, old_channel, old_files: Set[str], old_sound=None):
+        self.scene_name = scene_name
+        self.bed_volume = bed_volume
+        self.old_channel = old_channel
+        # What the old channel was playing; anything else means the mixer gave the channel away
+        self.old_sound = old_sound
+        # The old scene's live file set: oneshots it plays while the new bed loads still land here
+        self.old_files = old_files
+        # The new scene's file set, started once its bed plays; the caller adds its oneshots to it
+        self.new_files: Set[str] = set()
+        self.bed_file: Optional[str] = None
+        self.new_channel = None
+        self.state = self.LOADING
+        self.requested_at = time.time()
+        self.fade_start = None
+        self.ready = threading.Event()
+
+
+class SceneTransitionEngine:
+    """
+    Crossfades between scene beds without a stop-and-restart.
+    The target bed is resolved (and generated if needed) on a background
+    thread while the old bed keeps playing; once it is decoded the two beds
+    run an equal-power crossfade and only then is the old scene released.
+    """
+
+    def __init__(self, audio_engine, crossfade_time: float = 3.0):
+        self.audio_engine = audio_engine
+        self.crossfade_time = crossfade_time
+        self.current: Optional[SceneTransition] = None
+        # Called from the loader thread once a target bed is ready
+        self.on_ready: Optional[Callable[[], None]] = None
+
+    @property
+    def active(self) -> bool:
+        """True while a transition is loading or fading."""
+        return self.current is not None and self.current.state in (SceneTransition.LOADING, SceneTransition.FADING)
+
+    @property
+    def fading(self) -> bool:
+        """True while gains need updating every tick."""
+        return self.current is not None and self.current.state == SceneTransition.FADING
+
+    def start(self, scene_name: str, resolve_bed: Callable[[], Optional[str]], bed_volume: float,
+              old_channel, old_files: Set[str]) -> SceneTransition:
+        """
+        Begin a transition to scene_name.
+        resolve_bed runs on a worker thread and returns the bed file path.
+        old_files is the caller's live set of files the old scene plays; it is
+        kept by reference, and whatever it holds when the fade completes is
+        released (except files the new scene uses).
+        """
+        # A newer request supersedes whatever is in flight
+        if self.current is not None:
+            if self.current.state == SceneTransition.FADING:
+                self._finish(self.current)
+            elif self.current.state == SceneTransition.LOADING:
+                self.current.state = SceneTransition.CANCELLED
+
+        transition = SceneTransition(scene_name, bed_volume, old_channel, old_files,
+                                     self.audio_engine.channel_sound(old_channel))
+        self.current = transition
+
+        def load():
+            try:
+                bed_file = resolve_bed()
+                # Decode now so the crossfade starts without a load stall
+                if bed_file and self.audio_engine.load_sound(bed_file) is not None:
+                    transition.bed_file = bed_file
+            except Exception as e:
+                logger.error("❌ Error preparing scene '%s': %s", scene_name, e, extra={"scene": scene_name})
+            finally:
+                transition.ready.set()
+                if self.on_ready:
+                    self.on_ready()
+
+        threading.Thread(target=load, daemon=True).start()
+        return transition
+
+    def update(self, now: Optional[float] = None) -> Optional[SceneTransition]:
+        """
+        Advance the current transition.
+        Returns the transition on the tick its new bed starts playing, so the
+        caller can switch its active scene at that moment.
+        """
+        transition = self.current
+        if transition is None:
+            return None
+
+        now = time.time() if now is None else now
+
+        if transition.state == SceneTransition.LOADING:
+            if not transition.ready.is_set():
+                return None
+
+            if not transition.bed_file:
+                transition.state = SceneTransition.FAILED
+                logger.warning("⚠️ Warning: Could not load or generate bed sound for scene: %s", transition.scene_name,
+                               extra={"scene": transition.scene_name})
+                return None
+
+            transition.new_channel = self.audio_engine.play_sound(transition.bed_file, loop=True, volume=transition.bed_volume)
+            if transition.new_channel is None:
+                transition.state = SceneTransition.FAILED
+                return None
+
+            transition.new_files = {transition.bed_file}
+            transition.fade_start = now
+            transition.state = SceneTransition.FADING
+            self._apply_gains(transition, 0.0)
+            return transition
+
+        if transition.state == SceneTransition.FADING:
+            if self.crossfade_time <= 0:
+                self._finish(transition)
+                return None
+
+            progress = (now - transition.fade_start) / self.crossfade_time
+            if progress >= 1.0:
+                self._finish(transition)
+            else:
+                self._apply_gains(transition, progress)
+
+        return None
+
+    def cancel(self):
+        """
+        Abandon any pending transition (used when the scene is stopped outright).
+        Mid-fade, the old scene is dropped as it would have been at the end.
+        """
+        transition = self.current
+        if transition is not None and transition.state == SceneTransition.FADING:
+            self._stop_old(transition)
+            self._release_old(transition)
+        if transition is not None and self.active:
+            transition.state = SceneTransition.CANCELLED
+        self.current = None
+
+    def _owns_old_channel(self, transition: SceneTransition) -> bool:
+        """False once find_channel(True) has stolen the old bed's channel for another sound."""
+        return self.audio_engine.channel_sound(transition.old_channel) is transition.old_sound
+
+    def _stop_old(self, transition: SceneTransition):
+        if self._owns_old_channel(transition):
+            self.audio_engine.stop_channel(transition.old_channel)
+            # The mixer hands this channel out again; don't leave it at the fade's last gain
+            self.audio_engine.set_channel_volume(transition.old_channel, 1.0)
+
+    def _release_old(self, transition: SceneTransition):
+        for filepath in transition.old_files - transition.new_files:
+            self.audio_engine.release_sound(filepath)
+
+    def _apply_gains(self, transition: SceneTransition, progress: float):
+        """Equal-power crossfade: old and new gains always sum to unit power."""
+        angle = progress * math.pi / 2
+        if self._owns_old_channel(transition):
+            self.audio_engine.set_channel_volume(transition.old_channel, math.cos(angle))
+        self.audio_engine.set_channel_volume(transition.new_channel, math.sin(angle))
+
+    def _finish(self, transition: SceneTransition):
+        """Complete the fade and only now release the old scene's resources."""
+        self.audio_engine.set_channel_volume(transition.new_channel, 1.0)
+        self._stop_old(transition)
+        self._release_old(transition)
+
+        transition.state = SceneTransition.DONE
+        elapsed = time.time() - transition.requested_at
+        logger.info("✅ Transitioned to '%s' (%.2fs)", transition.scene_name, elapsed,
+                    extra={"scene": transition.scene_name, "latency": elapsed})
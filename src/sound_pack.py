@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+
+import argparse
+import io
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+from loudness import analyze_channels, lookup
+
+PACK_EXTENSION = ".bfpack"
+PACK_FORMATS = ("pcm16", "flac")
+
+# Fixed header: magic, version, index length; the JSON index follows, then the payloads
+_MAGIC = b"BFPK"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHI")
+
+# Members are addressed as "<pack path>#<member name>" wherever a file path is accepted
+MEMBER_SEPARATOR = "#"
+
+
+def _loudness(filepath: str, audio: np.ndarray, sample_rate: int) -> Dict[str, float]:
+    """
+    Member loudness (RMS, LUFS, true peak), stored in the index so nothing
+    rescans audio at play time. Reuses the generator's analysis when the
+    source file has one.
+    """
+    return lookup(filepath) or analyze_channels(audio / np.float32(32768.0), sample_rate)
+
+
+def write_pack(path: str, name: str, members: List[Dict], fmt: str = "pcm16") -> str:
+    """
+    Write a pack container from members {"name", "prompt", "file"}.
+
+    Layout: "BFPK", version, index length, the JSON index (pack name and,
+    per member, name, prompt, offset, length, format, sample rate,
+    channels, frames and loudness), then the payloads back to back.
+    pcm16 payloads are raw little-endian int16 frames that can be viewed
+    straight out of the mapped file; flac payloads are complete FLAC
+    streams, smaller but decoded on load.
+    """
+    if fmt not in PACK_FORMATS:
+        raise ValueError(f"Unknown pack format '{fmt}' (expected one of {PACK_FORMATS})")
+
+    tmp_path = f"{path}.tmp"
+    # Payloads stream to a spool file one member at a time; the index, which
+    # needs every offset, is written ahead of them once they are all known
+    with tempfile.TemporaryFile(dir=os.path.dirname(os.path.abspath(path))) as spool:
+        index, offset = [], 0
+        for member in members:
+            # PCM16 sources come through bit-exact; anything else is converted by libsndfile
+            audio, sample_rate = sf.read(member["file"], dtype="int16", always_2d=True)
+            if fmt == "pcm16":
+                payload = audio.astype("<i2").tobytes()
+            else:
+                buffer = io.BytesIO()
+                sf.write(buffer, audio, sample_rate, format="FLAC", subtype="PCM_16")
+                payload = buffer.getvalue()
+            spool.write(payload)
+
+            index.append({
+                "name": member["name"],
+                "prompt": member.get("prompt", ""),
+                "offset": offset,
+                "length": len(payload),
+                "format": fmt,
+                "sample_rate": sample_rate,
+                "channels": audio.shape[1],
+                "frames": audio.shape[0],
+                "loudness": _loudness(member["file"], audio, sample_rate)
+            })
+            offset += len(payload)
+
+        header = json.dumps({"name": name, "members": index}, ensure_ascii=False).encode("utf-8")
+        spool.seek(0)
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, len(header)))
+            f.write(header)
+            shutil.copyfileobj(spool, f, 1 << 20)
+    os.replace(tmp_path, path)
+    return path
+
+
+def pack_directory(pack_dir: str, output: Optional[str] = None, fmt: str = "pcm16") -> str:
+    """
+    Convert a loose pack directory (sound_packs/<name>/NN_prompt.wav) into
+    <pack_dir>.bfpack. Member names are the file names without extension;
+    prompts come from the file names the workshop writes.
+    """
+    name = os.path.basename(os.path.normpath(pack_dir))
+    members = []
+    for filename in sorted(os.listdir(pack_dir)):
+        stem, ext = os.path.splitext(filename)
+        if ext.lower() not in (".wav", ".flac", ".ogg"):
+            continue
+        prompt = stem.split("_", 1)[1] if stem[:2].isdigit() and "_" in stem else stem
+        members.append({"name": stem, "prompt": prompt.replace("_", " "), "file": os.path.join(pack_dir, filename)})
+    return write_pack(output or os.path.normpath(pack_dir) + PACK_EXTENSION, name, members, fmt)
+
+
+class SoundPack:
+    """
+    A pack container opened for reading: one open, one header read, and the
+    file memory-mapped. Members are decoded only when asked for.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self.mtime = os.fstat(f.fileno()).st_mtime
+            magic, version, index_length = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"Not a sound pack: {path}")
+            if version > _VERSION:
+                raise ValueError(f"Sound pack version {version} is newer than this reader ({_VERSION})")
+            index = json.loads(f.read(index_length).decode("utf-8"))
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.name: str = index["name"]
+        self.members: Dict[str, Dict] = {member["name"]: member for member in index["members"]}
+        self._data_start = _HEADER.size + index_length
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.members
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def names(self) -> List[str]:
+        return list(self.members)
+
+    def member_path(self, name: str) -> str:
+        """The path string that addresses this member anywhere a file path is accepted."""
+        return f"{self.path}{MEMBER_SEPARATOR}{name}"
+
+    def _payload(self, member: Dict) -> memoryview:
+        start = self._data_start + member["offset"]
+        return memoryview(self._mmap)[start:start + member["length"]]
+
+    def read_pcm16(self, name: str) -> Tuple[np.ndarray, int]:
+        """int16 frames (frames, channels) and sample rate; pcm16 members are not copied."""
+        member = self.members[name]
+        if member["format"] == "pcm16":
+            start = self._data_start + member["offset"]
+            frames = np.frombuffer(self._mmap, dtype="<i2", count=member["frames"] * member["channels"], offset=start)
+            return frames.reshape(member["frames"], member["channels"]), member["sample_rate"]
+        audio, sample_rate = sf.read(io.BytesIO(self._payload(member)), dtype="int16", always_2d=True)
+        return audio, sample_rate
+
+    def read(self, name: str) -> Tuple[np.ndarray, int]:
+        """float32 frames (frames, channels) and sample rate of one member."""
+        frames, sample_rate = self.read_pcm16(name)
+        return frames.astype(np.float32) / 32768.0, sample_rate
+
+    def close(self):
+        try:
+            self._mmap.close()
+        except BufferError:
+            # A caller still holds a zero-copy view; the map is released with it
+            pass
+
+
+_open_packs: Dict[str, SoundPack] = {}
+_open_lock = threading.Lock()
+
+
+def split_member_path(path: str) -> Optional[Tuple[str, str]]:
+    """(pack path, member name) for "<pack>.bfpack#<member>", else None."""
+    pack_path, separator, name = path.rpartition(MEMBER_SEPARATOR)
+    if not separator or not pack_path.endswith(PACK_EXTENSION):
+        return None
+    return pack_path, name
+
+
+def open_pack(path: str) -> SoundPack:
+    """
+    Shared, lazily opened pack: every member load from one pack uses one
+    mapping. A pack rebuilt on disk since it was opened is opened again.
+    """
+    abs_path = os.path.abspath(path)
+    with _open_lock:
+        pack = _open_packs.get(abs_path)
+        if pack is None or os.path.getmtime(abs_path) != pack.mtime:
+            pack = _open_packs[abs_path] = SoundPack(abs_path)
+        return pack
+
+
+def sound_exists(path: str) -> bool:
+    """os.path.exists that also understands pack member paths."""
+    member = split_member_path(path)
+    if member is None:
+        return os.path.exists(path)
+    pack_path, name = member
+    try:
+        return os.path.exists(pack_path) and name in open_pack(pack_path)
+    except (OSError, ValueError):
+        return False
+
+
+def read_sound(path: str) -> Tuple[np.ndarray, int]:
+    """float32 (frames, channels) and sample rate of a file or pack member."""
+    member = split_member_path(path)
+    if member is None:
+        return sf.read(path, dtype="float32", always_2d=True)
+    pack_path, name = member
+    return open_pack(pack_path).read(name)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build and inspect Bard's Forge sound pack containers")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="Convert a loose pack directory into one .bfpack file")
+    build.add_argument("pack_dir")
+    build.add_argument("-o", "--output", help="Output path (default: <pack_dir>.bfpack)")
+    build.add_argument("--format", choices=PACK_FORMATS, default="pcm16")
+    show = commands.add_parser("list", help="Show a pack's index")
+    show.add_argument("pack")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        path = pack_directory(args.pack_dir, args.output, args.format)
+        pack = SoundPack(path)
+        print(f"📦 {pack.name}: {len(pack)} sounds, {os.path.getsize(path) / 1e6:.1f} MB -> {path}")
+        pack.close()
+        return 0
+
+    pack = SoundPack(args.pack)
+    print(f"📦 {pack.name} ({len(pack)} sounds)")
+    for member in pack.members.values():
+        seconds = member["frames"] / member["sample_rate"]
+        print(f"  {member['name']:<40} {seconds:6.2f}s {member['format']:<6} "
+              f"{member['loudness']['lufs']:6.1f} LUFS  {member['prompt']}")
+    pack.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+from typing import Dict, List, Tuple
+
+# Sound types understood by the procedural engines
+SOUND_TYPES: Dict[str, int] = {
+    'tavern': 0, 'fire': 1, 'water': 2, 'wind': 3, 'forest': 4,
+    'footsteps': 5, 'magic': 6, 'combat': 7, 'ambient': 8,
+    'dungeon': 9, 'thunder': 10, 'bell': 11, 'voice': 12,
+    'mechanical': 13, 'animal': 14, 'unknown': 15
+}
+
+# Semantic fallbacks, checked in order when no type name appears in the prompt
+SEMANTIC_KEYWORDS: List[Tuple[str, List[str]]] = [
+    ('tavern', ['cozy', 'warm', 'inn', 'pub', 'drinking', 'ale', 'beer']),
+    ('fire', ['flame', 'crackling', 'hearth', 'bonfire']),
+    ('water', ['stream', 'river', 'rain', 'drops', 'splash']),
+    ('wind', ['breeze', 'gust', 'howling', 'rustling']),
+    ('forest', ['trees', 'woods', 'nature', 'wilderness', 'leaves']),
+    ('footsteps', ['step', 'walk', 'boot', 'march']),
+    ('magic', ['spell', 'mystical', 'enchanted', 'arcane', 'shimmer']),
+    ('combat', ['sword', 'metal', 'clash', 'battle', 'fight']),
+    ('dungeon', ['cave', 'underground', 'damp', 'echo']),
+    ('thunder', ['storm', 'rumble', 'lightning']),
+    ('bell', ['chime', 'toll', 'ring']),
+    ('voice', ['whisper', 'voice', 'speak', 'call']),
+    ('mechanical', ['gear', 'machine', 'click', 'mechanical']),
+    ('animal', ['bird', 'owl', 'howl', 'roar', 'chirp']),
+]
+
+
+def classify_prompt(prompt: str) -> str:
+    """Classify prompt to determine sound type (no torch needed)."""
+    prompt_lower = prompt.lower()
+
+    # Direct keyword matching
+    for sound_type in SOUND_TYPES:
+        if sound_type in prompt_lower:
+            return sound_type
+
+    # Semantic matching
+    for sound_type, words in SEMANTIC_KEYWORDS:
+        if any(word in prompt_lower for word in words):
+            return sound_type
+
+    return 'ambient'
@@ -0,0 +1,115 @@
+import math
+import random
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Placement bounds of a missing or malformed value (scene values are a
+# number, or a [min, max] range drawn per trigger)
+_UNSET = (math.nan, math.nan)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+class Spatializer:
+    """
+    Places mono sources in a stereo field:
+
+    - constant-power pan: pan -1 (left) .. 0 (center) .. 1 (right) maps to
+      left = cos(theta), right = sin(theta), theta = (pan + 1) * pi / 4
+    - interaural time delay: the far ear hears the source up to max_itd
+      seconds later (Woodworth's sin approximation)
+    - distance attenuation: inverse distance beyond ref_distance, raised to
+      rolloff
+
+    Live playback only needs the two channel gains (pygame's
+    Channel.set_volume(left, right)); render-time placement also applies
+    the delay. Sources stay mono on disk and in memory, so one file serves
+    every position.
+    """
+
+    def __init__(self, sample_rate: int = 44100, max_itd: float = 0.00066,
+                 ref_distance: float = 1.0, rolloff: float = 1.0):
+        self.sample_rate = sample_rate
+        self.max_itd = max_itd
+        self.ref_distance = ref_distance
+        self.rolloff = rolloff
+
+    @staticmethod
+    def is_spatial(config: Dict) -> bool:
+        """Whether a scene entry asks for placement at all."""
+        return "pan" in config or "distance" in config
+
+    def position(self, config: Dict, rng: Optional[random.Random] = None) -> Tuple[float, float]:
+        """
+        (pan, distance) for one trigger of a scene entry, drawing ranges from rng.
+        A malformed value places the source at the center / ref_distance
+        instead of failing on the live path.
+        """
+        return self.draw_position(self.placement_bounds(config), rng)
+
+    def draw_position(self, bounds: Sequence[float], rng: Optional[random.Random] = None) -> Tuple[float, float]:
+        """(pan, distance) for one trigger from precompiled placement_bounds()."""
+        rng = rng or random
+        pan_min, pan_max, distance_min, distance_max = bounds
+        pan = self._draw(pan_min, pan_max, 0.0, rng)
+        distance = self._draw(distance_min, distance_max, self.ref_distance, rng)
+        return max(-1.0, min(1.0, pan)), max(distance, 0.0)
+
+    @classmethod
+    def placement_bounds(cls, config: Dict) -> Tuple[float, float, float, float]:
+        """
+        (pan_min, pan_max, distance_min, distance_max) of a scene entry.
+        Missing or malformed values are NaN, which draw_position() reads as
+        the default placement.
+        """
+        pan = cls.parse_range(config["pan"]) if "pan" in config else None
+        distance = cls.parse_range(config["distance"]) if "distance" in config else None
+        return (pan or _UNSET) + (distance or _UNSET)
+
+    @staticmethod
+    def parse_range(value) -> Optional[Tuple[float, float]]:
+        """A scene value as a (min, max) range: a number or a [min, max] pair, else None."""
+        if isinstance(value, (list, tuple)):
+            if len(value) != 2 or not all(_is_number(v) for v in value) or value[0] > value[1]:
+                return None
+            return float(value[0]), float(value[1])
+        return (float(value), float(value)) if _is_number(value) else None
+
+    @staticmethod
+    def _draw(low: float, high: float, default: float, rng) -> float:
+        if math.isnan(low):
+            return default
+        # Only real ranges consume a draw, so fixed placements leave the sequence alone
+        return rng.uniform(low, high) if low < high else low
+
+    def attenuation(self, distance: float) -> float:
+        """Gain for a source at distance (1.0 up to ref_distance)."""
+        return (self.ref_distance / max(distance, self.ref_distance)) ** self.rolloff
+
+    def gains(self, pan: float, distance: Optional[float] = None) -> Tuple[float, float]:
+        """Constant-power (left, right) gains, including distance attenuation."""
+        theta = (max(-1.0, min(1.0, pan)) + 1) * math.pi / 4
+        gain = 1.0 if distance is None else self.attenuation(distance)
+        return math.cos(theta) * gain, math.sin(theta) * gain
+
+    def delay_samples(self, pan: float) -> int:
+        """Interaural delay of the far ear, in whole samples (sign follows pan)."""
+        return int(round(self.max_itd * math.sin(max(-1.0, min(1.0, pan)) * math.pi / 2) * self.sample_rate))
+
+    def place(self, audio: np.ndarray, pan: float, distance: Optional[float] = None) -> np.ndarray:
+        """
+        Render a source at (pan, distance) as float32 stereo, shape (samples + delay, 2).
+        Stereo input is folded to mono first.
+        """
+        mono = audio.mean(axis=1) if audio.ndim == 2 else audio
+        left_gain, right_gain = self.gains(pan, distance)
+        delay = self.delay_samples(pan)
+
+        out = np.zeros((len(mono) + abs(delay), 2), dtype=np.float32)
+        left_start, right_start = max(delay, 0), max(-delay, 0)
+        np.multiply(mono, left_gain, out=out[left_start:left_start + len(mono), 0])
+        np.multiply(mono, right_gain, out=out[right_start:right_start + len(mono), 1])
+        return out
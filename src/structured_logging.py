@@ -0,0 +1,113 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from typing import Optional
+
+LOGGER_NAME = "bardsforge"
+
+# Attributes every LogRecord has; anything else on a record came in through extra=
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger for one module, under the shared 'bardsforge' hierarchy."""
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+
+def record_fields(record: logging.LogRecord) -> dict:
+    """The structured fields passed with extra= (prompt, engine, latency, cache_hit, ...)."""
+    return {key: value for key, value in vars(record).items() if key not in _RECORD_ATTRS}
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message and the structured fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        entry.update(record_fields(record))
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Keeps the structured fields; the stock handler only guarantees the message survives."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+def configure_logging(level: Optional[str] = None, jsonl_path: Optional[str] = None,
+                      jsonl_level: Optional[str] = None) -> logging.Logger:
+    """
+    Route every 'bardsforge' logger through a queue, so the caller only pays
+    for an enqueue and a background thread does the terminal and file I/O.
+
+    - console: level (default WARNING, or BARDS_FORGE_LOG_LEVEL), so the
+      performance loop is silent unless something goes wrong
+    - JSONL file: jsonl_path (or BARDS_FORGE_LOG_JSONL) at jsonl_level
+      (default DEBUG, or BARDS_FORGE_LOG_JSONL_LEVEL), one event per line
+      with its structured fields, for offline analysis
+
+    The logger level is the lowest handler level, so disabled debug calls
+    return after a single level check. Calling again replaces the setup.
+    """
+    global _listener
+    level = (level or os.environ.get("BARDS_FORGE_LOG_LEVEL", "WARNING")).upper()
+    jsonl_path = jsonl_path or os.environ.get("BARDS_FORGE_LOG_JSONL")
+    jsonl_level = (jsonl_level or os.environ.get("BARDS_FORGE_LOG_JSONL_LEVEL", "DEBUG")).upper()
+
+    shutdown_logging()
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setLevel(level)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    handlers = [console]
+
+    if jsonl_path:
+        jsonl = logging.FileHandler(jsonl_path, encoding="utf-8")
+        jsonl.setLevel(jsonl_level)
+        jsonl.setFormatter(JsonLinesFormatter())
+        handlers.append(jsonl)
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(_QueueHandler(records))
+    logger.setLevel(min(handler.level for handler in handlers))
+    logger.propagate = False
+    return logger
+
+
+def shutdown_logging():
+    """Flush the queue and stop the background writer (safe to call twice)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,146 @@
+import threading
+import zlib
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+# Tables are built from a fixed seed so renders stay reproducible per seed
+TABLE_SEED = 0x5EED
+
+# Longest noise read served from the pool, as a fraction of its length. Two
+# seeds reading at random offsets share time-shifted copies of the same noise
+# whenever their windows overlap, which becomes likely as clips approach the
+# pool length; longer requests are drawn fresh instead.
+NOISE_POOL_FRACTION = 0.25
+
+
+class SynthesisTables:
+    """
+    Precomputed material shared by every procedural render: cached time axes
+    and decay envelopes, banks of pre-rendered grains (creaks, snaps,
+    crackles, drops, sparkles) and a large white-noise pool read at random
+    offsets.
+    GranularRenderer mixes event trains straight from the banks, so the
+    only randomness left per render is which grain or offset to use.
+    All tables are read-only; build them once and share them between threads.
+    """
+
+    def __init__(self, sample_rate: int = 44100, noise_seconds: float = 20.0, bank_size: int = 32):
+        self.sample_rate = sample_rate
+        self.bank_size = bank_size
+        self._lock = threading.RLock()
+
+        self._time_axes: Dict[int, np.ndarray] = {}
+        self._envelopes: Dict[Tuple[float, int], np.ndarray] = {}
+        self._banks: Dict[Tuple[str, int], np.ndarray] = {}
+
+        self.noise_pool = self._freeze(self._table_rng("noise", 0).standard_normal(int(noise_seconds * sample_rate)))
+
+        self._builders: Dict[str, Callable[[np.random.Generator, int], np.ndarray]] = {
+            'creak': self._build_wood_creak,
+            'snap': self._build_twig_snap,
+            'crackle': self._build_crackle,
+            'drop': self._build_water_drop,
+            'sparkle': self._build_sparkle
+        }
+
+    @staticmethod
+    def _table_rng(name: str, samples: int) -> np.random.Generator:
+        """Each table has its own seed, so contents never depend on build order."""
+        return np.random.default_rng([TABLE_SEED, zlib.crc32(name.encode()), samples])
+
+    @staticmethod
+    def _freeze(array: np.ndarray) -> np.ndarray:
+        array.flags.writeable = False
+        return array
+
+    # Cached tables
+
+    def time_axis(self, samples: int) -> np.ndarray:
+        """Seconds for each sample of a grain: linspace(0, samples / rate, samples)."""
+        table = self._time_axes.get(samples)
+        if table is None:
+            with self._lock:
+                table = self._time_axes.setdefault(
+                    samples, self._freeze(np.linspace(0, samples / self.sample_rate, samples)))
+        return table
+
+    def envelope(self, rate: float, samples: int) -> np.ndarray:
+        """Exponential decay exp(-t * rate) over a grain."""
+        key = (rate, samples)
+        table = self._envelopes.get(key)
+        if table is None:
+            with self._lock:
+                table = self._envelopes.setdefault(key, self._freeze(np.exp(-self.time_axis(samples) * rate)))
+        return table
+
+    def bank(self, name: str, samples: int) -> np.ndarray:
+        """Pre-rendered grains of one kind, shape (bank_size, samples)."""
+        key = (name, samples)
+        table = self._banks.get(key)
+        if table is None:
+            with self._lock:
+                table = self._banks.get(key)
+                if table is None:
+                    build, rng = self._builders[name], self._table_rng(name, samples)
+                    table = self._freeze(np.stack([build(rng, samples) for _ in range(self.bank_size)]))
+                    self._banks[key] = table
+        return table
+
+    # Per-render lookups
+
+    def noise(self, rng: np.random.Generator, samples: int) -> np.ndarray:
+        """
+        White noise read from the pool at a random offset (read-only view).
+        Requests longer than NOISE_POOL_FRACTION of the pool (5 s with the
+        default 20 s pool) are drawn fresh, so seeds stay independent.
+        """
+        if samples > len(self.noise_pool) * NOISE_POOL_FRACTION:
+            return rng.standard_normal(samples)
+        start = rng.integers(0, len(self.noise_pool) - samples + 1)
+        return self.noise_pool[start:start + samples]
+
+    # Grain builders (run once per bank entry)
+
+    def _build_wood_creak(self, rng: np.random.Generator, samples: int) -> np.ndarray:
+        """Wood creak: a falling frequency sweep with a quick decay."""
+        t = self.time_axis(samples)
+        start_freq = rng.uniform(200, 400)
+        end_freq = rng.uniform(100, 200)
+        freq = start_freq + (end_freq - start_freq) * t / t[-1]
+        return np.sin(2 * np.pi * freq * t) * self.envelope(5, samples)
+
+    def _build_twig_snap(self, rng: np.random.Generator, samples: int) -> np.ndarray:
+        """Twig snap: a sharp noise impulse with a very quick decay."""
+        return rng.standard_normal(samples) * self.envelope(20, samples)
+
+    def _build_crackle(self, rng: np.random.Generator, samples: int) -> np.ndarray:
+        """Fire crackle: a noise impulse with a resonance."""
+        resonance = np.sin(2 * np.pi * rng.uniform(800, 1500) * self.time_axis(samples))
+        return (rng.standard_normal(samples) + resonance * 0.5) * self.envelope(10, samples)
+
+    def _build_water_drop(self, rng: np.random.Generator, samples: int) -> np.ndarray:
+        """Water droplet: a high tone with a quick decay."""
+        drop = np.sin(2 * np.pi * rng.uniform(1000, 2000) * self.time_axis(samples))
+        return drop * self.envelope(8, samples)
+
+    def _build_sparkle(self, rng: np.random.Generator, samples: int) -> np.ndarray:
+        """Magic sparkle: a bright fast-decaying tone, cut off at a random length."""
+        phase = rng.uniform(0, 2 * np.pi)
+        sparkle = np.sin(2 * np.pi * rng.uniform(1800, 2500) * self.time_axis(samples) + phase)
+        sparkle *= self.envelope(20, samples)
+        sparkle[rng.integers(max(samples // 4, 1), samples + 1):] = 0
+        return sparkle
+
+
+_shared_tables: Dict[int, SynthesisTables] = {}
+_shared_lock = threading.Lock()
+
+
+def get_synthesis_tables(sample_rate: int = 44100) -> SynthesisTables:
+    """The process-wide tables for a sample rate (built on first use)."""
+    with _shared_lock:
+        tables = _shared_tables.get(sample_rate)
+        if tables is None:
+            tables = _shared_tables[sample_rate] = SynthesisTables(sample_rate)
+        return tables
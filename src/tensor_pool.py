@@ -0,0 +1,170 @@
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Hashable, List, Tuple
+
+import torch
+
+from metrics import metrics
+
+# Free-list key: (rows, bucketed length, dtype)
+BufferKey = Tuple[int, int, torch.dtype]
+
+
+class TensorBufferPool:
+    """
+    Reusable tensors for the GPU synthesis kernels.
+
+    - work buffers: (rows, bucket) tensors, where bucket rounds the length up
+      to a multiple of bucket_samples, handed out as (rows, samples) views and
+      leased until the render that took them calls release()
+    - constants: time axes, grain axes and fade ramps, built once per key
+      and shared (treat them as read-only), least recently used evicted
+
+    Any duration inside a bucket reuses the same work buffers, so freely
+    varying clip lengths stop hitting the allocator. Leases are per thread.
+    Buffers held (leased or free) are capped at max_buffer_mb; past it, free
+    buffers of the least recently used shapes are dropped. Hits, misses and
+    bytes allocated and trimmed are also published to the metrics registry.
+    """
+
+    def __init__(self, device: str = "cpu", bucket_samples: int = 11025, max_constants: int = 256,
+                 max_buffer_mb: float = 512.0):
+        self.device = device
+        self.bucket_samples = bucket_samples
+        self.max_constants = max_constants
+        self.max_buffer_bytes = int(max_buffer_mb * 1024 * 1024)
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Least recently used shape first
+        self._free: "OrderedDict[BufferKey, List[torch.Tensor]]" = OrderedDict()
+        self._constants: "OrderedDict[Hashable, torch.Tensor]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.trimmed = 0
+        self.buffer_bytes = 0
+
+    def bucket(self, samples: int) -> int:
+        """Length rounded up to the bucket grid."""
+        return max(1, -(-samples // self.bucket_samples)) * self.bucket_samples
+
+    # Work buffers
+
+    @torch.compiler.disable
+    def take(self, rows: int, samples: int, zero: bool = False, dtype: torch.dtype = torch.float32) -> torch.Tensor:
+        """A (rows, samples) view of a pooled buffer, leased until release()."""
+        key = (rows, self.bucket(samples), dtype)
+        with self._lock:
+            free = self._free.get(key)
+            hit = bool(free)
+            if hit:
+                buffer = free.pop()
+                if not free:
+                    del self._free[key]
+                self.hits += 1
+            else:
+                buffer = torch.empty(key[:2], dtype=dtype, device=self.device)
+                self.misses += 1
+                self.buffer_bytes += _nbytes(buffer)
+                self._trim()
+        if hit:
+            metrics.inc("tensor_pool_hits_total", kind="buffer")
+        else:
+            metrics.inc("tensor_pool_misses_total", kind="buffer")
+            metrics.inc("tensor_pool_allocated_bytes_total", _nbytes(buffer))
+
+        self._leases().append((key, buffer))
+        view = buffer[:, :samples]
+        if zero:
+            view.zero_()
+        return view
+
+    def release(self):
+        """Return every buffer this thread has leased to the pool."""
+        leases = self._leases()
+        with self._lock:
+            for key, buffer in leases:
+                self._free.setdefault(key, []).append(buffer)
+                self._free.move_to_end(key)
+            self._trim()
+        leases.clear()
+
+    def _trim(self):
+        """Drop free buffers, least recently used shapes first, until under the cap (lock held)."""
+        while self.buffer_bytes > self.max_buffer_bytes and self._free:
+            key, free = next(iter(self._free.items()))
+            nbytes = _nbytes(free.pop())
+            if not free:
+                del self._free[key]
+            self.buffer_bytes -= nbytes
+            self.trimmed += 1
+            metrics.inc("tensor_pool_trimmed_bytes_total", nbytes)
+
+    @contextmanager
+    def lease(self):
+        """Scope for one render: everything taken inside is released on exit."""
+        try:
+            yield self
+        finally:
+            self.release()
+
+    def _leases(self) -> List[Tuple[BufferKey, torch.Tensor]]:
+        leases = getattr(self._local, "leases", None)
+        if leases is None:
+            leases = self._local.leases = []
+        return leases
+
+    # Shared constants
+
+    @torch.compiler.disable
+    def constant(self, key: Hashable, build: Callable[[], torch.Tensor]) -> torch.Tensor:
+        """A cached tensor for key, built on first use."""
+        with self._lock:
+            tensor = self._constants.get(key)
+            if tensor is not None:
+                self._constants.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if tensor is not None:
+            metrics.inc("tensor_pool_hits_total", kind="constant")
+            return tensor
+        metrics.inc("tensor_pool_misses_total", kind="constant")
+
+        tensor = build()
+        with self._lock:
+            self._constants[key] = tensor
+            while len(self._constants) > self.max_constants:
+                self._constants.popitem(last=False)
+        return tensor
+
+    def time_axis(self, duration: float, samples: int) -> torch.Tensor:
+        """linspace(0, duration, samples)."""
+        return self.constant(("time", duration, samples),
+                             lambda: torch.linspace(0, duration, samples, device=self.device))
+
+    def ramp(self, samples: int, rising: bool = True) -> torch.Tensor:
+        """Linear fade ramp, 0 -> 1 (rising) or 1 -> 0."""
+        start, end = (0.0, 1.0) if rising else (1.0, 0.0)
+        return self.constant(("ramp", samples, rising),
+                             lambda: torch.linspace(start, end, samples, device=self.device))
+
+    def stats(self) -> Dict:
+        """Hit-rate metrics for buffers and constants together."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "buffers": sum(len(free) for free in self._free.values()),
+                "buffer_mb": self.buffer_bytes / (1024 * 1024),
+                "trimmed": self.trimmed,
+                "constants": len(self._constants)
+            }
+
+
+def _nbytes(tensor: torch.Tensor) -> int:
+    return tensor.numel() * tensor.element_size()
@@ -0,0 +1,231 @@
+import inspect
+import os
+import queue
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from structured_logging import get_logger
+
+logger = get_logger("variant_pool")
+
+
+def accepts_seed(render: Callable, *args, **kwargs) -> bool:
+    """
+    Whether render can be called with these arguments, which include a seed
+    (variants are impossible without one). Callables without an inspectable
+    signature are assumed to accept them.
+    """
+    try:
+        inspect.signature(render).bind(*args, **kwargs)
+    except TypeError:
+        return False
+    except ValueError:
+        return True
+    return True
+
+
+class VariantPool:
+    """Pre-rendered seed variants of a single generated oneshot."""
+
+    def __init__(self, prompt: str, duration: float, target: int):
+        self.prompt = prompt
+        self.duration = duration
+        self.target = target
+        self.variants: List[Tuple[str, int]] = []  # (path, size in bytes)
+        self.next_seed = 0
+        self.last_index = -1
+        self.last_used = time.time()
+        self.queued = False
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(size for _, size in self.variants)
+
+    def add(self, path: str):
+        if any(existing == path for existing, _ in self.variants):
+            return
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+        self.variants.append((path, size))
+
+    def pick(self, rng: random.Random) -> Optional[str]:
+        """O(1) random pick that never repeats the previous pick."""
+        count = len(self.variants)
+        if count == 0:
+            return None
+
+        if count == 1:
+            index = 0
+        else:
+            index = rng.randrange(count - 1)
+            if index >= self.last_index >= 0:
+                index += 1
+
+        self.last_index = index
+        self.last_used = time.time()
+        return self.variants[index][0]
+
+    def evict_one(self) -> Optional[str]:
+        """Drop the oldest variant (not the one just played) and return its path."""
+        if not self.variants:
+            return None
+        index = 0 if self.last_index != 0 or len(self.variants) == 1 else 1
+        path, _ = self.variants.pop(index)
+        if self.last_index > index:
+            self.last_index -= 1
+        elif self.last_index == index:
+            self.last_index = -1
+        return path
+
+
+class VariantPoolManager:
+    """
+    Keeps a pool of seed variants per generated oneshot so repeated triggers
+    don't sound looped. Pools are filled by a background worker; the live
+    path only ever does a dictionary lookup and an O(1) pick, and never
+    renders. Total pool size is capped and the least recently used
+    pools give up variants first.
+    """
+
+    def __init__(self, render: Callable[[str, float, int], Optional[str]], pool_size: int = 4,
+                 max_pool_mb: float = 64.0, on_evict: Optional[Callable[[str], None]] = None):
+        self.render = render
+        self.pool_size = pool_size
+        self.max_pool_bytes = int(max_pool_mb * 1024 * 1024)
+        self.on_evict = on_evict
+        self.pools: Dict[str, VariantPool] = {}
+        self.rng = random.Random()
+        self.enabled = pool_size > 1
+        if self.enabled and not accepts_seed(render, "", 1.0, 0):
+            self.disable("render takes no seed")
+
+        # Guards pools and every pool's variants, target, next_seed and queued flag
+        self._lock = threading.Lock()
+        self._fill_queue: "queue.Queue[str]" = queue.Queue()
+        self._worker = None
+
+    def disable(self, reason: str):
+        """Turn variant pools off for the session (the generator can't render seeds)."""
+        logger.warning("⚠️ Variant pools disabled: %s", reason)
+        self.enabled = False
+
+    @staticmethod
+    def pool_key(prompt: str, duration: float) -> str:
+        return f"{prompt}_{duration}"
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._fill_loop, daemon=True)
+            self._worker.start()
+
+    def _request_fill(self, pool: VariantPool, key: str):
+        if pool.queued or len(pool.variants) >= pool.target:
+            return
+        pool.queued = True
+        self._fill_queue.put(key)
+        self._ensure_worker()
+
+    def prime(self, prompt: str, duration: float):
+        """Create a pool for a oneshot and start filling it in the background."""
+        if not self.enabled:
+            return
+        key = self.pool_key(prompt, duration)
+        with self._lock:
+            pool = self.pools.get(key)
+            if pool is None:
+                pool = self.pools[key] = VariantPool(prompt, duration, self.pool_size)
+            # A newly active scene gets its full pool back
+            pool.target = self.pool_size
+            pool.last_used = time.time()
+            self._request_fill(pool, key)
+
+    def pick(self, prompt: str, duration: float) -> Optional[str]:
+        """Live-path lookup: a variant path, or None if the pool is still empty."""
+        if not self.enabled:
+            return None
+        key = self.pool_key(prompt, duration)
+        with self._lock:
+            pool = self.pools.get(key)
+            if pool is not None:
+                path = pool.pick(self.rng)
+                if len(pool.variants) < pool.target:
+                    self._request_fill(pool, key)
+                return path
+        self.prime(prompt, duration)
+        return None
+
+    def _fill_loop(self):
+        while True:
+            key = self._fill_queue.get()
+            with self._lock:
+                pool = self.pools.get(key)
+            if pool is not None:
+                self._fill(pool)
+
+    def _next_seed(self, pool: VariantPool) -> Optional[int]:
+        """The next seed to render for a pool, or None (and the pool unqueued) once it is full."""
+        with self._lock:
+            if len(pool.variants) >= pool.target:
+                pool.queued = False
+                return None
+            seed = pool.next_seed
+            pool.next_seed += 1
+            return seed
+
+    def _fill(self, pool: VariantPool):
+        """Render seeds into a pool until it reaches its target; only the render runs unlocked."""
+        while True:
+            seed = self._next_seed(pool)
+            if seed is None:
+                return
+
+            try:
+                path = self.render(pool.prompt, pool.duration, seed)
+            except Exception as e:
+                logger.warning("⚠️ Variant render failed for '%s': %s", pool.prompt, e,
+                               extra={"prompt": pool.prompt, "duration": pool.duration, "seed": seed})
+                path = None
+
+            with self._lock:
+                if path:
+                    pool.add(path)
+                if not path or not self._enforce_cap(keep=pool):
+                    pool.queued = False
+                    return
+
+    def _enforce_cap(self, keep: VariantPool) -> bool:
+        """
+        Evict variants from least recently used pools until under the cap.
+        Returns False if 'keep' itself had to give something up.
+        """
+        total = sum(pool.size_bytes for pool in self.pools.values())
+        if total <= self.max_pool_bytes:
+            return True
+
+        for pool in sorted(self.pools.values(), key=lambda p: (p is keep, p.last_used)):
+            while total > self.max_pool_bytes and len(pool.variants) > 1:
+                size_before = pool.size_bytes
+                path = pool.evict_one()
+                total -= size_before - pool.size_bytes
+                if self.on_evict and path:
+                    self.on_evict(path)
+                # Don't refill what the cap just took away
+                pool.target = len(pool.variants)
+            if total <= self.max_pool_bytes:
+                return pool is not keep
+
+        return False
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            pools = list(self.pools.values())
+            return {
+                "pools": len(pools),
+                "variants": sum(len(pool.variants) for pool in pools),
+                "size_mb": sum(pool.size_bytes for pool in pools) / (1024 * 1024),
+                "enabled": self.enabled
+            }
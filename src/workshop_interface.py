@@ -1,8 +1,11 @@
-import sys
 import time
 import os
-from typing import Dict, List, Optional
+import shutil
+from typing import Callable, Dict, Optional
 from neural_audio_forge import BardsForgeWorkshop
+from campaign_pipeline import format_progress
+from project_store import ProjectStore
+from sound_pack import PACK_EXTENSION, write_pack
 
 
 class WorkshopInterface:
@@ -11,11 +14,12 @@ class WorkshopInterface:
     For Game Masters to prepare sounds before sessions
     """
     
-    def __init__(self):
+    def __init__(self, store: Optional[ProjectStore] = None):
         self.workshop = BardsForgeWorkshop()
         self.current_project = None
-        self.projects = {}
-        
+        # Projects and generation jobs live on disk, so they survive restarts
+        self.store = store or ProjectStore()
+    
     def print_banner(self):
         """Print the workshop banner."""
         print("=" * 70)
@@ -50,22 +54,124 @@ class WorkshopInterface:
             print("❌ Invalid project name")
             return
         
-        if project_name in self.projects:
+        if self.store.get_project(project_name):
             print("❌ Project already exists")
             return
         
         description = input("Project description > ").strip()
         
-        self.projects[project_name] = {
-            "description": description,
-            "sounds": {},
-            "packs": [],
-            "created": time.time()
-        }
+        self.store.create_project(project_name, description)
         
         self.current_project = project_name
         print(f"✅ Project '{project_name}' created")
     
+    def load_existing_project(self):
+        """Load a saved project and offer to finish its interrupted jobs."""
+        print("\n📂 LOAD EXISTING PROJECT")
+        
+        projects = self.store.list_projects()
+        if not projects:
+            print("❌ No saved projects")
+            return
+        
+        for i, project in enumerate(projects, 1):
+            unfinished = f", {project['unfinished']} unfinished jobs" if project["unfinished"] else ""
+            print(f"  {i}. {project['name']} ({project['sounds']} sounds{unfinished})")
+        
+        choice = input("Project number or name > ").strip()
+        if choice.isdigit() and 1 <= int(choice) <= len(projects):
+            project_name = projects[int(choice) - 1]["name"]
+        elif any(project["name"] == choice for project in projects):
+            project_name = choice
+        else:
+            print("❌ Unknown project")
+            return
+        
+        self.current_project = project_name
+        project = self.store.get_project(project_name)
+        print(f"✅ Loaded project '{project_name}': {len(project['sounds'])} sounds, {len(project['packs'])} packs")
+        
+        self.resume_unfinished_jobs(project_name)
+    
+    def resume_unfinished_jobs(self, project: Optional[str] = None):
+        """Offer to finish jobs that were interrupted; only their missing items are rendered."""
+        jobs = self.store.unfinished_jobs(project)
+        if not jobs:
+            return
+        
+        print(f"\n⏸️ {len(jobs)} unfinished jobs:")
+        for job in jobs:
+            print(f"  • {job['kind']} '{job['name']}' ({job['project'] or 'no project'}): "
+                  f"{job['done']}/{job['total']} done")
+        
+        if input("Resume them now? (y/n) > ").strip().lower() != "y":
+            return
+        
+        for job in jobs:
+            self._run_job(job["id"])
+    
+    def _render_sound(self, item: Dict) -> Optional[str]:
+        """One job item: reuse any file already rendered for it, else generate."""
+        return (self.store.find_sound(item["prompt"], item["duration"]) or
+                self.workshop.neural_forge.generate_sound(item["prompt"], item["duration"]))
+    
+    def _job_key(self) -> Optional[Callable[[Dict], str]]:
+        """
+        Dedup key for job items: the engine's cache file, when it exposes
+        one. Procedural engines share a file across prompts of one sound
+        type, so keying on the prompt would render that file concurrently.
+        """
+        cache_path = getattr(self.workshop.neural_forge, "cache_path", None)
+        if cache_path is None:
+            return None
+        return lambda item: cache_path(item["prompt"], item["duration"])
+    
+    def _pack_finisher(self, pack_dir: str) -> Callable[[Dict, str], Optional[str]]:
+        """Copies a rendered pack item into the pack as NN_prompt.wav."""
+        def finish(item: Dict, source: str) -> Optional[str]:
+            os.makedirs(pack_dir, exist_ok=True)
+            target = os.path.join(pack_dir, f"{item['position']:02d}_{item['prompt'].replace(' ', '_')}.wav")
+            if os.path.abspath(source) != os.path.abspath(target):
+                shutil.copyfile(source, target)
+            return target
+        return finish
+    
+    def _run_job(self, job_id: int) -> Dict:
+        """
+        Run a stored job's pending items on all cores, with per-item progress
+        and ETA; interrupted jobs resume here.
+        """
+        job = self.store.get_job(job_id)
+        finish = self._pack_finisher(job["output"]) if job["kind"] == "pack" else None
+        total = len(self.store.job_items(job_id))
+        skipped = total - len(self.store.pending_items(job_id))
+        if skipped:
+            print(f"⏭️ Skipping {skipped}/{total} sounds generated before")
+        
+        def progress(item: Dict, path: Optional[str], pipeline: Dict):
+            status = "✅" if path else "❌"
+            print(f"  {status} {format_progress(pipeline)} {item['prompt']}")
+        
+        start_time = time.time()
+        result = self.store.run_job(job_id, self._render_sound, progress,
+                                    max_workers=os.cpu_count() or 1, finish=finish, key=self._job_key())
+        result["time"] = time.time() - start_time
+        if result["failed"]:
+            print(f"⚠️ {result['failed']} sounds failed; the job will resume from them next time")
+        elif job["kind"] == "pack":
+            # Written once the job is complete, whether it ran in one go or was resumed
+            self._write_pack_container(job_id)
+        return result
+    
+    def _write_pack_container(self, job_id: int) -> str:
+        """One indexed container for distribution and fast loading, next to the pack directory."""
+        job = self.store.get_job(job_id)
+        members = [{"name": os.path.splitext(os.path.basename(item["path"]))[0], "prompt": item["prompt"],
+                    "file": item["path"]} for item in self.store.job_items(job_id)]
+        pack_path = write_pack(os.path.normpath(job["output"]) + PACK_EXTENSION, job["name"], members)
+        print(f"📦 Pack container: {pack_path} ({os.path.getsize(pack_path) / 1e6:.1f} MB)")
+        return pack_path
+    
     def generate_single_sound(self):
         """Generate a single sound."""
         print("\n🎵 SINGLE SOUND GENERATION")
@@ -82,17 +188,15 @@ class WorkshopInterface:
         
         print(f"\n🔥 Generating: '{prompt}' ({duration}s)")
         
-        start_time = time.time()
-        file_path = self.workshop.neural_forge.generate_sound(prompt, duration)
-        generation_time = time.time() - start_time
+        job_id = self.store.start_job(self.current_project, "sound", prompt, [(prompt, duration)])
+        result = self._run_job(job_id)
+        file_path = self.store.job_items(job_id)[0]["path"] if result["done"] else None
         
         if file_path:
-            print(f"✅ Generated in {generation_time:.3f}s")
+            print(f"✅ Generated in {result['time']:.3f}s")
             print(f"📁 Saved to: {file_path}")
             
-            # Add to current project if exists
             if self.current_project:
-                self.projects[self.current_project]["sounds"][prompt] = file_path
                 print(f"📂 Added to project: {self.current_project}")
         else:
             print("❌ Generation failed")
@@ -120,21 +224,18 @@ class WorkshopInterface:
         
         print(f"\n🚀 Batch generating {len(prompts)} sounds...")
         
-        start_time = time.time()
-        results = self.workshop.neural_forge.generate_batch(prompts, duration)
-        total_time = time.time() - start_time
+        # Checkpointed per sound: an interrupted batch resumes from the first missing one
+        job_id = self.store.start_job(self.current_project, "batch", "; ".join(prompts),
+                                      [(prompt, duration) for prompt in prompts])
+        result = self._run_job(job_id)
+        successful, total_time = result["done"], result["time"]
         
-        successful = sum(1 for r in results if r is not None)
         print(f"\n📊 Batch Results:")
         print(f"✅ Generated: {successful}/{len(prompts)} sounds")
         print(f"⏱️ Total time: {total_time:.3f}s")
         print(f"🚀 Average: {total_time/len(prompts):.3f}s per sound")
         
-        # Add to current project
         if self.current_project and successful > 0:
-            for prompt, result in zip(prompts, results):
-                if result:
-                    self.projects[self.current_project]["sounds"][prompt] = result
             print(f"📂 Added {successful} sounds to project: {self.current_project}")
     
     def create_sound_pack(self):
@@ -217,11 +318,13 @@ class WorkshopInterface:
         
         print(f"\n📦 Creating pack '{pack_name}' with {len(descriptions)} sounds...")
         
-        pack_dir = self.workshop.create_sound_pack(pack_name, descriptions)
+        pack_dir = os.path.join("sound_packs", pack_name)
+        job_id = self.store.start_job(self.current_project, "pack", pack_name,
+                                      [(desc, 3.0) for desc in descriptions], output=pack_dir)
+        result = self._run_job(job_id)
+        print(f"✅ Pack ready: {result['done']}/{result['total']} sounds in {pack_dir}")
         
-        # Add to current project
         if self.current_project:
-            self.projects[self.current_project]["packs"].append(pack_dir)
             print(f"📂 Pack added to project: {self.current_project}")
     
     def campaign_preparation(self):
@@ -343,12 +446,19 @@ class WorkshopInterface:
             # Custom implementation would go here
             return
         
+        try:
+            duration = float(input("Duration for all sounds (default: 3.0) > ").strip() or "3.0")
+        except ValueError:
+            duration = 3.0
+        
         print(f"\n🏗️ Preparing {campaign_name} campaign sounds...")
-        generated_sounds = self.workshop.prepare_campaign_sounds(campaign_sounds)
+        job_id = self.store.start_job(self.current_project, "campaign", campaign_name,
+                                      [(prompt, duration, category)
+                                       for category, prompts in campaign_sounds.items() for prompt in prompts])
+        result = self._run_job(job_id)
+        print(f"✅ Campaign ready: {result['done']}/{result['total']} sounds in {result['time']:.1f}s")
         
-        # Save campaign to project
         if self.current_project:
-            self.projects[self.current_project][f"campaign_{campaign_name}"] = generated_sounds
             print(f"📂 Campaign added to project: {self.current_project}")
     
     def show_statistics(self):
@@ -359,15 +469,17 @@ class WorkshopInterface:
         print("=" * 40)
         print(f"Neural Cache Files: {cache_info['files']}")
         print(f"Cache Size: {cache_info['size_mb']:.1f} MB")
-        print(f"Active Projects: {len(self.projects)}")
+        print(f"Active Projects: {len(self.store.list_projects())}")
         print(f"Current Project: {self.current_project or 'None'}")
+        print(f"Unfinished Jobs: {len(self.store.unfinished_jobs())}")
         
-        if self.current_project and self.current_project in self.projects:
-            project = self.projects[self.current_project]
+        project = self.store.get_project(self.current_project) if self.current_project else None
+        if project:
             print(f"\nCurrent Project Details:")
             print(f"  Sounds: {len(project.get('sounds', {}))}")
             print(f"  Packs: {len(project.get('packs', []))}")
-            print(f"  Description: {project.get('description', 'None')}")
+            print(f"  Campaigns: {len(project.get('campaigns', {}))}")
+            print(f"  Description: {project.get('description') or 'None'}")
         
         # GPU memory info
         try:
@@ -438,6 +550,7 @@ class WorkshopInterface:
     def run(self):
         """Run the workshop interface."""
         self.print_banner()
+        self.resume_unfinished_jobs()
         
         while True:
             self.print_menu()
@@ -447,8 +560,7 @@ class WorkshopInterface:
             if choice == "1":
                 self.create_new_project()
             elif choice == "2":
-                # Load project implementation
-                print("📂 Project loading not implemented yet")
+                self.load_existing_project()
             elif choice == "3":
                 self.generate_single_sound()
             elif choice == "4":
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import copy
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append('src')
+from benchmark import Benchmark, compare, main
+
+
+def test_report_fields():
+    """A short run reports percentiles, x-real-time and memory for every case."""
+    print("⏱️ TESTING BENCHMARK HARNESS")
+    print("=" * 50)
+
+    report = Benchmark(trials=4, warmup=1, variants=2).run(["kernels", "numpy"], [0.5], ["pink_noise", "grain_scatter", "fire"])
+    cases = {(r["engine"], r["sound_type"]) for r in report["results"]}
+    assert cases == {("kernels", "pink_noise"), ("kernels", "grain_scatter"), ("numpy", "fire")}
+
+    for result in report["results"]:
+        assert 0 < result["min"] <= result["p50"] <= result["p90"] <= result["p99"]
+        assert abs(result["xrt"] - 0.5 * 2 / result["p50"]) < 1e-6
+        assert result["memory_source"] == "tracemalloc" and result["peak_mb"] > 0
+
+    assert report["settings"] == {"trials": 4, "warmup": 1, "variants": 2}
+    assert report["meta"]["devices"] == {"kernels": "cpu", "numpy": "cpu"}
+    json.dumps(report)
+
+
+def test_compare_flags_regressions():
+    """Only cases more than the threshold slower than the baseline are regressions."""
+    baseline = {"results": [
+        {"engine": "numpy", "sound_type": "fire", "duration": 1.0, "variants": 1, "p50": 0.010},
+        {"engine": "numpy", "sound_type": "wind", "duration": 1.0, "variants": 1, "p50": 0.010}
+    ]}
+    current = copy.deepcopy(baseline)
+    current["results"][0]["p50"] = 0.0105
+    current["results"][1]["p50"] = 0.0150
+    current["results"].append({"engine": "numpy", "sound_type": "bell", "duration": 1.0, "variants": 1, "p50": 0.02})
+
+    changes = {change["sound_type"]: change for change in compare(baseline, current, threshold=0.10)}
+    assert set(changes) == {"fire", "wind"}
+    assert not changes["fire"]["regression"]
+    assert changes["wind"]["regression"] and abs(changes["wind"]["ratio"] - 1.5) < 1e-9
+
+
+def test_cli_round_trip():
+    """The CLI writes a report that it can compare against itself."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "report.json")
+        args = ["--engines", "kernels", "--types", "wind_noise", "--durations", "0.25", "--trials", "3", "--warmup", "1"]
+        assert main(args + ["-o", path]) == 0
+        with open(path) as f:
+            assert len(json.load(f)["results"]) == 1
+        assert main(args + ["--compare", path, "--threshold", "100"]) == 0
+
+
+if __name__ == "__main__":
+    test_report_fields()
+    test_compare_flags_regressions()
+    test_cli_round_trip()
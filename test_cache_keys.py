@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append('src')
+from cache_keys import (STOPWORDS, canonical_prompt, canonical_key, parameter_key, quantize_duration,
+                        raw_key, replay_hit_rate)
+from sound_types import SEMANTIC_KEYWORDS, SOUND_TYPES, classify_prompt
+
+
+def _scene_prompts():
+    with open("scenes_v2.json") as f:
+        scenes = json.load(f)
+    for name, scene in scenes.items():
+        yield f"{name} {scene['bed']['prompt']}"
+        for oneshot in scene.get("oneshots", []):
+            if "prompt" in oneshot:
+                yield f"{name} oneshot {oneshot['prompt']}"
+
+
+def test_canonical_prompt():
+    """Case, whitespace, punctuation, stopwords and word order do not matter."""
+    print("🔑 TESTING CACHE KEY CANONICALIZATION")
+    print("=" * 50)
+
+    variants = ["Cozy tavern", "cozy tavern ", "cozy  Tavern", "the tavern, cozy!", "a COZY tavern tavern"]
+    assert {canonical_prompt(p) for p in variants} == {"cozy tavern"}
+    assert canonical_prompt("the") == "the"
+    assert canonical_prompt("wind howling") != canonical_prompt("wind whistling")
+
+    assert quantize_duration(3.0) == quantize_duration(3.1) == quantize_duration(2.9) == 3.0
+    assert quantize_duration(3.2) == 3.25
+    assert quantize_duration(0.01) == 0.25
+
+
+def test_canonicalization_keeps_classification():
+    """No stopword hides a classifier keyword, so canonical prompts classify exactly like the originals."""
+    keywords = list(SOUND_TYPES) + [word for _, words in SEMANTIC_KEYWORDS for word in words]
+    keywords += ['cozy', 'warm', 'inn', 'pub', 'drinking', 'woods', 'trees', 'nature', 'flame', 'crackling',
+                 'stream', 'river', 'breeze', 'step', 'walk', 'footstep', 'spell', 'mystical']
+    assert not [(stop, word) for stop in STOPWORDS for word in keywords if word in stop]
+
+    from audio_generator import AudioGenerator
+    generator = AudioGenerator._for_worker(44100)
+    for prompt in _scene_prompts():
+        assert classify_prompt(canonical_prompt(prompt)) == classify_prompt(prompt), prompt
+        assert generator._classify_prompt(canonical_prompt(prompt)) == generator._classify_prompt(prompt), prompt
+
+
+def test_near_duplicates_share_cache_files():
+    """Prompts of one sound type and durations in one bucket hit the same cache file."""
+    from cpu_audio_generator import NumpyAudioGenerator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = NumpyAudioGenerator(cache_dir=tmp)
+        first = generator.generate_sound("Cozy tavern", 3.0, seed=2)
+        assert generator.generate_sound("cozy  tavern ", 3.1, seed=2) == first
+        assert generator.generate_sound("tavern with warm ale", 2.9, seed=2) == first
+        assert generator.generate_sound("Cozy tavern", 3.0, seed=3) != first
+        assert len([f for f in os.listdir(tmp) if f.endswith('.wav')]) == 2
+
+
+def test_replay_hit_rate():
+    """Session replay counts one lookup per variant against an initially empty cache."""
+    events = [
+        {"engine": "numpy", "prompt": "Cozy tavern", "duration": 3.0, "sound_type": "tavern", "cache_hit": False},
+        {"engine": "numpy", "prompt": "cozy tavern ", "duration": 3.0, "sound_type": "tavern", "cache_hit": False},
+        {"engine": "numpy", "prompt": "warm inn", "duration": 3.0, "sound_type": "tavern", "cache_hit": False,
+         "seed": 0, "variants": 2},
+        {"engine": "numpy", "prompt": "ignored: not a finished request", "duration": 3.0}
+    ]
+    assert replay_hit_rate(events, raw_key) == {"lookups": 4, "hits": 0, "renders": 4, "hit_rate": 0.0}
+    assert replay_hit_rate(events, canonical_key)["hits"] == 1
+    stats = replay_hit_rate(events, parameter_key)
+    assert stats["hits"] == 2 and stats["renders"] == 2 and stats["hit_rate"] == 0.5
+
+
+if __name__ == "__main__":
+    test_canonical_prompt()
+    test_canonicalization_keeps_classification()
+    test_near_duplicates_share_cache_files()
+    test_replay_hit_rate()
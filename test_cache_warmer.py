@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append('src')
+from cache_warmer import coverage, main, plan_cache, warm_cache
+from generative_orchestrator import GenerativeOrchestrator
+
+SCENES = {
+    "crypt": {
+        "bed": {"prompt": "cold crypt with dripping water", "duration": 30.0},
+        "oneshots": [
+            {"prompt": "bones rattling", "duration": 1.5, "prob_per_sec": 0.1},
+            {"file": "assets/sounds/missing/wind_howl.wav", "duration": 2.0, "prob_per_sec": 0.1},
+            {"prompt": "Bones rattling!", "duration": 1.6, "prob_per_sec": 0.1}
+        ]
+    },
+    "camp": {
+        "bed": {"file": "assets/sounds/missing/campfire_night.wav"},
+        "oneshots": [{"prompt": "crackling fire pop", "prob_per_sec": 0.1}]
+    }
+}
+
+
+def _orchestrator(tmp):
+    scenes_path = os.path.join(tmp, "scenes.json")
+    with open(scenes_path, "w") as f:
+        json.dump(SCENES, f)
+    orchestrator = GenerativeOrchestrator(audio_engine=None)
+    orchestrator.audio_generator.cache_dir = os.path.join(tmp, "cache")
+    os.makedirs(orchestrator.audio_generator.cache_dir)
+    assert orchestrator.load_scenes_from_file(scenes_path)
+    return orchestrator, scenes_path
+
+
+def test_plan_matches_orchestrator_resolution():
+    """Prompts, context prefixes, inferred prompts and default durations match the live path."""
+    print("🔥 TESTING CACHE WARMER")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        orchestrator, _ = _orchestrator(tmp)
+        entries = plan_cache(orchestrator)
+        by_prompt = {entry["prompt"]: entry for entry in entries}
+
+        assert [entry["role"] for entry in entries] == ["bed", "oneshot", "oneshot", "oneshot", "bed", "oneshot"]
+        assert "crypt ambient background cold crypt with dripping water" in by_prompt
+        assert "crypt oneshot wind howl" in by_prompt
+        assert by_prompt["camp ambient background campfire night"]["duration"] == 3.0
+        assert len(by_prompt["crypt oneshot bones rattling"]["paths"]) == orchestrator.variant_pools.pool_size
+        assert len(by_prompt["crypt ambient background cold crypt with dripping water"]["paths"]) == 1
+
+        # Near-duplicate oneshots land on the same cache files
+        assert by_prompt["crypt oneshot bones rattling"]["paths"] == by_prompt["crypt oneshot Bones rattling!"]["paths"]
+
+        report = coverage(entries)
+        assert report == {"sounds": 6, "ready": 0, "unresolved": 0, "files": report["files"],
+                          "cached_files": 0, "percent": 0.0}
+
+
+def test_warm_cache_gives_live_cache_hits():
+    """After warming, the live path and the variant pools render nothing new."""
+    with tempfile.TemporaryDirectory() as tmp:
+        orchestrator, scenes_path = _orchestrator(tmp)
+        assert main(["--scenes", scenes_path, "--cache-dir", orchestrator.audio_generator.cache_dir, "--check"]) == 1
+
+        report = warm_cache(orchestrator, max_workers=2)
+        assert report["percent"] == 100.0 and report["cached_files"] == report["files"]
+        cache_dir = orchestrator.audio_generator.cache_dir
+        files = sorted(os.listdir(cache_dir))
+
+        for scene_name, data in SCENES.items():
+            assert orchestrator._get_audio_file(data["bed"], f"{scene_name} ambient background") is not None
+            for oneshot in orchestrator.get_compiled_scene(scene_name).oneshots:
+                for seed in range(orchestrator.variant_pools.pool_size):
+                    assert orchestrator._render_variant(oneshot.pool_prompt, oneshot.pool_duration, seed)
+
+        assert sorted(os.listdir(cache_dir)) == files
+        assert main(["--scenes", scenes_path, "--cache-dir", cache_dir, "--check"]) == 0
+
+
+if __name__ == "__main__":
+    test_plan_matches_orchestrator_resolution()
+    test_warm_cache_gives_live_cache_hits()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append('src')
+from campaign_pipeline import format_progress, plan_work, run_pipeline
+
+SCI_FI = {
+    "environments": ["spaceship engine humming", "alien planet atmosphere", "space station ambiance",
+                     "asteroid field silence", "cyberpunk city rain"],
+    "technology": ["laser weapon charging", "robot movement servos", "computer terminal beeping",
+                   "airlock cycling sound", "hologram activation hum"],
+    "vehicles": ["spaceship takeoff thrust", "hover car passing by", "mech suit footsteps",
+                 "Spaceship engine humming", "plasma engine ignition"]
+}
+
+_worker_generator = None
+
+
+def _render_numpy(item):
+    """Process-pool render: one NumPy engine per worker process."""
+    global _worker_generator
+    if _worker_generator is None:
+        from cpu_audio_generator import NumpyAudioGenerator
+        _worker_generator = NumpyAudioGenerator(cache_dir=item["cache_dir"])
+    return _worker_generator.generate_sound(item["prompt"], item["duration"], seed=item["seed"])
+
+
+def test_plan_dedupes_and_orders_short_first():
+    """Repeated prompts across categories become one job; short clips are scheduled first."""
+    print("🏗️ TESTING CAMPAIGN PIPELINE")
+    print("=" * 50)
+
+    items = [{"prompt": "the wolf howling", "duration": 10.0, "category": "creatures"},
+             {"prompt": "door creak", "duration": 2.0, "category": "effects"},
+             {"prompt": "Wolf  howling", "duration": 10.1, "category": "night"},
+             {"prompt": "sword clash", "duration": 2.0, "category": "effects"},
+             {"prompt": "wolf howling", "duration": 30.0, "category": "beds"}]
+    jobs = plan_work(items)
+
+    assert [job["item"]["prompt"] for job in jobs] == ["door creak", "sword clash", "the wolf howling", "wolf howling"]
+    assert [len(job["members"]) for job in jobs] == [1, 1, 2, 1]
+    assert [member["category"] for member in jobs[2]["members"]] == ["creatures", "night"]
+
+
+def test_pipeline_streams_progress_for_every_item():
+    """Every item is reported once with running progress, each job renders once, finish runs per item."""
+    items = [{"prompt": prompt, "duration": 1.0 + i % 3, "category": category}
+             for category, prompts in SCI_FI.items() for i, prompt in enumerate(prompts)]
+    calls = []
+
+    def render(item):
+        calls.append(item["prompt"])
+        time.sleep(0.01)
+        return f"/cache/{item['prompt']}.wav"
+
+    results = list(run_pipeline(items, render, max_workers=4,
+                                finish=lambda item, path: f"{item['category']}/{os.path.basename(path)}"))
+    for item, path, progress in results[:3]:
+        print(f"  {format_progress(progress)} {item['prompt']}")
+
+    assert len(results) == 15 and len(calls) == 14
+    assert sorted(calls) == sorted(set(calls))
+    assert {path.split("/")[0] for _, path, _ in results} == set(SCI_FI)
+    assert [progress["done"] for _, _, progress in results][-1] == 15
+    assert results[-1][2]["eta"] == 0 and results[-1][2]["rate"] > 0
+    assert all(a[2]["done"] <= b[2]["done"] for a, b in zip(results, results[1:]))
+
+
+def test_failures_are_reported_not_raised():
+    """A failing job marks its items failed and the rest of the campaign still completes."""
+    def render(item):
+        if item["prompt"] == "boom":
+            raise RuntimeError("render crashed")
+        return item["prompt"] if item["prompt"] != "nothing" else None
+
+    results = {item["prompt"]: path for item, path, _ in run_pipeline(
+        [{"prompt": p, "duration": 1.0} for p in ["ok", "boom", "nothing", "fine"]], render, max_workers=2)}
+    assert results == {"ok": "ok", "boom": None, "nothing": None, "fine": "fine"}
+
+
+def test_process_pool_campaign():
+    """A full sci-fi campaign on a process pool matches the serial render."""
+    with tempfile.TemporaryDirectory() as tmp:
+        items = [{"prompt": prompt, "duration": 2.0, "seed": 0, "cache_dir": tmp}
+                 for prompts in SCI_FI.values() for prompt in prompts]
+
+        timings = {}
+        for workers in sorted({1, min(os.cpu_count() or 1, 4)}):
+            for name in os.listdir(tmp):
+                os.remove(os.path.join(tmp, name))
+            start = time.perf_counter()
+            paths = {item["prompt"]: path for item, path, _ in
+                     run_pipeline(items, _render_numpy, max_workers=workers, processes=True)}
+            timings[workers] = time.perf_counter() - start
+
+        print(f"📊 Campaign of {len(items)} sounds: " +
+              ", ".join(f"{workers} worker(s) {seconds:.2f}s" for workers, seconds in timings.items()))
+        assert len(paths) == 15 and all(path and os.path.exists(path) for path in paths.values())
+
+
+def test_engine_key_renders_each_cache_file_once():
+    """Prompts sharing a procedural cache file become one job, and cache files appear whole."""
+    from cpu_audio_generator import NumpyAudioGenerator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = NumpyAudioGenerator(cache_dir=tmp)
+        items = [{"prompt": f"crackling fire {detail}", "duration": 2.0}
+                 for detail in ["pop", "hiss", "roar", "embers", "logs", "camp", "hearth", "blaze"]]
+        assert len({generator.cache_path(item["prompt"], item["duration"]) for item in items}) == 1
+
+        renders = []
+
+        def render(item):
+            renders.append(item["prompt"])
+            return generator.generate_sound(item["prompt"], item["duration"])
+
+        results = list(run_pipeline(items, render, max_workers=8,
+                                    key=lambda item: generator.cache_path(item["prompt"], item["duration"])))
+        assert len(renders) == 1 and len(results) == 8
+        assert len({path for _, path, _ in results}) == 1
+        assert not [name for name in os.listdir(tmp) if name.endswith(".tmp")]
+
+
+if __name__ == "__main__":
+    test_plan_dedupes_and_orders_short_first()
+    test_pipeline_streams_progress_for_every_item()
+    test_failures_are_reported_not_raised()
+    test_process_pool_campaign()
+    test_engine_key_renders_each_cache_file_once()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import sys
+sys.path.append('src')
+
+import numpy as np
+from colored_noise import ColoredNoise
+
+
+def _slope(noise, sample_rate, low=50, high=5000):
+    """Fitted log-log slope of the averaged power spectrum between low and high Hz."""
+    blocks = noise[: len(noise) // 4096 * 4096].reshape(-1, 4096) * np.hanning(4096)
+    power = np.mean(np.abs(np.fft.rfft(blocks)) ** 2, axis=0)
+    freqs = np.fft.rfftfreq(4096, 1 / sample_rate)
+    band = (freqs >= low) & (freqs <= high)
+    return np.polyfit(np.log(freqs[band]), np.log(power[band]), 1)[0]
+
+
+def test_colored_noise():
+    """Shaped noise has unit std, the requested slope, and batches per variant."""
+    print("🌈 TESTING COLORED NOISE")
+    print("=" * 50)
+
+    noise = ColoredNoise()
+    samples = 5 * noise.sample_rate
+    rngs = lambda: [np.random.default_rng(s) for s in (1, 2)]
+
+    for alpha in [0.0, 1.0, 2.0]:
+        batch = noise.generate(rngs(), samples, 0.5, alpha=alpha)
+        assert batch.shape == (2, samples)
+        assert np.allclose(np.std(batch, axis=1), 0.5)
+        assert np.allclose(batch[1], noise.generate([np.random.default_rng(2)], samples, 0.5, alpha=alpha)[0])
+        slope = _slope(batch[0], noise.sample_rate)
+        print(f"  alpha {alpha:.0f}: slope {slope:+.2f}")
+        assert abs(slope + alpha) < 0.15, alpha
+
+    stereo = noise.generate(rngs(), samples, channels=2, band=(1000, 200))
+    assert stereo.shape == (2, 2, samples) and not np.allclose(stereo[0, 0], stereo[0, 1])
+
+    layered = noise.generate(rngs(), samples, layers=[{'lowpass': 100}, {'lowpass': 400}])
+    assert np.allclose(np.std(layered, axis=1), 1.0)
+    print("  ✅ Unit std, 1/f^alpha slopes, channels and layers")
+
+
+def test_streamed_noise():
+    """Streamed overlap-add blocks join seamlessly and keep the spectral shape."""
+    noise = ColoredNoise()
+    samples = 10 * noise.sample_rate
+    blocks = list(noise.stream(np.random.default_rng(3), samples, block=20000, alpha=1.0))
+    assert all(block.shape[0] == 1 for block in blocks)
+    streamed = np.concatenate(blocks, axis=-1)[0]
+    assert len(streamed) == samples
+
+    assert abs(np.std(streamed) - 1.0) < 0.05
+    assert abs(_slope(streamed, noise.sample_rate) + 1.0) < 0.15
+    # No jumps at block joins: steps there look like steps anywhere else
+    steps = np.abs(np.diff(streamed))
+    assert steps[19999::20000].mean() < 2 * steps.mean()
+    print("  ✅ Streamed blocks are seamless")
+
+
+if __name__ == "__main__":
+    test_colored_noise()
+    test_streamed_noise()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import subprocess
+import tempfile
+import time
+sys.path.append('src')
+
+import numpy as np
+from cpu_audio_generator import NumpyAudioGenerator
+
+# Speedup over torch-on-CPU the NumPy engine must reach. Wall-clock comparisons
+# are opt-in (e.g. BARDS_FORGE_CPU_SPEEDUP=1.0) so the unit suite stays deterministic.
+MIN_SPEEDUP = os.environ.get("BARDS_FORGE_CPU_SPEEDUP")
+
+# Workloads for the torch comparison: (prompt, duration in seconds)
+BENCHMARK_PROMPTS = [
+    ("cozy tavern", 3.0),
+    ("crackling fire", 3.0),
+    ("gentle stream", 3.0),
+    ("magical spell", 3.0),
+    ("sword clash", 3.0),
+    ("howling breeze", 1.0),
+    ("church bell", 1.0),
+]
+
+
+def test_all_sound_types():
+    """Every sound type renders finite, normalized, seed-distinct variants."""
+    print("💻 TESTING NUMPY CPU ENGINE")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = NumpyAudioGenerator(cache_dir=tmp)
+        for sound_type in generator.sound_types:
+            audio = generator._render(sound_type, 1.0, [1, 2])
+            assert audio.shape == (2, generator.sample_rate), sound_type
+            assert np.isfinite(audio).all(), sound_type
+            assert np.abs(audio).max() <= 0.8 + 1e-6, sound_type
+            assert not np.allclose(audio[0], audio[1]), f"{sound_type}: seeds should differ"
+
+            # A batched variant must equal its single render
+            single = generator._render(sound_type, 1.0, [2])
+            assert np.allclose(single[0], audio[1], atol=1e-6), sound_type
+
+        print(f"  ✅ {len(generator.sound_types)} sound types rendered")
+
+
+def test_runs_without_torch():
+    """The engine must import and generate with torch unavailable."""
+    with tempfile.TemporaryDirectory() as tmp:
+        script = (
+            "import sys; sys.modules['torch'] = None; sys.path.append('src')\n"
+            "from cpu_audio_generator import create_audio_generator\n"
+            f"generator = create_audio_generator({tmp!r})\n"
+            "assert type(generator).__name__ == 'NumpyAudioGenerator'\n"
+            "assert generator.generate_sound('distant thunder', 1.0)\n"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True, capture_output=True,
+                       cwd=os.path.dirname(os.path.abspath(__file__)))
+    print("  ✅ Generates with torch not installed")
+
+
+def _time_render(generator, sound_type, duration, repeats=3):
+    generator._render(sound_type, duration, [0, 1, 2, 3])  # warm-up
+    start = time.perf_counter()
+    for i in range(repeats):
+        generator._render(sound_type, duration, [i * 4 + v for v in range(4)])
+    return (time.perf_counter() - start) / repeats
+
+
+def test_benchmark_vs_torch_cpu():
+    """NumPy kernels should beat the torch kernels when torch runs on the CPU (asserted when MIN_SPEEDUP is set)."""
+    try:
+        import torch
+        from gpu_audio_generator import RTX5090AudioGenerator
+    except ImportError:
+        print("  ⚠️ torch not installed, skipping benchmark")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        numpy_gen = NumpyAudioGenerator(cache_dir=os.path.join(tmp, "cpu"))
+        torch_gen = RTX5090AudioGenerator(cache_dir=os.path.join(tmp, "torch"))
+        torch_gen.device = "cpu"
+
+        print(f"\n📊 4 variants per render, torch threads: {torch.get_num_threads()}")
+        print(f"  {'prompt':<16} {'numpy':>10} {'torch cpu':>10} {'speedup':>8}")
+        total_numpy = total_torch = 0.0
+        for prompt, duration in BENCHMARK_PROMPTS:
+            sound_type = numpy_gen._classify_prompt(prompt)
+            numpy_time = _time_render(numpy_gen, sound_type, duration)
+            torch_time = _time_render(torch_gen, sound_type, duration, repeats=1)
+            total_numpy += numpy_time
+            total_torch += torch_time
+            print(f"  {prompt:<16} {numpy_time * 1000:8.1f}ms {torch_time * 1000:8.1f}ms {torch_time / numpy_time:7.1f}x")
+
+    print(f"  {'total':<16} {total_numpy * 1000:8.1f}ms {total_torch * 1000:8.1f}ms {total_torch / total_numpy:7.1f}x")
+    if MIN_SPEEDUP:
+        assert total_torch / total_numpy > float(MIN_SPEEDUP)
+
+
+if __name__ == "__main__":
+    test_all_sound_types()
+    test_runs_without_torch()
+    test_benchmark_vs_torch_cpu()
@@ -169,7 +169,7 @@ def test_rtx5090_true_acceleration():
     print(f"  Size: {cache_info['size_mb']:.1f} MB")
 
 def benchmark_gpu_vs_cpu():
-    """Benchmark GPU vs CPU performance."""
+    """Benchmark the GPU kernels against the NumPy CPU engine on the same sounds."""
     print(f"\n🏁 GPU vs CPU BENCHMARK")
     print("=" * 40)
     
@@ -178,62 +178,17 @@ def benchmark_gpu_vs_cpu():
         print("❌ CUDA not available for benchmark")
         return
     
-    # Test the same operation on GPU vs CPU
-    test_prompt = "magical spell with sparkles"
-    duration = 3.0
+    from benchmark import Benchmark
     
-    # GPU test
-    print("🚀 GPU Performance Test...")
-    gpu_gen = RTX5090AudioGenerator()
-    
-    start_time = time.time()
-    gpu_result = gpu_gen.generate_sound(test_prompt, duration)
-    gpu_time = time.time() - start_time
-    
-    if gpu_result:
-        gpu_speed = duration / gpu_time
-        print(f"  GPU: {gpu_time:.4f}s ({gpu_speed:.1f}x real-time)")
-    else:
-        print("  GPU: Generation failed")
-    
-    # CPU simulation (tensor operations on CPU)
-    print("💻 CPU Performance Test...")
-    
-    # Force CPU mode by creating tensors on CPU
-    start_time = time.time()
+    # Same sound types, durations, seeds and trial counts for both engines
+    report = Benchmark(trials=10, warmup=2).run(["torch", "numpy"], [3.0], ["magic", "tavern", "thunder"])
+    p50 = {(r["engine"], r["sound_type"]): r["p50"] for r in report["results"]}
     
-    # Simulate the same operations but on CPU
-    samples = int(duration * 44100)
-    cpu_audio = torch.randn(samples) * 0.3  # CPU tensor
-    
-    # Add some processing
-    t = torch.linspace(0, duration, samples)
-    freq = 1000
-    wave = torch.sin(2 * torch.pi * freq * t) * 0.2
-    cpu_audio += wave
-    
-    # Normalize
-    max_val = torch.max(torch.abs(cpu_audio))
-    if max_val > 0:
-        cpu_audio = cpu_audio / max_val * 0.8
-    
-    cpu_time = time.time() - start_time
-    cpu_speed = duration / cpu_time
-    
-    print(f"  CPU: {cpu_time:.4f}s ({cpu_speed:.1f}x real-time)")
-    
-    # Comparison
-    if gpu_time > 0 and cpu_time > 0:
-        speedup = cpu_time / gpu_time
-        print(f"\n📊 Performance Comparison:")
-        print(f"  GPU speedup: {speedup:.1f}x faster than CPU")
-        
-        if speedup > 2:
-            print("🎉 Significant GPU acceleration achieved!")
-        elif speedup > 1.2:
-            print("✅ Good GPU acceleration!")
-        else:
-            print("⚠️ Limited GPU acceleration")
+    print(f"\n📊 Performance Comparison (p50 per 3s clip):")
+    for sound_type in ["magic", "tavern", "thunder"]:
+        gpu_time, cpu_time = p50[("torch", sound_type)], p50[("numpy", sound_type)]
+        print(f"  {sound_type:<8} GPU {gpu_time * 1000:7.2f}ms | CPU {cpu_time * 1000:7.2f}ms | "
+              f"GPU speedup {cpu_time / gpu_time:.1f}x")
 
 if __name__ == "__main__":
     test_rtx5090_true_acceleration()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+import sys
+import time
+sys.path.append('src')
+
+import numpy as np
+from synthesis_tables import SynthesisTables
+from granular import GranularRenderer
+
+
+def _events(renderer, rate, samples, variants=2):
+    events = []
+    for seed in range(variants):
+        rng = np.random.default_rng(seed)
+        count = int(rate * samples / 44100)
+        events.append((rng.integers(0, samples, count), renderer.choose(rng, count), rng.uniform(0.5, 1.0, count)))
+    return events
+
+
+def _overlay(dest, start, grain, gain):
+    """Reference mix of one event: dest[start:] += grain * gain, clipped to dest."""
+    count = min(len(grain), len(dest) - start)
+    dest[start:start + count] += grain[:count] * gain
+
+
+def test_paths_match_overlay():
+    """Scatter and FFT paths mix exactly what one overlay per event would."""
+    print("🌾 TESTING GRANULAR RENDERER")
+    print("=" * 50)
+
+    tables = SynthesisTables(noise_seconds=1.0, bank_size=8)
+    renderer = GranularRenderer(tables)
+    samples, grain_samples = 44100, 4410
+    events = _events(renderer, 20, samples)
+
+    expected = np.zeros((len(events), samples))
+    bank = tables.bank('crackle', grain_samples)
+    for row, (onsets, rows, gains) in enumerate(events):
+        for onset, bank_row, gain in zip(onsets, rows, gains):
+            _overlay(expected[row], onset, bank[bank_row], gain)
+
+    for method in ["scatter", "fft"]:
+        audio = renderer.render('crackle', grain_samples, samples, events, method)
+        assert audio.shape == expected.shape
+        assert np.allclose(audio, expected, atol=1e-9), method
+    print("  ✅ scatter and fft match per-event overlay")
+
+
+def test_density_is_free():
+    """Past the crossover the FFT path is picked and ten times the events cost about the same."""
+    renderer = GranularRenderer(SynthesisTables(noise_seconds=1.0, bank_size=8))
+    samples, grain_samples = 3 * 44100, 4410
+
+    timings = {}
+    for rate in [2000, 20000]:
+        events = _events(renderer, rate, samples)
+        renderer.render('crackle', grain_samples, samples, events)  # warm-up
+        start = time.perf_counter()
+        renderer.render('crackle', grain_samples, samples, events)
+        timings[rate] = time.perf_counter() - start
+        print(f"  {rate:>5} events/s: {timings[rate] * 1000:7.1f}ms")
+
+    assert renderer._cheaper_method(_events(renderer, 20, samples), grain_samples, samples) == "scatter"
+    assert renderer._cheaper_method(_events(renderer, 20000, samples), grain_samples, samples) == "fft"
+    assert timings[20000] < timings[2000] * 2
+
+
+if __name__ == "__main__":
+    test_paths_match_overlay()
+    test_density_is_free()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.append('src')
+from loudness import (TARGET_LUFS, TRUE_PEAK_CEILING_DB, LoudnessIndex, analyze, get_index,
+                      lookup, playback_gain)
+
+RATE = 48000
+
+
+def _sine(freq, amplitude, seconds=3.0, phase=0.0, rate=RATE):
+    return amplitude * np.sin(2 * np.pi * freq * np.arange(int(seconds * rate)) / rate + phase)
+
+
+def test_reference_levels():
+    """A 997 Hz sine reads -3.01 LUFS at 0 dBFS and tracks level changes dB for dB."""
+    print("🔊 TESTING LOUDNESS ANALYSIS")
+    print("=" * 50)
+
+    full, quiet = analyze(np.stack([_sine(997, 1.0), _sine(997, 0.1)]), RATE)
+    print(f"📊 997 Hz sine: 0 dBFS -> {full['lufs']} LUFS, -20 dBFS -> {quiet['lufs']} LUFS")
+    assert abs(full["lufs"] - (-3.01)) < 0.1
+    assert abs(quiet["lufs"] - full["lufs"] + 20) < 0.05
+    assert abs(full["rms_db"] - (-3.01)) < 0.02
+    assert analyze(np.zeros(RATE), RATE)[0]["lufs"] == -200.0
+
+
+def test_true_peak_catches_inter_sample_overs():
+    """A sine at fs/4 sampled 45 degrees off its crest peaks 3 dB above its samples."""
+    stats = analyze(_sine(RATE / 4, 1.0, seconds=0.5, phase=np.pi / 4), RATE)[0]
+    assert abs(stats["true_peak_db"]) < 0.1
+    assert abs(analyze(_sine(1000, 0.5), RATE)[0]["true_peak_db"] - (-6.02)) < 0.05
+
+
+def test_gating_ignores_silence():
+    """Silent stretches don't drag integrated loudness down (ungated, this would read 4.8 dB low)."""
+    tone = _sine(997, 0.5, seconds=2.0)
+    padded = np.concatenate([tone, np.zeros(4 * RATE)])
+    # Only the few blocks straddling the edge of the tone pass the gates at a lower level
+    assert abs(analyze(padded, RATE)[0]["lufs"] - analyze(tone, RATE)[0]["lufs"]) < 0.5
+
+
+def test_batch_matches_single_clips():
+    """Analyzing a batch gives the same numbers as clip by clip, in a fraction of realtime."""
+    rng = np.random.default_rng(0)
+    clips = rng.uniform(-0.5, 0.5, (4, 30 * 44100)).astype(np.float32)
+    start = time.perf_counter()
+    batch = analyze(clips, 44100)
+    elapsed = time.perf_counter() - start
+    print(f"📊 4 x 30s clips analyzed in {elapsed * 1e3:.0f}ms")
+    assert batch == [analyze(clip, 44100)[0] for clip in clips]
+
+
+def test_playback_gain():
+    """Loud clips come down to the target, quiet ones are never boosted, peaks stay under the ceiling."""
+    assert playback_gain(None) == 1.0
+    assert playback_gain({"lufs": -200.0, "true_peak_db": -200.0, "rms_db": -200.0}) == 1.0
+    assert abs(playback_gain({"lufs": -13.0, "true_peak_db": -6.0}) - 10 ** (-10 / 20)) < 1e-9
+    assert playback_gain({"lufs": -30.0, "true_peak_db": -12.0}) == 1.0
+    gain = playback_gain({"lufs": TARGET_LUFS + 1, "true_peak_db": 2.0})
+    assert abs(20 * np.log10(gain) - (TRUE_PEAK_CEILING_DB - 2.0)) < 1e-9
+
+
+def test_index_written_at_generation_and_applied_at_playback():
+    """Generated clips land in the cache's index once; AudioEngine plays them at the normalized gain."""
+    from cpu_audio_generator import NumpyAudioGenerator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = NumpyAudioGenerator(cache_dir=tmp)
+        path = generator.generate_sound("crackling fire", 1.0)
+        stats = get_index(tmp).get(path)
+        assert stats is not None and set(stats) == {"rms_db", "lufs", "true_peak_db"}
+
+        # A fresh reader (another process) sees the same records
+        assert LoudnessIndex(tmp).get(path) == stats
+        assert lookup(path) == stats
+
+        # A cache hit doesn't analyze or append again
+        size = os.path.getsize(os.path.join(tmp, "loudness.jsonl"))
+        assert generator.generate_sound("crackling fire", 1.0) == path
+        assert os.path.getsize(os.path.join(tmp, "loudness.jsonl")) == size
+
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        from audio_engine import AudioEngine
+        engine = AudioEngine()
+        sound = engine.load_sound(path)
+        expected = playback_gain(stats)
+        assert abs(engine.sound_gain[os.path.abspath(path)] - expected) < 1e-9
+        if engine.play_sound(path, volume=0.5) is not None:
+            assert abs(sound.get_volume() - 0.5 * expected) < 0.01
+        engine.release_sound(path)
+        assert os.path.abspath(path) not in engine.sound_gain
+        engine.quit()
+
+        generator.clear_cache()
+        assert get_index(tmp).get(path) is None
+
+
+if __name__ == "__main__":
+    test_reference_levels()
+    test_true_peak_catches_inter_sample_overs()
+    test_gating_ignores_silence()
+    test_batch_matches_single_clips()
+    test_playback_gain()
+    test_index_written_at_generation_and_applied_at_playback()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import filecmp
+import tempfile
+import time
+sys.path.append('src')
+
+from audio_generator import AudioGenerator
+
+PACK_PROMPTS = [
+    "cozy tavern", "crackling fire", "forest birds", "water stream",
+    "wind howl", "footsteps march", "magic spell", "crackling fire"
+]
+
+
+def test_generate_many_matches_serial():
+    """Pool results must be identical to serial generate_sound, whatever worker ran them."""
+    print("⚙️ TESTING PARALLEL GENERATION")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        parallel = AudioGenerator(cache_dir=os.path.join(tmp, "parallel"))
+        serial = AudioGenerator(cache_dir=os.path.join(tmp, "serial"))
+
+        start = time.time()
+        parallel_paths = parallel.generate_many(PACK_PROMPTS, 2.0, seed=5, max_workers=3)
+        parallel_time = time.time() - start
+
+        start = time.time()
+        serial_paths = [serial.generate_sound(prompt, 2.0, seed=5) for prompt in PACK_PROMPTS]
+        serial_time = time.time() - start
+
+        assert None not in parallel_paths
+        assert parallel_paths[1] == parallel_paths[-1], "duplicate prompts share one file"
+        for a, b in zip(parallel_paths, serial_paths):
+            assert filecmp.cmp(a, b, shallow=False), f"{a} differs from serial render"
+
+        # Everything is cached now
+        assert parallel.generate_many(PACK_PROMPTS, 2.0, seed=5) == parallel_paths
+
+    print(f"  ✅ {len(PACK_PROMPTS)} prompts identical to serial renders")
+    print(f"  ⏱️ 3 workers: {parallel_time:.2f}s, serial: {serial_time:.2f}s ({os.cpu_count()} cores)")
+
+
+if __name__ == "__main__":
+    test_generate_many_matches_serial()
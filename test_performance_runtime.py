@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import tempfile
+import threading
+import time
+sys.path.append('src')
+
+from oneshot_scheduler import OneshotScheduler
+from performance_runtime import PerformanceRuntime
+
+
+class FakeTransitions:
+    fading = False
+    on_ready = None
+
+
+class FakeOrchestrator:
+    """Just enough orchestrator for the runtime: a scheduler and an update() counter."""
+
+    def __init__(self):
+        self.scheduler = OneshotScheduler()
+        self.transitions = FakeTransitions()
+        self.current_scene = "test"
+        self.updates = 0
+        self.fired = []
+
+    def update(self):
+        self.updates += 1
+        for due_time, oneshot in self.scheduler.due(time.time()):
+            self.fired.append((time.time() - due_time, oneshot["file"]))
+
+
+def test_performance_runtime():
+    """Commands are handled as they arrive and the loop sleeps between events."""
+    print("⏱️ TESTING EVENT-DRIVEN PERFORMANCE RUNTIME")
+    print("=" * 50)
+
+    orchestrator = FakeOrchestrator()
+    orchestrator.scheduler.reset([{"file": "chime.wav", "prob_per_sec": 4.0}], time.time())
+    commands = []
+
+    async def handle(line):
+        if line == "ask":
+            commands.append(("ask", await runtime.ainput("? ")))
+        elif line == "slow":
+            commands.append(("slow", await runtime.run_blocking(time.sleep, 0.3)))
+        else:
+            commands.append(line)
+        return line != "q"
+
+    runtime = PerformanceRuntime(orchestrator, handle)
+
+    read_fd, write_fd = os.pipe()
+    original_stdin = sys.stdin
+    sys.stdin = os.fdopen(read_fd)
+
+    def feed():
+        for line in ["t", "ask", "answer", "slow", "f", "q"]:
+            time.sleep(0.2)
+            os.write(write_fd, (line + "\n").encode())
+
+    feeder = threading.Thread(target=feed)
+    feeder.start()
+    try:
+        start = time.time()
+        runtime.run()
+        elapsed = time.time() - start
+    finally:
+        feeder.join()
+        sys.stdin.close()
+        os.close(write_fd)
+        sys.stdin = original_stdin
+
+    assert commands == ["t", ("ask", "answer"), ("slow", None), "f", "q"], commands
+    assert orchestrator.fired, "scheduled oneshots should fire while idle"
+    late = max(delay for delay, _ in orchestrator.fired)
+    assert late < 0.05, f"oneshot fired {late * 1000:.1f} ms late"
+
+    # A 0.1s poll would update ~10x per second regardless of activity
+    polls = elapsed / 0.1
+    print(f"  ✅ {len(orchestrator.fired)} oneshots, worst lateness {late * 1000:.1f} ms")
+    print(f"  ✅ {orchestrator.updates} updates in {elapsed:.2f}s (a 0.1s poll would need ~{polls:.0f})")
+
+
+def test_burst_of_lines_is_not_stranded():
+    """Several commands arriving in one write are all handled without more input."""
+    orchestrator = FakeOrchestrator()
+    commands = []
+
+    async def handle(line):
+        commands.append(line)
+        return line != "q"
+
+    runtime = PerformanceRuntime(orchestrator, handle)
+    read_fd, write_fd = os.pipe()
+    original_stdin = sys.stdin
+    sys.stdin = os.fdopen(read_fd)
+    os.write(write_fd, b"t\nf\nb\nq\n")
+    try:
+        runtime.run()
+    finally:
+        sys.stdin.close()
+        os.close(write_fd)
+        sys.stdin = original_stdin
+
+    assert commands == ["t", "f", "b", "q"], commands
+
+
+class RecordingEngine:
+    """Audio engine stand-in that records which thread touched the mixer."""
+
+    def __init__(self):
+        self.calls = []
+
+    def play_sound(self, filepath, loop=False, volume=1.0, stereo_volume=None):
+        self.calls.append(("play", threading.current_thread()))
+        return 1
+
+    def stop_all_sounds(self):
+        self.calls.append(("stop", threading.current_thread()))
+
+    def release_sound(self, filepath):
+        pass
+
+
+def test_on_demand_scene_split():
+    """Preparing a generated scene leaves the mixer and the live scene alone; activating swaps them together."""
+    from generative_orchestrator import GenerativeOrchestrator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = RecordingEngine()
+        orchestrator = GenerativeOrchestrator(engine, crossfade_time=0)
+        orchestrator.audio_generator.cache_dir = tmp
+        orchestrator.scenes = {"camp": {"bed": {"prompt": "campfire"},
+                                        "oneshots": [{"prompt": "owl", "prob_per_sec": 1.0}]}}
+        orchestrator.set_generation_enabled(False)
+        orchestrator.play_scene("camp")
+        engine.calls.clear()
+
+        result = []
+        worker = threading.Thread(target=lambda: result.append(orchestrator.prepare_scene_on_demand("misty moor", 0.5)))
+        worker.start()
+        worker.join()
+        assert result[0] and engine.calls == [] and orchestrator.current_scene == "camp"
+
+        assert orchestrator.activate_generated_scene(result[0])
+        assert [name for name, _ in engine.calls] == ["stop", "play"]
+        assert orchestrator.active_scene.oneshots == [] and orchestrator.scheduler.due_indices(time.time() + 60) == []
+        orchestrator.update()
+        assert not orchestrator.activate_generated_scene(None)
+
+
+if __name__ == "__main__":
+    test_performance_runtime()
+    test_burst_of_lines_is_not_stranded()
+    test_on_demand_scene_split()
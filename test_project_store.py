@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import tempfile
+
+sys.path.append('src')
+from project_store import ProjectStore
+
+
+def test_projects_persist():
+    """Projects and their finished sounds survive reopening the database."""
+    print("🗄️ TESTING PROJECT STORE")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "projects.db")
+        sound = os.path.join(tmp, "fire.wav")
+        open(sound, "wb").close()
+
+        store = ProjectStore(db_path)
+        assert store.create_project("Curse of Strahd", "gothic horror")
+        assert not store.create_project("Curse of Strahd")
+        job_id = store.start_job("Curse of Strahd", "campaign", "Barovia",
+                                 [("crackling fire", 3.0, "effects")])
+        assert store.run_job(job_id, lambda item: sound) == {"total": 1, "done": 1, "failed": 0}
+        store.close()
+
+        store = ProjectStore(db_path)
+        assert [p["name"] for p in store.list_projects()] == ["Curse of Strahd"]
+        project = store.get_project("Curse of Strahd")
+        assert project["description"] == "gothic horror"
+        assert project["sounds"] == {"crackling fire": sound}
+        assert project["campaigns"] == {"Barovia": {"effects": [sound]}}
+        assert store.find_sound("crackling fire", 3.0) == sound
+        assert store.find_sound("crackling fire", 5.0) is None
+        store.close()
+
+
+def test_interrupted_job_resumes_without_redundant_work():
+    """A job killed midway renders only its missing items after a restart."""
+    from cpu_audio_generator import NumpyAudioGenerator
+
+    prompts = ["tavern ambience", "crackling fire", "howling wind", "footsteps on stone", "magic spell"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "projects.db")
+        generator = NumpyAudioGenerator(cache_dir=tmp)
+        rendered = []
+
+        def render(item):
+            rendered.append(item["prompt"])
+            return generator.generate_sound(item["prompt"], item["duration"])
+
+        def interrupt_after_three(item, path, progress):
+            if progress["done"] == 3:
+                raise KeyboardInterrupt
+
+        store = ProjectStore(db_path)
+        job_id = store.start_job(None, "batch", "session prep", [(p, 0.5) for p in prompts])
+        try:
+            store.run_job(job_id, render, interrupt_after_three)
+        except KeyboardInterrupt:
+            pass
+        store.close()
+
+        store = ProjectStore(db_path)
+        unfinished = store.unfinished_jobs()
+        assert [(job["id"], job["done"], job["total"]) for job in unfinished] == [(job_id, 3, 5)]
+        assert store.start_job(None, "batch", "session prep", [(p, 0.5) for p in prompts]) == job_id
+
+        # Only the two unfinished items render again
+        rendered.clear()
+        assert store.run_job(job_id, render)["done"] == 5
+        assert rendered == prompts[3:]
+        assert store.unfinished_jobs() == []
+
+        # Deleting a rendered file makes exactly that item pending again
+        os.remove(store.job_items(job_id)[1]["path"])
+        assert [item["prompt"] for item in store.pending_items(job_id)] == ["crackling fire"]
+        store.close()
+
+
+def test_failed_items_stay_resumable():
+    """Failures are recorded and retried; the job stays open until every item is done."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ProjectStore(os.path.join(tmp, "projects.db"))
+        sound = os.path.join(tmp, "ok.wav")
+        open(sound, "wb").close()
+
+        job_id = store.start_job("p", "pack", "Dungeon", [("drip", 1.0), ("chains", 1.0)], output=tmp)
+        result = store.run_job(job_id, lambda item: sound if item["prompt"] == "drip" else None)
+        assert result == {"total": 2, "done": 1, "failed": 1}
+        assert store.job_items(job_id)[1]["error"] == "generation failed"
+        assert store.get_job(job_id)["status"] == "running"
+
+        assert store.run_job(job_id, lambda item: sound)["done"] == 2
+        assert store.get_job(job_id)["status"] == "done"
+        assert store.get_project("p") is None
+        store.close()
+
+
+if __name__ == "__main__":
+    test_projects_persist()
+    test_interrupted_job_resumes_without_redundant_work()
+    test_failed_items_stay_resumable()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.append('src')
+from cache_keys import canonical_prompt, quantize_duration
+from generative_orchestrator import GenerativeOrchestrator
+from oneshot_scheduler import OneshotScheduler
+from scene_compiler import CompiledScene, load_compiled_scenes, resolve_prompt, sidecar_path
+from spatializer import Spatializer
+
+
+class FakeAudioEngine:
+    """Records what the orchestrator asks to play."""
+
+    def __init__(self):
+        self.played = []
+
+    def play_sound(self, filepath, loop=False, volume=1.0, stereo_volume=None):
+        self.played.append((filepath, volume, stereo_volume))
+        return len(self.played)
+
+    def stop_all_sounds(self):
+        pass
+
+    def release_sound(self, filepath):
+        pass
+
+
+def _scenes(sounds_dir):
+    return {
+        "glade": {
+            "bed": {"file": os.path.join(sounds_dir, "glade_bed.wav"), "volume": 0.4},
+            "oneshots": [
+                {"file": os.path.join(sounds_dir, "owl_hoot.wav"), "prob_per_sec": 0.5,
+                 "volume_min": 0.2, "volume_max": 0.3, "pan": [-1, 1]},
+                {"file": os.path.join(sounds_dir, "twig_snap.wav"), "prob_per_sec": 0.25},
+                {"prompt": "distant wolf howl", "duration": 4.1}
+            ]
+        }
+    }
+
+
+def _write_scenes(tmp):
+    sounds_dir = os.path.join(tmp, "sounds")
+    os.makedirs(sounds_dir)
+    for name in ["glade_bed.wav", "owl_hoot.wav"]:
+        shutil.copy("assets/sounds/owl_hoot.wav", os.path.join(sounds_dir, name))
+    path = os.path.join(tmp, "scenes.json")
+    with open(path, "w") as f:
+        json.dump(_scenes(sounds_dir), f)
+    return path, sounds_dir
+
+
+def test_compiled_scene_matches_resolution():
+    """Files, prompts, pool keys and rate/volume/placement tables are resolved once at compile time."""
+    print("🧱 TESTING SCENE COMPILER")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path, sounds_dir = _write_scenes(tmp)
+        data = _scenes(sounds_dir)["glade"]
+        scene = CompiledScene("glade", data)
+
+        assert scene.bed.file == data["bed"]["file"] and scene.bed_volume == 0.4
+        owl, twig, wolf = scene.oneshots
+        assert owl.file == data["oneshots"][0]["file"] and owl.spatial
+        assert twig.file is None and twig.prompt == resolve_prompt(data["oneshots"][1], "glade oneshot")
+        assert twig.prompt == "glade oneshot twig snap" and not twig.spatial
+        assert wolf.prompt == "glade oneshot distant wolf howl"
+        assert (wolf.pool_prompt, wolf.pool_duration) == (canonical_prompt(wolf.prompt), quantize_duration(4.1))
+
+        assert scene.rates.tolist() == [0.5, 0.25, 0.0]
+        assert np.allclose(scene.volume_min, [0.2, 0.5, 0.5])
+        assert np.allclose(scene.volume_min + scene.volume_span, [0.3, 1.0, 1.0])
+        assert np.array_equal(scene.placement, [[-1, 1, np.nan, np.nan]] + [[np.nan] * 4] * 2, equal_nan=True)
+
+        # Drawing from the compiled bounds matches drawing from the config, draw for draw
+        spatializer = Spatializer()
+        for config in [{"pan": [-1, 1], "distance": [2.0, 5.0]}, {"pan": -0.7, "distance": [3.0, 8.0]},
+                       {"pan": [0.5, 0.5]}, {"distance": 6.0}, {}]:
+            by_config, by_table = random.Random(9), random.Random(9)
+            compiled = CompiledScene("glade", {"oneshots": [config]}).placement[0]
+            for _ in range(5):
+                assert spatializer.position(config, by_config) == spatializer.draw_position(compiled, by_table)
+            assert by_config.random() == by_table.random()
+
+
+def test_sidecar_reload_and_invalidation():
+    """Reloads come from the sidecar until the JSON or a referenced directory changes."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path, sounds_dir = _write_scenes(tmp)
+
+        start = time.perf_counter()
+        scenes, compiled, from_sidecar = load_compiled_scenes(path)
+        compile_time = time.perf_counter() - start
+        assert not from_sidecar and os.path.exists(sidecar_path(path))
+
+        start = time.perf_counter()
+        scenes_again, compiled_again, from_sidecar = load_compiled_scenes(path)
+        reload_time = time.perf_counter() - start
+        print(f"📊 compile {compile_time * 1e3:.2f}ms, reload from sidecar {reload_time * 1e3:.2f}ms")
+        assert from_sidecar and scenes_again == scenes
+        assert [o.prompt for o in compiled_again["glade"].oneshots] == [o.prompt for o in compiled["glade"].oneshots]
+        assert compiled_again["glade"].oneshots[0].config is scenes_again["glade"]["oneshots"][0]
+        assert np.array_equal(compiled_again["glade"].placement, compiled["glade"].placement, equal_nan=True)
+
+        # A newly added asset is picked up instead of generating
+        shutil.copy("assets/sounds/twig_snap.wav", os.path.join(sounds_dir, "twig_snap.wav"))
+        os.utime(sounds_dir, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+        _, compiled, from_sidecar = load_compiled_scenes(path)
+        assert not from_sidecar and compiled["glade"].oneshots[1].file.endswith("twig_snap.wav")
+
+        # Editing the JSON recompiles
+        data = json.load(open(path))
+        data["glade"]["oneshots"][1]["prob_per_sec"] = 2.0
+        with open(path, "w") as f:
+            json.dump(data, f)
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 2 * 10 ** 9))
+        _, compiled, from_sidecar = load_compiled_scenes(path)
+        assert not from_sidecar and compiled["glade"].rates[1] == 2.0
+        assert load_compiled_scenes(path)[2]
+
+
+def test_array_scheduler_matches_dict_scheduler():
+    """Index-based live ticks fire the same oneshots at the same times as the config-based API."""
+    configs = [{"prob_per_sec": rate} for rate in [3.0, 0.5, 0.0, 8.0]]
+    by_config, by_index = OneshotScheduler(random.Random(5)), OneshotScheduler(random.Random(5))
+    by_config.reset(configs, 0.0)
+    by_index.reset(range(4), 0.0, np.array([3.0, 0.5, 0.0, 8.0]))
+
+    for step in range(1, 200):
+        now = step * 0.05
+        expected = [configs.index(config) for _, config in by_config.due(now)]
+        assert by_index.due_indices(now) == expected
+    assert by_config.next_due_time() == by_index.next_due_time()
+
+
+def test_orchestrator_ticks_from_compiled_tables():
+    """Live ticks play compiled files at volumes inside each range, with placement where configured."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path, _ = _write_scenes(tmp)
+        engine = FakeAudioEngine()
+        orchestrator = GenerativeOrchestrator(engine, crossfade_time=0)
+        orchestrator.set_generation_enabled(False)
+        assert orchestrator.load_scenes_from_file(path)
+        assert orchestrator.play_scene("glade")
+        assert engine.played[0][1] == 0.4
+
+        for _ in range(50):
+            orchestrator.scheduler.due_times[:] = orchestrator.scheduler.next_due = 0.0
+            orchestrator.update()
+        owl_plays = [play for play in engine.played[1:] if play[0].endswith("owl_hoot.wav")]
+        assert len(owl_plays) == 50 and len(engine.played) == 51
+        assert all(0.2 <= volume <= 0.3 and stereo is not None for _, volume, stereo in owl_plays)
+
+        orchestrator.add_dynamic_oneshot("crackling fire", probability=0.5)
+        scene = orchestrator.active_scene
+        assert len(scene.oneshots) == 4 and scene.rates[-1] == 0.5
+        assert orchestrator.scheduler.rates.tolist() == scene.rates.tolist()
+
+        start = time.perf_counter()
+        for _ in range(10000):
+            orchestrator.update()
+        print(f"📊 idle tick: {(time.perf_counter() - start) / 10000 * 1e6:.1f}µs")
+
+
+if __name__ == "__main__":
+    test_compiled_scene_matches_resolution()
+    test_sidecar_reload_and_invalidation()
+    test_array_scheduler_matches_dict_scheduler()
+    test_orchestrator_ticks_from_compiled_tables()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append('src')
+from generative_orchestrator import GenerativeOrchestrator
+from scene_transition import SceneTransition, SceneTransitionEngine
+
+
+class FakeChannel:
+    def __init__(self):
+        self.sound = None
+        self.volume = 1.0
+
+    def get_sound(self):
+        return self.sound
+
+
+class FakeEngine:
+    """
+    Mixer stand-in with a fixed number of channels. Like find_channel(True),
+    playing with every channel busy steals the channel that started first.
+    """
+
+    def __init__(self, channels=4):
+        self.channels = [FakeChannel() for _ in range(channels)]
+        self.started = []
+        self.loaded = set()
+        self.released = []
+
+    def load_sound(self, filepath):
+        self.loaded.add(filepath)
+        return filepath
+
+    def play_sound(self, filepath, loop=False, volume=1.0, stereo_volume=None):
+        self.load_sound(filepath)
+        idle = [channel for channel in self.channels if channel.sound is None]
+        channel = idle[0] if idle else self.started.pop(0)
+        channel.sound = object()
+        channel.volume = volume
+        self.started.append(channel)
+        return channel
+
+    def channel_sound(self, channel):
+        return channel.get_sound() if channel is not None else None
+
+    def set_channel_volume(self, channel, volume):
+        channel.volume = volume
+
+    def stop_channel(self, channel):
+        channel.sound = None
+        if channel in self.started:
+            self.started.remove(channel)
+
+    def stop_all_sounds(self):
+        for channel in list(self.started):
+            self.stop_channel(channel)
+
+    def release_sound(self, filepath):
+        self.loaded.discard(filepath)
+        self.released.append(filepath)
+
+
+def _start(engine, resolve_bed, old_files, crossfade_time=2.0, old_bed="old_bed.wav"):
+    transitions = SceneTransitionEngine(engine, crossfade_time)
+    old_channel = engine.play_sound(old_bed, loop=True)
+    transition = transitions.start("new", resolve_bed, 0.8, old_channel, old_files)
+    assert transition.ready.wait(5)
+    return transitions, transition, old_channel
+
+
+def test_loader_failure_keeps_old_scene():
+    """A bed that can't be resolved fails the transition without touching the old scene."""
+    print("🎬 TESTING SCENE TRANSITIONS")
+    print("=" * 50)
+
+    def broken():
+        raise RuntimeError("generator crashed")
+
+    for resolve_bed in [broken, lambda: None]:
+        engine = FakeEngine()
+        transitions, transition, old_channel = _start(engine, resolve_bed, {"old_bed.wav"})
+        assert transitions.update(now=0.0) is None
+        assert transition.state == SceneTransition.FAILED and not transitions.active
+        assert old_channel.sound is not None and old_channel.volume == 1.0
+        assert engine.released == []
+
+
+def test_files_released_only_after_fade():
+    """The old scene's files, including oneshots played while loading, are freed when the fade completes."""
+    engine = FakeEngine()
+    old_files = {"old_bed.wav", "owl.wav"}
+    transitions, transition, old_channel = _start(engine, lambda: "new_bed.wav", old_files)
+
+    # Oneshots of the old scene keep playing (and being recorded) while the new bed loads
+    old_files.add("late_oneshot.wav")
+    started = transitions.update(now=10.0)
+    assert started is transition and started.new_files == {"new_bed.wav"}
+
+    # The new scene shares a file with the old one while the beds crossfade
+    started.new_files.add("owl.wav")
+    transitions.update(now=11.0)
+    assert engine.released == [] and 0.0 < old_channel.volume < 1.0
+
+    transitions.update(now=12.0)
+    assert transition.state == SceneTransition.DONE and old_channel.sound is None
+    assert sorted(engine.released) == ["late_oneshot.wav", "old_bed.wav"]
+    assert transition.new_channel.volume == 1.0
+
+
+def test_cancel_mid_fade():
+    """Cancelling mid-fade drops the old scene and stops driving the gains."""
+    engine = FakeEngine()
+    transitions, transition, old_channel = _start(engine, lambda: "new_bed.wav", {"old_bed.wav", "owl.wav"})
+    transitions.update(now=10.0)
+    transitions.update(now=11.0)
+    new_volume = transition.new_channel.volume
+
+    transitions.cancel()
+    assert transition.state == SceneTransition.CANCELLED and transitions.current is None
+    assert old_channel.sound is None and sorted(engine.released) == ["old_bed.wav", "owl.wav"]
+    assert transitions.update(now=20.0) is None and transition.new_channel.volume == new_volume
+
+
+def test_stolen_old_channel_is_left_alone():
+    """Once find_channel(True) hands the old bed's channel to a oneshot, the fade stops driving it."""
+    engine = FakeEngine(channels=2)
+    transitions, transition, old_channel = _start(engine, lambda: "new_bed.wav", {"old_bed.wav"})
+    transitions.update(now=10.0)
+
+    # Both channels busy: the next oneshot steals the longest-playing one, the old bed
+    stolen = engine.play_sound("thunder.wav", volume=0.9)
+    assert stolen is old_channel
+
+    transitions.update(now=11.5)
+    assert old_channel.volume == 0.9
+    transitions.update(now=12.0)
+    assert transition.state == SceneTransition.DONE and old_channel.sound is not None
+
+
+def test_orchestrator_releases_oneshots_played_while_loading():
+    """Oneshots fired during a transition's loading phase are released after the fade, not leaked."""
+    with tempfile.TemporaryDirectory() as tmp:
+        scenes = {
+            "glade": {"bed": {"file": "assets/sounds/crowded_medieval_streets.wav"},
+                      "oneshots": [{"file": "assets/sounds/owl_hoot.wav", "prob_per_sec": 1.0}]},
+            "inn": {"bed": {"file": "assets/sounds/clinking_mugs.wav"}, "oneshots": []}
+        }
+        path = os.path.join(tmp, "scenes.json")
+        with open(path, "w") as f:
+            json.dump(scenes, f)
+
+        engine = FakeEngine()
+        orchestrator = GenerativeOrchestrator(engine, crossfade_time=0.01)
+        orchestrator.set_generation_enabled(False)
+        assert orchestrator.load_scenes_from_file(path) and orchestrator.play_scene("glade")
+
+        orchestrator.play_scene("inn")
+        orchestrator.transitions.current.ready.wait(5)
+        orchestrator.transitions.current.ready.clear()
+        orchestrator.scheduler.due_times[:] = orchestrator.scheduler.next_due = 0.0
+        orchestrator.update()
+        orchestrator.transitions.current.ready.set()
+
+        while orchestrator.transitions.active:
+            orchestrator.update()
+        assert orchestrator.current_scene == "inn"
+        assert sorted(os.path.basename(p) for p in engine.released) == ["crowded_medieval_streets.wav",
+                                                                        "owl_hoot.wav"]
+        assert orchestrator.scene_files == {"assets/sounds/clinking_mugs.wav"}
+
+
+def test_reused_channels_play_at_full_volume():
+    """After a crossfade (or a cancelled one), the mixer channels it drove come back at full gain."""
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from audio_engine import AudioEngine
+    engine = AudioEngine(num_channels=2)
+    old_bed, new_bed, oneshot = ("assets/sounds/crowded_medieval_streets.wav", "assets/sounds/clinking_mugs.wav",
+                                 "assets/sounds/owl_hoot.wav")
+    try:
+        transitions, transition, old_channel = _start(engine, lambda: new_bed, {old_bed}, old_bed=old_bed)
+        transitions.update(now=10.0)
+        transitions.update(now=11.5)
+        transitions.update(now=12.0)
+        assert transition.state == SceneTransition.DONE
+
+        # Both channels idle but the new bed's: the oneshot lands on the old bed's channel
+        channel = engine.play_sound(oneshot, volume=0.5)
+        assert channel.get_volume() == 1.0
+
+        # Cancelled mid-fade, the new bed's channel is left at sin(progress) until reused
+        engine.stop_all_sounds()
+        transitions, transition, _ = _start(engine, lambda: new_bed, set(), old_bed=old_bed)
+        transitions.update(now=10.0)
+        transitions.update(now=10.5)
+        transitions.cancel()
+        engine.stop_all_sounds()
+        assert engine.play_sound(oneshot).get_volume() == engine.play_sound(oneshot).get_volume() == 1.0
+    finally:
+        engine.stop_all_sounds()
+
+
+if __name__ == "__main__":
+    test_loader_failure_keeps_old_scene()
+    test_files_released_only_after_fade()
+    test_cancel_mid_fade()
+    test_stolen_old_channel_is_left_alone()
+    test_orchestrator_releases_oneshots_played_while_loading()
+    test_reused_channels_play_at_full_volume()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import soundfile as sf
+
+sys.path.append('src')
+from sound_pack import SoundPack, open_pack, pack_directory, read_sound, sound_exists, write_pack
+
+
+def _make_members(directory, count):
+    rng = np.random.default_rng(0)
+    members = []
+    for i in range(count):
+        channels = 1 if i % 3 else 2
+        audio = rng.uniform(-0.5, 0.5, (2205 + 441 * (i % 7), channels))
+        path = os.path.join(directory, f"{i:02d}_sound_{i}.wav")
+        sf.write(path, audio, 44100)
+        members.append({"name": f"{i:02d}_sound_{i}", "prompt": f"sound {i}", "file": path})
+    return members
+
+
+def test_round_trip_and_lazy_open():
+    """Members read back bit-exact in both formats; opening 100 members is one header read."""
+    print("📦 TESTING SOUND PACK CONTAINER")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        members = _make_members(tmp, 100)
+
+        for fmt in ["pcm16", "flac"]:
+            path = write_pack(os.path.join(tmp, f"test_{fmt}.bfpack"), "Test", members, fmt=fmt)
+
+            start = time.perf_counter()
+            pack = SoundPack(path)
+            open_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for member in members:
+                sf.info(member["file"])
+            loose_time = time.perf_counter() - start
+            print(f"📊 {fmt}: {os.path.getsize(path) / 1e6:.2f} MB, open {open_time * 1e3:.2f}ms "
+                  f"(100 loose file opens {loose_time * 1e3:.2f}ms)")
+
+            assert pack.name == "Test" and len(pack) == 100
+            for member in members[:10]:
+                expected, rate = sf.read(member["file"], dtype="int16", always_2d=True)
+                frames, pack_rate = pack.read_pcm16(member["name"])
+                assert pack_rate == rate and np.array_equal(frames, expected)
+                assert pack.members[member["name"]]["prompt"] == member["prompt"]
+            pack.close()
+
+
+def test_loudness_index():
+    """Each member's RMS, loudness and true peak are stored in the index at pack time."""
+    with tempfile.TemporaryDirectory() as tmp:
+        sine = os.path.join(tmp, "sine.wav")
+        sf.write(sine, 0.5 * np.sin(2 * np.pi * 440 * np.arange(44100) / 44100), 44100)
+        pack = SoundPack(write_pack(os.path.join(tmp, "l.bfpack"), "L", [{"name": "sine", "file": sine}]))
+        loudness = pack.members["sine"]["loudness"]
+        assert abs(loudness["true_peak_db"] - (-6.02)) < 0.05
+        assert abs(loudness["rms_db"] - (-9.03)) < 0.05
+        assert abs(loudness["lufs"] - (-9.76)) < 0.2
+        pack.close()
+
+
+def test_member_paths_and_playback_loading():
+    """Pack members are addressable as paths by the orchestrators, renderer and AudioEngine."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pack_directory("sound_packs/Dungeon", os.path.join(tmp, "Dungeon.bfpack"))
+        pack = open_pack(path)
+        assert open_pack(path) is pack
+        assert pack.names()[0] == "00_dark_dungeon_ambient_echoes"
+        assert pack.members["03_distant_dungeon_rumbling"]["prompt"] == "distant dungeon rumbling"
+
+        member = pack.member_path("01_water_droplets_echoing")
+        assert sound_exists(member)
+        assert not sound_exists(pack.member_path("99_missing"))
+        assert not sound_exists(os.path.join(tmp, "missing.bfpack#00_x"))
+
+        audio, rate = read_sound(member)
+        expected, expected_rate = sf.read("sound_packs/Dungeon/01_water_droplets_echoing.wav",
+                                          dtype="float32", always_2d=True)
+        assert rate == expected_rate and np.allclose(audio, expected, atol=1 / 32768)
+
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        from audio_engine import AudioEngine
+        engine = AudioEngine()
+        sound = engine.load_sound(member)
+        assert sound is not None
+        assert abs(sound.get_length() - len(expected) / expected_rate) < 0.01
+        assert engine.load_sound(pack.member_path("99_missing")) is None
+        engine.quit()
+
+
+def test_write_streams_payloads():
+    """Writing a pack holds one member in memory at a time: peak memory doesn't grow with the member count."""
+    import tracemalloc
+
+    with tempfile.TemporaryDirectory() as tmp:
+        audio = np.random.default_rng(1).uniform(-0.5, 0.5, (44100 * 2, 2))
+        members = []
+        for i in range(32):
+            path = os.path.join(tmp, f"{i:02d}_bed.wav")
+            sf.write(path, audio, 44100, subtype="PCM_16")
+            members.append({"name": f"{i:02d}_bed", "file": path})
+
+        peaks = {}
+        for count in [4, 32]:
+            tracemalloc.start()
+            write_pack(os.path.join(tmp, f"beds_{count}.bfpack"), "Beds", members[:count])
+            peaks[count] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        pack = SoundPack(os.path.join(tmp, "beds_32.bfpack"))
+        payload_bytes = sum(member["length"] for member in pack.members.values())
+        print(f"📊 peak {peaks[4] / 1e6:.1f} MB for 4 members, {peaks[32] / 1e6:.1f} MB for 32 "
+              f"({payload_bytes / 1e6:.1f} MB of payloads)")
+        assert peaks[32] < peaks[4] * 1.5
+        assert not [name for name in os.listdir(tmp) if name.endswith(".tmp")]
+        pack.close()
+
+
+if __name__ == "__main__":
+    test_round_trip_and_lazy_open()
+    test_write_streams_payloads()
+    test_loudness_index()
+    test_member_paths_and_playback_loading()
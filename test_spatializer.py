@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import tempfile
+sys.path.append('src')
+
+import numpy as np
+import soundfile as sf
+from spatializer import Spatializer
+from offline_renderer import OfflineSceneRenderer
+
+
+def test_spatializer():
+    """Constant-power pan, far-ear delay and distance attenuation."""
+    print("🎧 TESTING SPATIALIZER")
+    print("=" * 50)
+
+    spatializer = Spatializer()
+    for pan in np.linspace(-1, 1, 9):
+        left, right = spatializer.gains(pan)
+        assert abs(left ** 2 + right ** 2 - 1.0) < 1e-9
+    assert spatializer.gains(-1.0)[1] < 1e-9 and spatializer.gains(1.0)[0] < 1e-9
+
+    assert spatializer.attenuation(0.5) == 1.0
+    assert abs(spatializer.attenuation(4.0) - 0.25) < 1e-9
+
+    # A source on the right reaches the left ear later
+    click = np.zeros(100, dtype=np.float32)
+    click[0] = 1.0
+    placed = spatializer.place(click, pan=1.0)
+    delay = spatializer.delay_samples(1.0)
+    assert delay == round(0.00066 * 44100) and placed.shape == (100 + delay, 2)
+    assert np.argmax(placed[:, 1]) == 0 and placed[:, 0].max() < 1e-9
+    placed = spatializer.place(click, pan=0.5, distance=2.0)
+    assert np.argmax(placed[:, 1]) == 0 and np.argmax(placed[:, 0]) == spatializer.delay_samples(0.5)
+    assert abs(placed.sum() - sum(spatializer.gains(0.5, 2.0))) < 1e-6
+
+    # Ranges are drawn per trigger and clamped
+    pan, distance = spatializer.position({"pan": [-3.0, -2.0], "distance": [2.0, 3.0]})
+    assert pan == -1.0 and 2.0 <= distance <= 3.0
+    print("  ✅ Pan, delay and distance")
+
+
+def test_offline_placement():
+    """A hard-left oneshot renders into the left channel only, from a mono file."""
+    renderer = OfflineSceneRenderer(block_seconds=2.0)
+    renderer.orchestrator.set_generation_enabled(False)
+    renderer.orchestrator.scenes = {
+        "placed": {"oneshots": [{"file": "assets/sounds/owl_hoot.wav", "prob_per_sec": 1.0, "pan": -1.0, "distance": 2.0}]}
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "placed.wav")
+        stats = renderer.render("placed", 10.0, path, seed=3)
+        audio, _ = sf.read(path)
+
+    assert stats["oneshots_triggered"] > 0
+    assert np.abs(audio[:, 0]).max() > 0 and np.abs(audio[:, 1]).max() == 0
+    assert renderer._load_audio("assets/sounds/owl_hoot.wav").shape[1] == sf.info("assets/sounds/owl_hoot.wav").channels
+    print("  ✅ Offline render places oneshots without stereo copies")
+
+
+def test_malformed_placement():
+    """Bad pan/distance values are dropped at load and never raise when a oneshot fires."""
+    from generative_orchestrator import GenerativeOrchestrator
+
+    spatializer = Spatializer()
+    for bad in [[0.5], "left", [1, 2, 3], [0.8, -0.8], None, True, ["a", "b"], float("nan")]:
+        assert Spatializer.parse_range(bad) is None
+        assert spatializer.position({"pan": bad, "distance": bad}) == (0.0, spatializer.ref_distance)
+    assert Spatializer.parse_range(2) == (2.0, 2.0) and Spatializer.parse_range([-1, 0.5]) == (-1.0, 0.5)
+
+    scenes = {"camp": {"oneshots": [{"file": "x.wav", "pan": [0.5], "distance": "far"},
+                                    {"file": "y.wav", "pan": [0.8, -0.8]},
+                                    {"file": "z.wav", "pan": [-0.5, 0.5], "distance": 3}]}}
+    orchestrator = GenerativeOrchestrator(audio_engine=None)
+    assert not orchestrator._validate_scenes(scenes)
+    first, second, third = scenes["camp"]["oneshots"]
+    assert "pan" not in first and "distance" not in first and "pan" not in second
+    assert third["pan"] == [-0.5, 0.5] and third["distance"] == 3
+    print("  ✅ Malformed placement ignored")
+
+
+def test_unplaced_sound_clears_reused_panning():
+    """A channel a placed oneshot panned plays the next unplaced sound centered again."""
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    from audio_engine import AudioEngine
+
+    engine = AudioEngine(num_channels=1)
+    calls = []
+    find_channel = pygame.mixer.find_channel
+
+    class RecordingChannel:
+        """Records set_volume arguments; pygame can't read panning back."""
+
+        def __init__(self, channel):
+            self.channel = channel
+
+        def set_volume(self, *gains):
+            calls.append(gains)
+            self.channel.set_volume(*gains)
+
+        def __getattr__(self, name):
+            return getattr(self.channel, name)
+
+    pygame.mixer.find_channel = lambda force=False: RecordingChannel(find_channel(force))
+    try:
+        engine.play_sound("assets/sounds/owl_hoot.wav", stereo_volume=(0.2, 0.9))
+        # Only one channel: the bed takes over the panned one
+        engine.play_sound("assets/sounds/clinking_mugs.wav", loop=True)
+        assert calls == [(0.2, 0.9), (1.0,)]
+    finally:
+        pygame.mixer.find_channel = find_channel
+        engine.stop_all_sounds()
+    print("  ✅ Reused channels lose the previous placement")
+
+
+if __name__ == "__main__":
+    test_spatializer()
+    test_offline_placement()
+    test_malformed_placement()
+    test_unplaced_sound_clears_reused_panning()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+import io
+import json
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+sys.path.append('src')
+from structured_logging import configure_logging, get_logger, shutdown_logging
+
+
+def test_jsonl_events_and_quiet_console():
+    """Generation events land in the JSONL file with their fields while the console stays silent."""
+    print("📜 TESTING STRUCTURED LOGGING")
+    print("=" * 50)
+
+    from cpu_audio_generator import NumpyAudioGenerator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "events.jsonl")
+        generator = NumpyAudioGenerator(cache_dir=tmp)
+
+        console = io.StringIO()
+        with redirect_stdout(console):
+            configure_logging(jsonl_path=log_path)
+            generator.generate_variants("crackling fire", 0.5, variants=2)
+            generator.generate_variants("crackling fire", 0.5, variants=2)
+            shutdown_logging()
+
+        with open(log_path) as f:
+            events = [json.loads(line) for line in f]
+
+    print(f"📊 {len(events)} events, console output: {console.getvalue()!r}")
+    assert console.getvalue() == ""
+
+    finished = [e for e in events if "cache_hit" in e]
+    assert [e["cache_hit"] for e in finished] == [False, True]
+    for event in finished:
+        assert event["prompt"] == "crackling fire"
+        assert event["engine"] == "numpy" and event["sound_type"] == "fire"
+        assert event["latency"] >= 0
+    assert finished[0]["level"] == "INFO" and finished[1]["level"] == "DEBUG"
+    assert finished[1]["logger"] == "bardsforge.cpu_audio_generator"
+
+
+def test_console_level_and_exceptions():
+    """Console shows only records at its level; exceptions survive the queue into JSONL."""
+    logger = get_logger("test")
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "events.jsonl")
+        console = io.StringIO()
+        with redirect_stdout(console):
+            configure_logging(level="INFO", jsonl_path=log_path, jsonl_level="WARNING")
+            logger.debug("hidden everywhere")
+            logger.info("🎵 shown on console", extra={"prompt": "wind"})
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.exception("render failed", extra={"engine": "torch"})
+            shutdown_logging()
+
+        with open(log_path) as f:
+            events = [json.loads(line) for line in f]
+
+    assert console.getvalue().splitlines()[0] == "🎵 shown on console"
+    assert "hidden" not in console.getvalue()
+    assert len(events) == 1
+    assert events[0]["engine"] == "torch" and "ValueError: boom" in events[0]["exc"]
+
+
+if __name__ == "__main__":
+    test_jsonl_events_and_quiet_console()
+    test_console_level_and_exceptions()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+import sys
+import tempfile
+import warnings
+
+# Suppress CUDA compatibility warnings
+warnings.filterwarnings("ignore", category=UserWarning, message=".*CUDA capability sm_120.*")
+
+sys.path.append('src')
+import torch
+from gpu_audio_generator import RTX5090AudioGenerator
+from metrics import metrics
+from tensor_pool import TensorBufferPool
+
+
+def test_pool_buckets_and_leases():
+    """Lengths inside one bucket share a buffer once it has been released."""
+    pool = TensorBufferPool(bucket_samples=1000)
+    assert pool.bucket(1) == pool.bucket(1000) == 1000
+    assert pool.bucket(1001) == 2000
+
+    with pool.lease():
+        first = pool.take(2, 900)
+        assert first.shape == (2, 900)
+        # Still leased: a second take gets its own buffer
+        second = pool.take(2, 950)
+        assert second.data_ptr() != first.data_ptr()
+
+    with pool.lease():
+        again = pool.take(2, 700, zero=True)
+        assert again.data_ptr() in (first.data_ptr(), second.data_ptr())
+        assert torch.count_nonzero(again) == 0
+
+    stats = pool.stats()
+    assert stats["misses"] == 2 and stats["hits"] == 1
+    assert stats["buffers"] == 2
+
+    # Constants are built once
+    ramp = pool.ramp(64, rising=False)
+    assert pool.ramp(64, rising=False) is ramp
+    assert ramp[0] == 1 and ramp[-1] == 0
+
+
+def test_byte_cap_trims_least_recent_shapes():
+    """Over the byte cap, free buffers of the least recently used shapes go first; leased ones never do."""
+    metrics.reset()
+    # A (1, 1000) float32 buffer is 4000 bytes; the cap holds 12000
+    pool = TensorBufferPool(bucket_samples=1000, max_buffer_mb=12000 / (1024 * 1024))
+
+    for samples in [2000, 1000, 1000]:
+        with pool.lease():
+            pool.take(1, samples)
+    assert pool.buffer_bytes == 12000 and pool.stats()["trimmed"] == 0
+
+    # A new shape pushes the pool over: the stale (1, 2000) buffer goes, the recent (1, 1000) stays
+    with pool.lease():
+        pool.take(2, 500)
+        assert pool.stats()["trimmed"] == 1 and list(pool._free) == [(1, 1000, torch.float32)]
+        pool.take(1, 1000)
+    assert pool.buffer_bytes == 12000 and pool.stats()["buffers"] == 2
+
+    # Leased buffers are never trimmed, even past the cap; the excess goes once they are released
+    with pool.lease():
+        pool.take(1, 3000)
+        pool.take(1, 3000)
+        assert pool.buffer_bytes == 24000 and not pool._free
+    assert pool.buffer_bytes == 12000 and pool.stats()["trimmed"] == 4
+
+    assert metrics.counter("tensor_pool_misses_total", kind="buffer") == pool.misses == 5
+    assert metrics.counter("tensor_pool_hits_total", kind="buffer") == pool.hits == 2
+    assert (metrics.counter("tensor_pool_allocated_bytes_total")
+            - metrics.counter("tensor_pool_trimmed_bytes_total")) == pool.buffer_bytes
+    assert 'bardsforge_tensor_pool_hits_total{kind="buffer"} 2' in metrics.prometheus()
+
+
+def test_generator_reuses_buffers():
+    """Varying durations in one bucket hit the pool, and returned clips are never pooled memory."""
+    print("♻️ TESTING TENSOR BUFFER POOL")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = RTX5090AudioGenerator(cache_dir=tmp)
+
+        durations = [2.0, 2.1, 2.2, 2.05]
+        first = generator._render("tavern", durations[0], [3, 4])
+        reference = first.clone()
+        for duration in durations[1:]:
+            audio = generator._render("tavern", duration, [3, 4])
+            assert audio.shape == (2, int(duration * generator.sample_rate))
+
+        # Later renders must not have written into an earlier result
+        assert torch.equal(first, reference)
+        assert torch.equal(generator._render("tavern", durations[0], [3, 4]), reference)
+
+        stats = generator.get_pool_stats()
+        print(f"📊 hits {stats['hits']}, misses {stats['misses']}, hit rate {stats['hit_rate']:.0%}, "
+              f"{stats['buffers']} buffers ({stats['buffer_mb']:.1f} MB)")
+        assert stats["hit_rate"] > 0.5
+
+
+if __name__ == "__main__":
+    test_pool_buckets_and_leases()
+    test_byte_cap_trims_least_recent_shapes()
+    test_generator_reuses_buffers()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.append('src')
+from generative_orchestrator import GenerativeOrchestrator
+from scene_compiler import CompiledSound
+from variant_pool import VariantPool, VariantPoolManager, accepts_seed
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "timed out waiting for the pool worker"
+        time.sleep(0.005)
+
+
+def _write(directory, name, size):
+    path = os.path.join(directory, name)
+    with open(path, "wb") as f:
+        f.write(b"\0" * size)
+    return path
+
+
+def test_pick_never_repeats():
+    """Picks are uniform over the other variants and never repeat the previous one."""
+    print("🎲 TESTING VARIANT POOLS")
+    print("=" * 50)
+
+    pool = VariantPool("owl", 1.0, 4)
+    assert pool.pick(random.Random(0)) is None
+    for index in range(4):
+        pool.variants.append((f"owl_{index}.wav", 1))
+
+    rng = random.Random(1)
+    picks = [pool.pick(rng) for _ in range(4000)]
+    assert all(a != b for a, b in zip(picks, picks[1:]))
+    counts = {path: picks.count(path) for path in set(picks)}
+    assert len(counts) == 4 and min(counts.values()) > 800
+
+    single = VariantPool("bell", 1.0, 1)
+    single.variants.append(("bell.wav", 1))
+    assert [single.pick(rng) for _ in range(3)] == ["bell.wav"] * 3
+
+
+def test_lru_eviction_under_cap():
+    """Over the byte cap, the least recently used pools give up variants first, never their last one."""
+    with tempfile.TemporaryDirectory() as tmp:
+        evicted = []
+        manager = VariantPoolManager(lambda prompt, duration, seed: None, pool_size=4,
+                                     max_pool_mb=3000 / (1024 * 1024), on_evict=evicted.append)
+        stale, fresh = VariantPool("stale", 1.0, 4), VariantPool("fresh", 1.0, 4)
+        stale.last_used, fresh.last_used = 1.0, 2.0
+        manager.pools = {"stale": stale, "fresh": fresh}
+        for index in range(3):
+            stale.add(_write(tmp, f"stale_{index}.wav", 500))
+            fresh.add(_write(tmp, f"fresh_{index}.wav", 500))
+
+        # 3000 bytes held; one more variant for the fresh pool is 500 over the cap
+        fresh.add(_write(tmp, "fresh_3.wav", 500))
+        with manager._lock:
+            assert manager._enforce_cap(keep=fresh)
+        assert [os.path.basename(path) for path in evicted] == ["stale_0.wav"]
+        assert len(fresh.variants) == 4 and stale.target == 2
+
+        # Far over the cap: everything but one variant per pool goes, the least recent pool first
+        manager.max_pool_bytes = 0
+        with manager._lock:
+            assert not manager._enforce_cap(keep=fresh)
+        assert len(stale.variants) == 1 and len(fresh.variants) == 1
+        assert [os.path.basename(path) for path in evicted] == ["stale_0.wav", "stale_1.wav", "fresh_0.wav",
+                                                                "fresh_1.wav", "fresh_2.wav"]
+
+
+def test_fill_thread_renders_distinct_seeds():
+    """The worker fills a primed pool to its target with seeds 0..n-1 while the live path keeps picking."""
+    rendered = []
+
+    def render(prompt, duration, seed):
+        time.sleep(0.002)
+        rendered.append(seed)
+        return f"{prompt}_{seed}.wav"
+
+    manager = VariantPoolManager(render, pool_size=6)
+    assert manager.pick("rain", 2.0) is None  # first lookup primes the pool
+
+    stop = threading.Event()
+    picks = []
+
+    def live():
+        while not stop.is_set():
+            picks.append(manager.pick("rain", 2.0))
+
+    picker = threading.Thread(target=live)
+    picker.start()
+    try:
+        _wait_for(lambda: manager.get_stats()["variants"] == 6)
+    finally:
+        stop.set()
+        picker.join()
+
+    pool = manager.pools[manager.pool_key("rain", 2.0)]
+    assert sorted(rendered) == list(range(6)) and pool.next_seed == 6
+    _wait_for(lambda: not pool.queued)
+    assert {path for path in picks if path} <= {f"rain_{seed}.wav" for seed in range(6)}
+
+    # A render failure stops the fill and leaves the pool ready to be queued again
+    failing = VariantPoolManager(lambda prompt, duration, seed: None, pool_size=3)
+    failing.prime("hail", 1.0)
+    failing_pool = failing.pools[failing.pool_key("hail", 1.0)]
+    _wait_for(lambda: not failing_pool.queued)
+    assert failing_pool.variants == [] and failing_pool.next_seed == 1
+
+
+def test_empty_pool_skips_trigger_instead_of_generating():
+    """The live tick never renders: an empty pool skips the trigger until the worker has filled it."""
+    with tempfile.TemporaryDirectory() as tmp:
+        orchestrator = GenerativeOrchestrator(audio_engine=None)
+        orchestrator.audio_generator.cache_dir = tmp
+        oneshot = CompiledSound({"prompt": "crackling fire", "duration": 1.0}, "camp oneshot")
+
+        live_renders = []
+        orchestrator._generate_file = lambda prompt, duration: live_renders.append(prompt)
+        assert orchestrator._get_oneshot_file(oneshot) is None and live_renders == []
+
+        pools = orchestrator.variant_pools
+        _wait_for(lambda: pools.get_stats()["variants"] == pools.pool_size, timeout=30)
+        assert orchestrator._get_oneshot_file(oneshot).startswith(tmp) and live_renders == []
+
+
+def test_seed_support_checked_up_front():
+    """Only a generator without seeds disables pools; a TypeError inside a render is just a failed render."""
+    def buggy(prompt, duration, seed):
+        raise TypeError("bug inside a kernel")
+
+    manager = VariantPoolManager(buggy, pool_size=3)
+    manager.prime("sleet", 1.0)
+    pool = manager.pools[manager.pool_key("sleet", 1.0)]
+    _wait_for(lambda: not pool.queued)
+    assert manager.enabled and pool.variants == [] and pool.next_seed == 1
+
+    assert not VariantPoolManager(lambda prompt, duration: None, pool_size=3).enabled
+    assert accepts_seed(lambda *args: None, "", 1.0, 0)
+
+    class SeedlessGenerator:
+        def generate_sound(self, prompt, duration=3.0):
+            return None
+
+        def get_cache_info(self):
+            return {}
+
+    orchestrator = GenerativeOrchestrator(audio_engine=None)
+    assert orchestrator.variant_pools.enabled
+    orchestrator.audio_generator = SeedlessGenerator()
+    assert not orchestrator.variant_pools.enabled
+
+
+if __name__ == "__main__":
+    test_pick_never_repeats()
+    test_lru_eviction_under_cap()
+    test_fill_thread_renders_distinct_seeds()
+    test_empty_pool_skips_trigger_instead_of_generating()
+    test_seed_support_checked_up_front()